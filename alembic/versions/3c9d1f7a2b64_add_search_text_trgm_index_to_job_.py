@@ -0,0 +1,46 @@
+"""add search_text generated column and trigram index to job_postings
+
+Revision ID: 3c9d1f7a2b64
+Revises: af280a57e942
+Create Date: 2025-05-12 04:21:37.512804
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d1f7a2b64'
+down_revision: Union[str, None] = 'af280a57e942'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('job_postings', sa.Column(
+        'search_text',
+        sa.Text(),
+        sa.Computed(
+            "coalesce(title, '') || ' ' || coalesce(summary, '') || ' ' || coalesce(description, '')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.create_index(
+        'ix_job_postings_search_text_trgm',
+        'job_postings',
+        ['search_text'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'search_text': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_postings_search_text_trgm', table_name='job_postings', postgresql_using='gin')
+    op.drop_column('job_postings', 'search_text')
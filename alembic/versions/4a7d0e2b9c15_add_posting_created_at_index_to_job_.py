@@ -0,0 +1,28 @@
+"""add job_posting_id, created_at index to job_applications
+
+Revision ID: 4a7d0e2b9c15
+Revises: e9f1b6c4d2a3
+Create Date: 2025-05-14 13:48:06.337921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a7d0e2b9c15'
+down_revision: Union[str, None] = 'e9f1b6c4d2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_job_applications_posting_created_at_id', 'job_applications', ['job_posting_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_applications_posting_created_at_id', table_name='job_applications')
@@ -0,0 +1,43 @@
+"""add application_count to job_postings
+
+Revision ID: 5b7e3a9c2d18
+Revises: 8e2a4c6d1f93
+Create Date: 2025-05-13 05:42:19.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e3a9c2d18'
+down_revision: Union[str, None] = '8e2a4c6d1f93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_postings', sa.Column('application_count', sa.Integer(), server_default='0', nullable=False))
+    # 기존 지원 내역으로 카운터 초기화
+    op.execute(
+        """
+        UPDATE job_postings AS jp
+        SET application_count = counts.app_count
+        FROM (
+            SELECT job_posting_id, count(*) AS app_count
+            FROM job_applications
+            GROUP BY job_posting_id
+        ) AS counts
+        WHERE counts.job_posting_id = jp.id
+        """
+    )
+    op.create_index('ix_job_postings_application_count', 'job_postings', ['application_count', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_postings_application_count', table_name='job_postings')
+    op.drop_column('job_postings', 'application_count')
@@ -0,0 +1,38 @@
+"""add geo_cell generated column and index to job_postings
+
+Revision ID: 6f1d9c3e8a57
+Revises: a7c2e5f04b31
+Create Date: 2025-05-14 01:36:48.902164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f1d9c3e8a57'
+down_revision: Union[str, None] = 'a7c2e5f04b31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_postings', sa.Column(
+        'geo_cell',
+        sa.BigInteger(),
+        sa.Computed(
+            "CAST(floor(latitude * 20) AS BIGINT) * 100000 + CAST(floor(longitude * 20) AS BIGINT)",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.create_index('ix_job_postings_geo_cell', 'job_postings', ['geo_cell'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_postings_geo_cell', table_name='job_postings')
+    op.drop_column('job_postings', 'geo_cell')
@@ -0,0 +1,30 @@
+"""add keyset pagination indexes to job_postings
+
+Revision ID: 8e2a4c6d1f93
+Revises: 3c9d1f7a2b64
+Create Date: 2025-05-13 02:08:44.190253
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e2a4c6d1f93'
+down_revision: Union[str, None] = '3c9d1f7a2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_job_postings_created_at_id', 'job_postings', ['created_at', 'id'], unique=False)
+    op.create_index('ix_job_postings_salary_id', 'job_postings', ['salary', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_postings_salary_id', table_name='job_postings')
+    op.drop_index('ix_job_postings_created_at_id', table_name='job_postings')
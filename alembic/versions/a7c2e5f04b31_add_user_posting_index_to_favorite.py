@@ -0,0 +1,28 @@
+"""add user_id, job_posting_id index to favorite
+
+Revision ID: a7c2e5f04b31
+Revises: d41f8b6e7a25
+Create Date: 2025-05-13 10:27:03.418275
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c2e5f04b31'
+down_revision: Union[str, None] = 'd41f8b6e7a25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_favorite_user_id_job_posting_id', 'favorite', ['user_id', 'job_posting_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_favorite_user_id_job_posting_id', table_name='favorite')
@@ -0,0 +1,87 @@
+"""add resume_snapshots table and move job_applications.resumes_data into it
+
+Revision ID: b2e6f4a8d930
+Revises: 4a7d0e2b9c15
+Create Date: 2025-05-14 16:05:52.804417
+
+"""
+import hashlib
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e6f4a8d930'
+down_revision: Union[str, None] = '4a7d0e2b9c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _hash(snapshot) -> str:
+    # app.domains.job_applications.utils.hash_resume_snapshot 과 같은 정규화 규칙
+    canonical = json.dumps(snapshot, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('resume_snapshots',
+    sa.Column('hash', sa.String(length=64), nullable=False),
+    sa.Column('data', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('hash')
+    )
+    op.add_column('job_applications', sa.Column('snapshot_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_job_applications_snapshot_hash'), 'job_applications', ['snapshot_hash'], unique=False)
+    op.create_foreign_key('job_applications_snapshot_hash_fkey', 'job_applications', 'resume_snapshots', ['snapshot_hash'], ['hash'])
+    op.alter_column('job_applications', 'resumes_data',
+               existing_type=sa.JSON(),
+               nullable=True,
+               comment='지원 시점 이력서 데이터 스냅샷 (이전 방식, 새 지원은 snapshot_hash 사용)',
+               existing_comment='지원 시점 이력서 데이터 스냅샷')
+
+    # 기존 지원의 스냅샷을 해시 기준으로 옮기고 지원 행의 사본은 비움
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(sa.text(
+            "SELECT id, resumes_data, created_at FROM job_applications "
+            "WHERE id > :last_id AND snapshot_hash IS NULL AND resumes_data IS NOT NULL "
+            "ORDER BY id LIMIT :limit"
+        ), {"last_id": last_id, "limit": BATCH_SIZE}).all()
+        if not rows:
+            break
+        links = []
+        for application_id, data, created_at in rows:
+            snapshot_hash = _hash(data)
+            bind.execute(sa.text(
+                "INSERT INTO resume_snapshots (hash, data, created_at) "
+                "VALUES (:hash, CAST(:data AS JSON), :created_at) ON CONFLICT (hash) DO NOTHING"
+            ), {"hash": snapshot_hash, "data": json.dumps(data, ensure_ascii=False), "created_at": created_at})
+            links.append({"id": application_id, "hash": snapshot_hash})
+        bind.execute(sa.text(
+            "UPDATE job_applications SET snapshot_hash = :hash, resumes_data = NULL WHERE id = :id"
+        ), links)
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "UPDATE job_applications SET resumes_data = resume_snapshots.data "
+        "FROM resume_snapshots WHERE job_applications.snapshot_hash = resume_snapshots.hash"
+    )
+    op.alter_column('job_applications', 'resumes_data',
+               existing_type=sa.JSON(),
+               nullable=False,
+               comment='지원 시점 이력서 데이터 스냅샷',
+               existing_comment='지원 시점 이력서 데이터 스냅샷 (이전 방식, 새 지원은 snapshot_hash 사용)')
+    op.drop_constraint('job_applications_snapshot_hash_fkey', 'job_applications', type_='foreignkey')
+    op.drop_index(op.f('ix_job_applications_snapshot_hash'), table_name='job_applications')
+    op.drop_column('job_applications', 'snapshot_hash')
+    op.drop_table('resume_snapshots')
@@ -0,0 +1,48 @@
+"""add user_id, job_posting_id unique constraint to job_applications
+
+Revision ID: c5d8a3f17e42
+Revises: 7b4e2f9a1c06
+Create Date: 2025-05-14 09:03:17.552104
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d8a3f17e42'
+down_revision: Union[str, None] = '7b4e2f9a1c06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 이전 조회 후 추가 방식에서 동시 요청으로 생긴 중복 지원 정리
+    # (사용자·공고별로 가장 먼저 생성된 지원만 남기고, 삭제한 만큼 공고 지원자 수 카운터 감소)
+    op.execute(
+        """
+        WITH removed AS (
+            DELETE FROM job_applications AS duplicate
+            USING job_applications AS original
+            WHERE duplicate.user_id = original.user_id
+              AND duplicate.job_posting_id = original.job_posting_id
+              AND duplicate.id > original.id
+            RETURNING duplicate.job_posting_id
+        )
+        UPDATE job_postings
+        SET application_count = GREATEST(job_postings.application_count - removed_counts.removed, 0)
+        FROM (
+            SELECT job_posting_id, count(*) AS removed FROM removed GROUP BY job_posting_id
+        ) AS removed_counts
+        WHERE job_postings.id = removed_counts.job_posting_id
+        """
+    )
+    op.create_unique_constraint('uq_user_jobposting', 'job_applications', ['user_id', 'job_posting_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_user_jobposting', 'job_applications', type_='unique')
@@ -0,0 +1,37 @@
+"""add job_posting_age_stats table
+
+Revision ID: d41f8b6e7a25
+Revises: 5b7e3a9c2d18
+Create Date: 2025-05-13 08:15:52.731946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f8b6e7a25'
+down_revision: Union[str, None] = '5b7e3a9c2d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_posting_age_stats',
+    sa.Column('job_posting_id', sa.Integer(), nullable=False),
+    sa.Column('age_group', sa.Integer(), nullable=False),
+    sa.Column('application_count', sa.Integer(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['job_posting_id'], ['job_postings.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_posting_id', 'age_group')
+    )
+    op.create_index('ix_job_posting_age_stats_age_group_count', 'job_posting_age_stats', ['age_group', 'application_count'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_posting_age_stats_age_group_count', table_name='job_posting_age_stats')
+    op.drop_table('job_posting_age_stats')
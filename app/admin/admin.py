@@ -18,7 +18,7 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy import select
 from app.core.db import AsyncSessionFactory
 from app.models.job_experience import ResumeExperience
-import bcrypt
+from app.core.password_hasher import password_hasher
 import datetime
 from zoneinfo import ZoneInfo
 
@@ -43,9 +43,7 @@ class PasswordHashMixin:
     async def insert_model(self, request, data):
         # 비밀번호 암호화
         if "password" in data and data["password"] and not self._is_hashed(data["password"]):
-            password_bytes = data["password"].encode('utf-8')
-            hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt())
-            data["password"] = hashed.decode('utf-8')
+            data["password"] = await password_hasher.hash(data["password"])
 
         # 부모 클래스의 insert_model 메서드 호출
         return await super().insert_model(request, data)
@@ -53,9 +51,7 @@ class PasswordHashMixin:
     async def update_model(self, request, pk, data):
         # 비밀번호 암호화
         if "password" in data and data["password"] and not self._is_hashed(data["password"]):
-            password_bytes = data["password"].encode('utf-8')
-            hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt())
-            data["password"] = hashed.decode('utf-8')
+            data["password"] = await password_hasher.hash(data["password"])
 
         # 부모 클래스의 update_model 메서드 호출
         return await super().update_model(request, pk, data)
@@ -86,6 +82,13 @@ class BaseAdmin(ModelView):
     # 선택적으로 로드할 관계 필드 목록 (기본값은 빈 리스트)
     column_selectinload_list = []
 
+    def list_query(self, request):
+        # 목록 화면에서도 지정된 관계를 함께 로드 (lazy="raise" 관계의 "company.company_name" 등 표시용)
+        stmt = super().list_query(request)
+        for rel in self.column_selectinload_list:
+            stmt = stmt.options(selectinload(rel))
+        return stmt
+
     async def get_list(self):
         async with AsyncSessionFactory() as session:
             stmt = select(self.model)
@@ -206,6 +209,9 @@ class JobPostingAdmin(BaseAdmin, model=JobPosting):
         "created_at": format_datetime_kst,
         "updated_at": format_datetime_kst,
     }
+    # 검색용 생성 컬럼은 DB가 관리하므로 상세/폼에서 제외 (지원자 수는 지원 생성/취소 시 자동 갱신)
+    column_details_exclude_list = ["search_text", "geo_cell"]
+    form_excluded_columns = ["search_text", "geo_cell", "application_count"]
 
 class FavoriteAdmin(BaseAdmin, model=Favorite):
     column_list = ["id", "user.email", "job_posting.title", "created_at"]
@@ -3,7 +3,7 @@ from sqlalchemy.future import select
 from starlette.requests import Request
 
 from app.core.db import AsyncSessionFactory
-from app.core.utils import verify_password
+from app.core.password_hasher import password_hasher
 from app.models.admin_users import AdminUser
 
 
@@ -20,7 +20,7 @@ class AdminAuth(AuthenticationBackend):
             )
             user = result.scalar_one_or_none()
 
-            if user and verify_password(password, user.password):
+            if user and await password_hasher.verify(password, user.password):
                 request.session.update({"user_id": user.id})
                 return True
         return False
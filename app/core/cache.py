@@ -0,0 +1,47 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    프로세스 내 메모리 캐시 (TTL 만료 + 최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거).
+
+    워커 프로세스마다 별도로 유지되므로, 다른 프로세스에서 일어난 변경은 TTL이 지나야 반영된다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """키에 해당하는 값을 반환 (없거나 만료되었으면 default)"""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            # 만료된 항목은 조회 시점에 제거
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """값 저장 (ttl 미지정 시 기본 TTL 적용)"""
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """특정 키 제거"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 항목 제거"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
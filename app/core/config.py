@@ -13,6 +13,15 @@ ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
 REFRESH_TOKEN_EXPIRE_MINUTES = int(os.getenv("REFRESH_TOKEN_EXPIRE_MINUTES"))
 
+# 리프레쉬 토큰 재발급 시 DB 조회 없이 서명/만료/폐기 목록만 검사할지 여부
+STATELESS_TOKEN_REFRESH = os.getenv("STATELESS_TOKEN_REFRESH", "True") == "True"
+# 토큰 폐기 목록을 DB에서 다시 읽어오는 주기(초)
+TOKEN_REVOCATION_SYNC_SECONDS = int(os.getenv("TOKEN_REVOCATION_SYNC_SECONDS", "30"))
+
+# 비밀번호 해싱 스레드 풀 설정 (워커 수, 최대 대기 작업 수)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "256"))
+
 # 현재 실행 환경 구분용 변수
 ENVIRONMENT = os.getenv("ENVIRONMENT", "local")
 
@@ -29,6 +38,18 @@ DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")
 if not EMAIL_HOST_USER or not EMAIL_HOST_PASSWORD:
     raise ValueError("SMTP 인증 정보가 설정되지 않았습니다.")
 
+# 이메일 아웃박스 발송 워커 설정 (동시 발송 수, 한 번에 가져올 건수, 최대 시도 횟수, 재시도 간격)
+EMAIL_OUTBOX_CONCURRENCY = int(os.getenv("EMAIL_OUTBOX_CONCURRENCY", "5"))
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+EMAIL_OUTBOX_BACKOFF_SECONDS = int(os.getenv("EMAIL_OUTBOX_BACKOFF_SECONDS", "30"))
+EMAIL_OUTBOX_MAX_BACKOFF_SECONDS = int(os.getenv("EMAIL_OUTBOX_MAX_BACKOFF_SECONDS", "3600"))
+# 최종 실패(failed)한 아웃박스 항목 보관 기간 (발송 완료 항목은 보관하지 않음)
+EMAIL_OUTBOX_FAILED_RETENTION_DAYS = int(os.getenv("EMAIL_OUTBOX_FAILED_RETENTION_DAYS", "7"))
+
+# 기업 지원자 내보내기(CSV/NDJSON)에서 서버 측 커서로 한 번에 가져올 행 수
+APPLICATION_EXPORT_BATCH_SIZE = int(os.getenv("APPLICATION_EXPORT_BATCH_SIZE", "500"))
+
 # 이메일 인증/비밀번호 재설정 링크에서 사용할 사이트 URL
 SITE_URL = os.getenv("SITE_URL", "http://localhost:5173")
 
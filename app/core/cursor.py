@@ -0,0 +1,35 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+# --- 커서(Keyset) 페이지네이션 공통 인코딩 ---
+# 커서는 마지막으로 전달된 행의 (정렬 기준 값, id)를 담은 불투명 문자열이다.
+# 정렬 기준이 여러 개인 목록은 kind에 정렬 이름을 담아 다른 정렬의 커서를 거부한다.
+
+
+def encode_keyset_cursor(value: Any, last_id: int, kind: Optional[str] = None) -> str:
+    """(정렬 기준 값, id)로 다음 페이지 조회용 커서 문자열 생성 (datetime 값은 ISO 형식으로 저장)"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = {"v": value, "id": last_id}
+    if kind is not None:
+        payload = {"s": kind, **payload}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_keyset_cursor(
+    cursor: str,
+    kind: Optional[str] = None,
+    parse: Callable[[Any], Any] = lambda value: value,
+) -> tuple[Any, int]:
+    """커서 문자열을 (parse(정렬 기준 값), id) 튜플로 복원 (형식 오류나 정렬 기준 불일치 시 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if kind is not None and payload["s"] != kind:
+            raise ValueError("정렬 기준이 커서와 일치하지 않습니다")
+        return parse(payload["v"]), int(payload["id"])
+    except (ValueError, TypeError, KeyError, UnicodeError) as e:
+        raise ValueError(f"유효하지 않은 커서입니다: {e}")
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from fastapi import HTTPException, status
+
+from app.core.config import PASSWORD_HASH_MAX_QUEUE, PASSWORD_HASH_WORKERS
+from app.core.utils import hash_password, verify_password
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않는 비밀번호 해싱 서비스.
+
+    대기열(풀에 제출되었지만 아직 시작하지 않은 작업)이 max_queue에 도달하면 503을 반환해
+    로그인 폭주 시에도 대기 작업이 무한히 쌓이지 않도록 한다. 워커 프로세스마다 별도로 유지된다.
+    """
+
+    def __init__(self, max_workers: int = PASSWORD_HASH_WORKERS, max_queue: int = PASSWORD_HASH_MAX_QUEUE):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        # 모니터링용 카운터
+        self.queued = 0          # 현재 대기 중인 작업 수
+        self.running = 0         # 현재 실행 중인 작업 수
+        self.max_queue_depth = 0  # 관측된 최대 대기열 길이
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0  # 제출부터 실행 시작까지 대기한 시간 합계
+
+    def _dequeue(self, job: dict) -> None:
+        """작업을 대기열 카운터에서 한 번만 제외 (self._lock을 잡은 상태에서 호출)"""
+        if not job["dequeued"]:
+            job["dequeued"] = True
+            self.queued -= 1
+
+    def _track(self, func: Callable[..., T], job: dict, submitted_at: float, *args) -> T:
+        """스레드 풀에서 실행되는 래퍼 (대기열/실행 카운터 갱신)"""
+        with self._lock:
+            self._dequeue(job)
+            self.running += 1
+            self.total_wait_seconds += time.monotonic() - submitted_at
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+    async def _submit(self, func: Callable[..., T], *args) -> T:
+        """작업을 스레드 풀에 제출하고 결과를 기다림 (대기열이 가득 차면 503)"""
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                )
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queued)
+        job = {"dequeued": False}
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, self._track, func, job, time.monotonic(), *args)
+        finally:
+            # 요청이 취소되면(클라이언트 연결 종료, 타임아웃) 시작 전 작업은 실행되지 않아 _track이 호출되지 않으므로 여기서 제외
+            with self._lock:
+                self._dequeue(job)
+
+    async def hash(self, password: str) -> str:
+        """비밀번호를 bcrypt 해시로 변환"""
+        return await self._submit(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """입력한 비밀번호와 해시가 일치하는지 확인"""
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        """대기열 길이 모니터링용 카운터"""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "max_queue_depth": self.max_queue_depth,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.total_wait_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+            }
+
+
+# 워커 프로세스 단위 비밀번호 해싱 서비스 인스턴스
+password_hasher = PasswordHasher()
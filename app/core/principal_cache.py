@@ -0,0 +1,131 @@
+import time
+from typing import Any, Dict, List, Optional, Type
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.cache import TTLCache
+from app.models.company_users import CompanyUser
+from app.models.users import User
+
+# 인증 주체(로그인 사용자) 캐시 설정
+PRINCIPAL_CACHE_TTL_SECONDS = 60
+PRINCIPAL_CACHE_MAXSIZE = 2048
+
+# 캐시에 함께 보관할 관계 (인증 이후 라우트에서 실제로 사용하는 것만)
+# - 일반 사용자: 관심분야 연결(추천에 사용, 이름은 관심분야 카탈로그에서 조회)
+# - 기업 사용자: 기업 정보(회사명, 정보 수정/탈퇴에 사용)
+USER_RELATIONSHIPS = {"user_interests": {}}
+COMPANY_USER_RELATIONSHIPS = {"company": {}}
+
+
+def _snapshot(obj: Any, relationships: Dict[str, dict]) -> dict:
+    """ORM 객체의 컬럼 값과 지정한 관계를 세션과 무관한 dict로 복사 (로드되지 않은 관계는 제외)"""
+    state = inspect(obj)
+    data = {
+        "columns": {attr.key: getattr(obj, attr.key) for attr in state.mapper.column_attrs},
+        "relationships": {},
+    }
+    for name, nested in relationships.items():
+        if name in state.unloaded:
+            continue
+        value = getattr(obj, name)
+        if value is None:
+            data["relationships"][name] = None
+        elif isinstance(value, list):
+            data["relationships"][name] = [_snapshot(item, nested) for item in value]
+        else:
+            data["relationships"][name] = _snapshot(value, nested)
+    return data
+
+
+def _restore(model: Type, data: dict, restored: List[Any]) -> Any:
+    """스냅샷으로 DB 조회 없이 분리(detached) 상태의 ORM 객체를 재구성 (재구성한 객체는 restored에 모음)"""
+    mapper = inspect(model)
+    obj = mapper.class_manager.new_instance()
+    for key, value in data["columns"].items():
+        set_committed_value(obj, key, value)
+    for name, value in data["relationships"].items():
+        target = mapper.relationships[name].mapper.class_
+        if isinstance(value, list):
+            set_committed_value(obj, name, [_restore(target, item, restored) for item in value])
+        elif value is not None:
+            set_committed_value(obj, name, _restore(target, value, restored))
+        else:
+            set_committed_value(obj, name, None)
+    # 기본 키로 식별자를 부여해 '이미 DB에 있는 객체'로 취급 (스냅샷에 없는 속성은 접근 시 로드)
+    make_transient_to_detached(obj)
+    restored.append(obj)
+    return obj
+
+
+class PrincipalCache:
+    """
+    JWT 인증 의존성에서 조회한 사용자를 (사용자 유형, sub 클레임) 기준으로 보관하는 프로세스 내 캐시.
+
+    값은 세션과 분리된 스냅샷이며, 조회 시 요청 세션에 다시 붙인 객체를 돌려준다.
+    프로필 수정/비밀번호 재설정/탈퇴 시 invalidate_*로 제거하며, 다른 워커의 변경은 TTL 경과 후 반영된다.
+    """
+
+    def __init__(self, maxsize: int = PRINCIPAL_CACHE_MAXSIZE, ttl: float = PRINCIPAL_CACHE_TTL_SECONDS):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, subject: str, session: AsyncSession) -> Optional[Any]:
+        """캐시된 사용자를 요청 세션에 연결해 반환 (없으면 None)"""
+        data = self._cache.get((kind, subject))
+        if data is None:
+            self.misses += 1
+            return None
+        model = User if kind == "user" else CompanyUser
+        restored: List[Any] = []
+        obj = _restore(model, data, restored)
+        # 같은 세션에 이미 로드된 객체(관심분야, 기업 정보 등)와 겹치면 DB에서 다시 조회하도록 미스로 처리
+        if any(inspect(item).key in session.identity_map for item in restored):
+            self.misses += 1
+            return None
+        self.hits += 1
+        session.add(obj)
+        return obj
+
+    def put(self, kind: str, subject: str, obj: Any, token_exp: Optional[float] = None) -> None:
+        """조회한 사용자를 캐시에 저장 (토큰 만료 시각을 넘겨 보관하지 않음)"""
+        relationships = USER_RELATIONSHIPS if kind == "user" else COMPANY_USER_RELATIONSHIPS
+        ttl = self.ttl
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+            if ttl <= 0:
+                return
+        self._cache.set((kind, subject), _snapshot(obj, relationships), ttl=ttl)
+
+    def invalidate_user(self, user_id: Optional[int] = None, email: Optional[str] = None) -> None:
+        """일반 사용자 캐시 제거 (sub 클레임은 ID 또는 이메일일 수 있어 둘 다 제거)"""
+        if user_id is not None:
+            self._cache.invalidate(("user", str(user_id)))
+        if email:
+            self._cache.invalidate(("user", email))
+
+    def invalidate_company_user(self, email: str) -> None:
+        """기업 사용자 캐시 제거 (sub 클레임은 이메일)"""
+        self._cache.invalidate(("company", email))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """적중률 모니터링용 카운터"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "size": len(self._cache),
+        }
+
+
+# 워커 프로세스 단위 인증 주체 캐시 인스턴스
+principal_cache = PrincipalCache()
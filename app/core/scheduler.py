@@ -1,6 +1,16 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
-from app.core.tasks import delete_unverified_users
+from datetime import datetime
+
+from app.core.tasks import (
+    delete_unverified_users,
+    deliver_outbox_emails,
+    purge_email_outbox,
+    purge_resume_snapshots,
+    purge_token_revocations,
+    reconcile_application_counts,
+    refresh_age_group_popularity,
+)
 
 def start_scheduler():
     scheduler = AsyncIOScheduler()
@@ -10,4 +20,41 @@ def start_scheduler():
         id="delete_unverified_users_job",
         replace_existing=True
     )
+    scheduler.add_job(
+        refresh_age_group_popularity,
+        trigger=IntervalTrigger(minutes=10),  # 10분마다 연령대별 인기 공고 집계 갱신
+        id="refresh_age_group_popularity_job",
+        next_run_time=datetime.now(),  # 시작 직후 한 번 실행하여 집계 테이블 채우기
+        replace_existing=True
+    )
+    scheduler.add_job(
+        reconcile_application_counts,
+        trigger=IntervalTrigger(minutes=30),  # 30분마다 공고별 지원자 수 카운터 보정
+        id="reconcile_application_counts_job",
+        replace_existing=True
+    )
+    scheduler.add_job(
+        purge_resume_snapshots,
+        trigger=IntervalTrigger(hours=1),  # 1시간마다 참조 없는 이력서 스냅샷 정리
+        id="purge_resume_snapshots_job",
+        replace_existing=True
+    )
+    scheduler.add_job(
+        purge_token_revocations,
+        trigger=IntervalTrigger(hours=1),  # 1시간마다 만료된 토큰 폐기 항목 정리
+        id="purge_token_revocations_job",
+        replace_existing=True
+    )
+    scheduler.add_job(
+        deliver_outbox_emails,
+        trigger=IntervalTrigger(seconds=10),  # 10초마다 이메일 아웃박스 발송
+        id="deliver_outbox_emails_job",
+        replace_existing=True
+    )
+    scheduler.add_job(
+        purge_email_outbox,
+        trigger=IntervalTrigger(hours=1),  # 1시간마다 처리가 끝난 이메일 아웃박스 항목 정리
+        id="purge_email_outbox_job",
+        replace_existing=True
+    )
     scheduler.start()
\ No newline at end of file
@@ -2,6 +2,10 @@ from sqlalchemy.future import select
 from datetime import datetime, timedelta
 
 from app.core.db import AsyncSessionFactory
+from app.core.token_revocation import purge_expired_token_revocations
+from app.domains.job_applications.outbox import drain_email_outbox, purge_finished_email_outbox
+from app.domains.job_applications.service import purge_orphan_resume_snapshots
+from app.domains.job_postings.repository import JobPostingRepository
 from app.models import User, CompanyUser
 from app.models.users import EmailVerification
 
@@ -44,4 +48,40 @@ async def delete_unverified_users():
             await session.delete(ev)
 
         if users or company_users:
-            await session.commit()
\ No newline at end of file
+            await session.commit()
+
+
+async def refresh_age_group_popularity():
+    """연령대별 인기 공고 집계 테이블 재계산 (/posting/popular-by-my-age 용)"""
+    async with AsyncSessionFactory() as session:
+        await JobPostingRepository(session).refresh_age_group_stats()
+
+
+async def reconcile_application_counts():
+    """공고별 지원자 수 카운터를 실제 지원 수로 보정 (탈퇴 cascade, 관리자 삭제 등 API 밖에서 삭제된 지원 반영)"""
+    async with AsyncSessionFactory() as session:
+        await JobPostingRepository(session).reconcile_application_counts()
+
+
+async def purge_resume_snapshots():
+    """참조하는 지원이 없는 이력서 스냅샷 삭제 (탈퇴·공고 삭제 cascade, 관리자 삭제로 남은 개인정보 정리)"""
+    async with AsyncSessionFactory() as session:
+        await purge_orphan_resume_snapshots(session)
+
+
+async def purge_token_revocations():
+    """만료된 리프레쉬 토큰 폐기 항목 삭제 (폐기 대상 토큰이 모두 만료된 항목)"""
+    async with AsyncSessionFactory() as session:
+        await purge_expired_token_revocations(session)
+
+
+async def deliver_outbox_emails():
+    """이메일 아웃박스에 쌓인 메일 발송 (지원자 이력서 메일 등)"""
+    async with AsyncSessionFactory() as session:
+        await drain_email_outbox(session)
+
+
+async def purge_email_outbox():
+    """발송 완료 및 보관 기간이 지난 최종 실패 이메일 아웃박스 항목 삭제 (이력서 본문 정리)"""
+    async with AsyncSessionFactory() as session:
+        await purge_finished_email_outbox(session)
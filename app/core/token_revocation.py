@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import REFRESH_TOKEN_EXPIRE_MINUTES, TOKEN_REVOCATION_SYNC_SECONDS
+from app.core.datetime_utils import UTC, get_now_utc
+from app.core.db import AsyncSessionFactory
+from app.models.token_revocations import TokenRevocation
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 토큰 주체 종류 (일반 사용자 sub = 사용자 ID, 기업 사용자 sub = 이메일)
+SUBJECT_USER = "user"
+SUBJECT_COMPANY = "company"
+
+
+class TokenRevocationList:
+    """
+    리프레쉬 토큰 폐기 목록을 메모리에 보관해 재발급 시 DB 조회 없이 폐기 여부를 판단한다.
+
+    폐기는 token_revocations 테이블에 기록하고 이 워커의 메모리에도 즉시 반영한다.
+    다른 워커에서 폐기한 항목은 sync_forever()가 TOKEN_REVOCATION_SYNC_SECONDS마다 읽어와 합친다.
+    항목은 폐기 대상 토큰이 모두 만료되는 시각(expires_at)까지만 유지한다.
+    """
+
+    def __init__(self):
+        self._tokens: Dict[str, float] = {}                   # jti -> expires_at
+        self._subjects: Dict[str, Tuple[float, float]] = {}   # "user:1" -> (revoked_at, expires_at)
+        self.last_synced_at = 0.0
+
+    def is_revoked(self, kind: str, payload: dict) -> bool:
+        """디코딩된 리프레쉬 토큰이 폐기되었는지 확인 (iat가 없는 이전 토큰은 주체 단위 폐기 시 함께 폐기)"""
+        jti = payload.get("jti")
+        if jti is not None and jti in self._tokens:
+            return True
+        entry = self._subjects.get(f"{kind}:{payload.get('sub')}")
+        return entry is not None and float(payload.get("iat", 0)) < entry[0]
+
+    def _remember(self, key: str, revoked_at: float, expires_at: float) -> None:
+        if key.startswith("jti:"):
+            self._tokens[key[4:]] = expires_at
+        else:
+            previous = self._subjects.get(key)
+            if previous is None or previous[0] < revoked_at:
+                self._subjects[key] = (revoked_at, expires_at)
+
+    async def _record(self, db: AsyncSession, key: str, revoked_at: datetime, expires_at: datetime) -> None:
+        """폐기 항목 저장 (커밋은 호출한 서비스가 수행) 후 메모리에 반영"""
+        stmt = pg_insert(TokenRevocation).values(key=key, revoked_at=revoked_at, expires_at=expires_at)
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[TokenRevocation.key],
+            set_={"revoked_at": stmt.excluded.revoked_at, "expires_at": stmt.excluded.expires_at},
+        ))
+        self._remember(key, revoked_at.timestamp(), expires_at.timestamp())
+
+    async def revoke_token(self, db: AsyncSession, payload: dict) -> None:
+        """리프레쉬 토큰 하나를 폐기 (로그아웃, jti가 없는 이전 토큰은 무시)"""
+        jti = payload.get("jti")
+        if jti is None:
+            return
+        expires_at = datetime.fromtimestamp(payload["exp"], UTC)
+        await self._record(db, f"jti:{jti}", get_now_utc(), expires_at)
+
+    async def revoke_subject(self, db: AsyncSession, kind: str, subject: str) -> None:
+        """주체가 지금까지 발급받은 리프레쉬 토큰을 모두 폐기 (탈퇴, 비밀번호 재설정)"""
+        now = get_now_utc()
+        expires_at = now + timedelta(minutes=REFRESH_TOKEN_EXPIRE_MINUTES)
+        await self._record(db, f"{kind}:{subject}", now, expires_at)
+
+    def _prune(self) -> None:
+        now = time.time()
+        self._tokens = {jti: exp for jti, exp in self._tokens.items() if exp > now}
+        self._subjects = {key: entry for key, entry in self._subjects.items() if entry[1] > now}
+
+    async def sync(self, session: AsyncSession) -> None:
+        """DB의 유효한 폐기 항목을 메모리 목록에 합치고 만료된 항목 제거"""
+        rows = (await session.execute(
+            select(TokenRevocation.key, TokenRevocation.revoked_at, TokenRevocation.expires_at)
+            .where(TokenRevocation.expires_at > get_now_utc())
+        )).all()
+        for key, revoked_at, expires_at in rows:
+            self._remember(key, revoked_at.timestamp(), expires_at.timestamp())
+        self._prune()
+        self.last_synced_at = time.time()
+
+    async def sync_forever(self) -> None:
+        """워커가 살아있는 동안 주기적으로 폐기 목록 동기화 (실패 시 다음 주기에 재시도)"""
+        while True:
+            try:
+                async with AsyncSessionFactory() as session:
+                    await self.sync(session)
+            except Exception as e:
+                logger.warning(f"토큰 폐기 목록 동기화 실패: {e}")
+            await asyncio.sleep(TOKEN_REVOCATION_SYNC_SECONDS)
+
+    def stats(self) -> dict:
+        """모니터링용 폐기 목록 크기"""
+        return {
+            "tokens": len(self._tokens),
+            "subjects": len(self._subjects),
+            "last_synced_at": self.last_synced_at,
+        }
+
+
+async def purge_expired_token_revocations(session: AsyncSession) -> int:
+    """만료된 폐기 항목 삭제 (스케줄러 작업)"""
+    result = await session.execute(
+        delete(TokenRevocation).where(TokenRevocation.expires_at <= get_now_utc())
+    )
+    await session.commit()
+    return result.rowcount
+
+
+# 워커 프로세스 단위 토큰 폐기 목록 인스턴스
+token_revocations = TokenRevocationList()
@@ -7,7 +7,9 @@ from typing import Optional
 
 from app.core.config import ALGORITHM, SECRET_KEY, ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_MINUTES
 from app.core.db import get_db_session
+from app.core.principal_cache import principal_cache
 from app.models.company_users import CompanyUser
+from app.models.loaders import load_profile
 from app.models.users import User
 
 # NCP Object Storage 접속 정보
@@ -40,15 +42,23 @@ async def get_current_company_user(
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="토큰 검증 실패.")
 
+    # 인증 주체 캐시 확인 (적중 시 DB 조회 생략)
+    company_user = principal_cache.get("company", user_email, db)
+    if company_user is not None:
+        return company_user
+
     # 데이터베이스에서 회사 사용자 조회
     result = await db.execute(
-        select(CompanyUser).filter_by(email=user_email)
+        select(CompanyUser)
+        .options(*load_profile(CompanyUser, "principal"))
+        .filter_by(email=user_email)
     )
     company_user = result.scalar_one_or_none()
     
     if company_user is None:
         raise HTTPException(status_code=404, detail="기업 사용자를 찾을 수 없습니다.")
-    
+
+    principal_cache.put("company", user_email, company_user, payload.get("exp"))
     return company_user
 
 # 인증된 일반 사용자 반환 (선택적, JWT 'sub' 클레임의 이메일 기준)
@@ -81,22 +91,27 @@ async def get_current_user_optional(
         print(f"JWT 디코딩 또는 페이로드 접근 중 오류 발생: {e}")
         return None
 
-    # user_sub이 숫자면 id로, 아니면 이메일로 조회
+    # 인증 주체 캐시 확인 (적중 시 DB 조회 생략)
+    user = principal_cache.get("user", str(user_sub), db)
+    if user is not None:
+        return user
+
+    # user_sub이 숫자면 id로, 아니면 이메일로 조회 (캐시 항목 구성이 같도록 관심분야까지 함께 로드)
     try:
+        query = select(User).options(*load_profile(User, "principal"))
         if user_sub.isdigit():
-            result = await db.execute(
-                select(User).filter(User.id == int(user_sub))
-            )
+            result = await db.execute(query.filter(User.id == int(user_sub)))
         else:
-            result = await db.execute(
-                select(User).filter(User.email == user_sub)
-            )
+            result = await db.execute(query.filter(User.email == user_sub))
         user = result.scalar_one_or_none()
+        if user is not None:
+            principal_cache.put("user", str(user_sub), user, payload.get("exp"))
         return user
     except Exception as e:
         print(f"DB에서 사용자 조회 중 오류 발생: {e}")
         return None
 
+# bcrypt 해시/검증 (동기 함수: 요청 처리 중에는 app.core.password_hasher를 통해 스레드 풀에서 실행)
 def hash_password(password: str) -> str:
     """비밀번호를 bcrypt 해시로 변환"""
     salt = bcrypt.gensalt()
@@ -183,7 +198,11 @@ async def create_refresh_token(data: dict) -> str:
     expire = datetime.now() + timedelta(
         minutes=REFRESH_TOKEN_EXPIRE_MINUTES
     )  # 리프레쉬 토큰 만료시간 계산
-    data.update({"exp": expire})  # 만료 정보 추가
+    data.update({
+        "exp": expire,  # 만료 정보 추가
+        "iat": datetime.now().timestamp(),  # 발급 시각 (주체 단위 폐기 판단용)
+        "jti": uuid.uuid4().hex,  # 토큰 ID (로그아웃 시 개별 폐기용)
+    })
     encoded_jwt = jwt.encode(
         data, SECRET_KEY, algorithm=ALGORITHM
     )  # 리프레쉬 토큰 생성
@@ -5,11 +5,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.domains.company_info.schemas import PublicCompanyInfo
 from app.domains.company_users.schemas import JobPostingsSummary
 from app.models import CompanyInfo
+from app.models.loaders import load_profile
 
 
 async def get_company_info(db: AsyncSession, company_id: int) -> PublicCompanyInfo:
 
-    data = await db.execute(select(CompanyInfo).where(CompanyInfo.id == company_id))
+    data = await db.execute(
+        select(CompanyInfo)
+        .options(*load_profile(CompanyInfo, "profile"))
+        .where(CompanyInfo.id == company_id)
+    )
     company = data.scalars().first()
     if not company:
         raise HTTPException(
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, status, BackgroundTasks, Query
 from sqlalchemy import select, delete as sql_alchemy_delete
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -34,6 +36,7 @@ from app.domains.company_users.service import (
     refresh_company_user_access_token,
     register_company_user,
     reset_password_with_token,
+    revoke_company_user_refresh_token,
     update_company_user,
 )
 from app.domains.company_users.utiles import success_response
@@ -153,7 +156,12 @@ async def login_companyuser(
         200: {"description": "로그아웃 성공"},
     },
 )
-async def logout_company_user():
+async def logout_company_user(
+    token_data: Optional[CompanyTokenRefreshRequest] = None,
+    db: AsyncSession = Depends(get_db_session),
+):
+    # 리프레쉬 토큰을 함께 보내면 폐기하여 재발급에 사용할 수 없게 함
+    await revoke_company_user_refresh_token(db, token_data)
     return success_response("로그아웃 되었습니다.")
 
 
@@ -1,12 +1,15 @@
 from datetime import datetime, timedelta
+from typing import Optional
 
 import jwt
 from fastapi import HTTPException, status, BackgroundTasks
 from sqlalchemy import delete, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.core.config import ALGORITHM, SECRET_KEY
+from app.core.config import ALGORITHM, SECRET_KEY, STATELESS_TOKEN_REFRESH
+from app.core.password_hasher import password_hasher
+from app.core.principal_cache import principal_cache
+from app.core.token_revocation import SUBJECT_COMPANY, token_revocations
 from app.core.utils import create_access_token
 from app.domains.company_users.schemas import (
     CompanyTokenRefreshRequest,
@@ -20,10 +23,9 @@ from app.domains.company_users.schemas import (
 from app.domains.company_users.utiles import (
     check_password_match,
     decode_refresh_token,
-    hash_password,
-    verify_password,
 )
 from app.models import CompanyInfo, CompanyUser
+from app.models.loaders import load_profile
 from app.models.job_postings import JobPosting
 from app.models.users import EmailVerification
 
@@ -62,13 +64,14 @@ async def create_company_user(
     db: AsyncSession, payload: CompanyUserBase, company_id: int) -> CompanyUser:
     company_user = CompanyUser(
         email=str(payload.email),
-        password=hash_password(payload.password),
+        password=await password_hasher.hash(payload.password),
         company_id=company_id,
     )
     company_user.is_active = True  # 이메일 인증을 통과한 경우 활성화 설정
     db.add(company_user)
     await db.commit()
     await db.refresh(company_user)
+    await db.refresh(company_user, ["company"])  # 응답의 기업명(company_name)에 필요
     return company_user
 
 
@@ -108,7 +111,11 @@ async def register_company_user(db: AsyncSession, payload: CompanyUserRegisterRe
 
 # 기업 회원 로그인
 async def login_company_user(db: AsyncSession, email: str, password: str):
-    result = await db.execute(select(CompanyUser).filter_by(email=email))
+    result = await db.execute(
+        select(CompanyUser)
+        .options(*load_profile(CompanyUser, "principal"))
+        .filter_by(email=email)
+    )
     company_user = result.scalars().first()
 
     # 유효값 검증
@@ -118,7 +125,7 @@ async def login_company_user(db: AsyncSession, email: str, password: str):
             detail="이메일 또는 비밀번호가 일치하지 않습니다.")
     if not company_user.is_active:
         raise HTTPException(status_code=403, detail="이메일 인증이 필요합니다.")
-    if not verify_password(password, company_user.password):
+    if not await password_hasher.verify(password, company_user.password):
         raise HTTPException(
             status_code=401,
             detail="이메일 또는 비밀번호가 일치하지 않습니다.",
@@ -132,9 +139,7 @@ async def get_company_user_mypage(db: AsyncSession, current_user: CompanyUser):
 
     result = await db.execute(
         select(CompanyUser)
-        .options(
-            selectinload(CompanyUser.company), selectinload(CompanyUser.job_postings)
-        )
+        .options(*load_profile(CompanyUser, "profile"))
         .where(CompanyUser.id == current_user.id)
     )
     user = result.scalars().first()
@@ -174,8 +179,8 @@ async def update_company_user(
     # 비밀번호 수정
     if payload.password:
         check_password_match(payload.password, payload.confirm_password)
-        if not verify_password(payload.password, current_user.password):
-            current_user.password = hash_password(payload.password)
+        if not await password_hasher.verify(payload.password, current_user.password):
+            current_user.password = await password_hasher.hash(payload.password)
             has_changes = True
 
     company = current_user.company
@@ -197,6 +202,7 @@ async def update_company_user(
     # 커밋 처리
     if has_changes:
         await db.commit()
+        principal_cache.invalidate_company_user(current_user.email)  # 인증 주체 캐시에서 변경 전 정보 제거
         await db.refresh(company)
 
     result = {
@@ -243,7 +249,9 @@ async def delete_company_user(db: AsyncSession, current_user: CompanyUser):
     await db.delete(current_user)
     if company_info:
         await db.delete(company_info)  # 기업 정보도 삭제
+    await token_revocations.revoke_subject(db, SUBJECT_COMPANY, current_user.email)  # 발급된 리프레쉬 토큰 폐기
     await db.commit()
+    principal_cache.invalidate_company_user(current_user.email)  # 탈퇴한 사용자를 인증 주체 캐시에서 제거
 
     deleted_company_user = {
         "company_user_id": current_user.id,
@@ -257,6 +265,7 @@ async def find_company_user_email(db: AsyncSession, payload: FindCompanyUserEmai
     result = await db.execute(
         select(CompanyUser)
         .join(CompanyInfo)
+        .options(*load_profile(CompanyUser, "principal"))
         .where(
             CompanyInfo.ceo_name == payload.ceo_name,
             CompanyInfo.opening_date == payload.opening_date,
@@ -342,8 +351,10 @@ async def reset_password_with_token(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="해당 이메일의 사용자를 찾을 수 없습니다.",
         )
-    user.password = hash_password(new_password)
+    user.password = await password_hasher.hash(new_password)
+    await token_revocations.revoke_subject(db, SUBJECT_COMPANY, email)  # 이전 비밀번호로 발급된 리프레쉬 토큰 폐기
     await db.commit()
+    principal_cache.invalidate_company_user(email)  # 인증 주체 캐시에서 이전 비밀번호 정보 제거
 
 
 # 리프레쉬 토큰으로 엑세스토큰 재발급
@@ -352,14 +363,38 @@ async def refresh_company_user_access_token(
 ):
     payload = decode_refresh_token(token_data.refresh_token)
     email: str = payload.get("sub")
-
-    result = await db.execute(select(CompanyUser).filter_by(email=email))
-    user = result.scalar_one_or_none()
-    if not user:
+    if email is None:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="해당 기업 회원을 찾을 수 없습니다.",
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 리프레쉬 토큰입니다.",
         )
-    new_access_token = await create_access_token(data={"sub": user.email})
+    # 로그아웃/탈퇴/비밀번호 재설정으로 폐기된 토큰인지 메모리 폐기 목록으로 확인
+    if token_revocations.is_revoked(SUBJECT_COMPANY, payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="폐기된 리프레쉬 토큰입니다.",
+        )
+    if not STATELESS_TOKEN_REFRESH:
+        result = await db.execute(select(CompanyUser.id).filter_by(email=email))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="해당 기업 회원을 찾을 수 없습니다.",
+            )
+    new_access_token = await create_access_token(data={"sub": email})
 
     return {"access_token": new_access_token}
+
+
+# 기업 회원 로그아웃 (전달받은 리프레쉬 토큰 폐기)
+async def revoke_company_user_refresh_token(
+    db: AsyncSession, token_data: Optional[CompanyTokenRefreshRequest] = None
+):
+    if token_data is None:
+        return
+    try:
+        payload = decode_refresh_token(token_data.refresh_token)
+    except HTTPException:
+        return  # 이미 만료되었거나 유효하지 않은 토큰은 폐기할 필요 없음
+    await token_revocations.revoke_token(db, payload)
+    await db.commit()
@@ -1,23 +1,11 @@
 from typing import Any, Dict
 
-import bcrypt
 import jwt
 from fastapi import HTTPException, status
 
 from app.core.config import ALGORITHM, SECRET_KEY
 
 
-# 비밀번호 해싱 (DB 저장시)
-def hash_password(password: str) -> str:
-    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
-    return hashed.decode("utf-8")
-
-
-# 비밀번호 검증 (로그인시)
-def verify_password(password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
-
-
 # 토큰 검증
 def decode_refresh_token(refresh_token: str):
     try:
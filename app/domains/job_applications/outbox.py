@@ -0,0 +1,168 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import delete, insert, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import (
+    EMAIL_OUTBOX_BACKOFF_SECONDS,
+    EMAIL_OUTBOX_BATCH_SIZE,
+    EMAIL_OUTBOX_CONCURRENCY,
+    EMAIL_OUTBOX_FAILED_RETENTION_DAYS,
+    EMAIL_OUTBOX_MAX_ATTEMPTS,
+    EMAIL_OUTBOX_MAX_BACKOFF_SECONDS,
+)
+from app.core.datetime_utils import get_now_utc
+from app.domains.job_applications.utils import send_email
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatusEnum
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 워커가 가져간 항목을 잡아두는 시간 (발송 중 워커가 중단되면 이 시간이 지난 뒤 다시 발송)
+CLAIM_LEASE_SECONDS = 300
+
+
+def build_enqueue_email(
+    to_email: str,
+    subject: str,
+    html_content: str,
+    text_content: Optional[str] = None,
+    source=None,
+):
+    """
+    이메일을 아웃박스에 추가하는 INSERT 문 생성 (커밋은 호출한 쪽에서 수행)
+    source(CTE 등)를 주면 source에 행이 있을 때만 추가되는 INSERT ... SELECT 문으로 만든다.
+    """
+    now = get_now_utc()
+    values = {
+        "to_email": to_email,
+        "subject": subject,
+        "html_content": html_content,
+        "text_content": text_content,
+        "status": EmailOutboxStatusEnum.pending,
+        "attempts": 0,
+        "next_attempt_at": now,
+        "created_at": now,
+    }
+    if source is None:
+        return insert(EmailOutbox).values(**values)
+    columns = EmailOutbox.__table__.c
+    return insert(EmailOutbox).from_select(
+        list(values),
+        select(*[literal(value, columns[name].type) for name, value in values.items()]).select_from(source),
+    )
+
+
+def _backoff(attempts: int) -> timedelta:
+    """재시도 간격 (시도할 때마다 두 배, 최대 EMAIL_OUTBOX_MAX_BACKOFF_SECONDS)"""
+    return timedelta(seconds=min(EMAIL_OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1), EMAIL_OUTBOX_MAX_BACKOFF_SECONDS))
+
+
+async def _claim_batch(session: AsyncSession) -> list:
+    """발송할 항목을 가져가 발송 중으로 표시 (다른 워커와 겹치지 않도록 SKIP LOCKED)"""
+    now = get_now_utc()
+    claimable = (
+        select(EmailOutbox.id)
+        .where(
+            EmailOutbox.status.in_([EmailOutboxStatusEnum.pending, EmailOutboxStatusEnum.sending]),
+            EmailOutbox.next_attempt_at <= now,
+        )
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(EMAIL_OUTBOX_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    rows = (await session.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.id.in_(claimable.scalar_subquery()))
+        .values(
+            status=EmailOutboxStatusEnum.sending,
+            attempts=EmailOutbox.attempts + 1,
+            next_attempt_at=now + timedelta(seconds=CLAIM_LEASE_SECONDS),
+        )
+        .returning(
+            EmailOutbox.id,
+            EmailOutbox.to_email,
+            EmailOutbox.subject,
+            EmailOutbox.html_content,
+            EmailOutbox.text_content,
+            EmailOutbox.attempts,
+        )
+    )).all()
+    await session.commit()
+    return rows
+
+
+async def _deliver(row, semaphore: asyncio.Semaphore) -> Optional[str]:
+    """항목 하나 발송 (실패 시 오류 메시지 반환)"""
+    async with semaphore:
+        try:
+            await send_email(
+                to_email=row.to_email,
+                subject=row.subject,
+                html_content=row.html_content,
+                text_content=row.text_content,
+            )
+            return None
+        except Exception as e:
+            return str(e) or e.__class__.__name__
+
+
+async def drain_email_outbox(session: AsyncSession) -> dict:
+    """발송 가능한 아웃박스 항목을 모두 발송 (동시 발송 수 제한, 실패 시 지수 백오프로 재시도 예약)"""
+    semaphore = asyncio.Semaphore(EMAIL_OUTBOX_CONCURRENCY)
+    counts = {"sent": 0, "retry": 0, "failed": 0}
+    while True:
+        rows = await _claim_batch(session)
+        if not rows:
+            break
+        errors = await asyncio.gather(*[_deliver(row, semaphore) for row in rows])
+
+        now = get_now_utc()
+        sent_ids = [row.id for row, error in zip(rows, errors) if error is None]
+        if sent_ids:
+            await session.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.id.in_(sent_ids))
+                .values(status=EmailOutboxStatusEnum.sent, sent_at=now, last_error=None)
+            )
+            counts["sent"] += len(sent_ids)
+        for row, error in zip(rows, errors):
+            if error is None:
+                continue
+            if row.attempts >= EMAIL_OUTBOX_MAX_ATTEMPTS:
+                values = {"status": EmailOutboxStatusEnum.failed}
+                counts["failed"] += 1
+                logger.error(f"이메일 발송 최종 실패: outbox_id={row.id}, to={row.to_email}, error={error}")
+            else:
+                values = {"status": EmailOutboxStatusEnum.pending, "next_attempt_at": now + _backoff(row.attempts)}
+                counts["retry"] += 1
+                logger.warning(f"이메일 발송 실패, 재시도 예약: outbox_id={row.id}, 시도 {row.attempts}회, error={error}")
+            await session.execute(
+                update(EmailOutbox).where(EmailOutbox.id == row.id).values(last_error=error, **values)
+            )
+        await session.commit()
+
+        if len(rows) < EMAIL_OUTBOX_BATCH_SIZE:
+            break
+    if any(counts.values()):
+        logger.info(f"이메일 아웃박스 처리 완료: {counts}")
+    return counts
+
+
+async def purge_finished_email_outbox(session: AsyncSession) -> int:
+    """
+    처리가 끝난 아웃박스 항목 삭제 (스케줄러 작업)
+    본문에 지원자 이력서가 담겨 있으므로 발송 완료 항목은 바로, 최종 실패 항목은 EMAIL_OUTBOX_FAILED_RETENTION_DAYS 후 삭제한다.
+    """
+    failed_before = get_now_utc() - timedelta(days=EMAIL_OUTBOX_FAILED_RETENTION_DAYS)
+    result = await session.execute(
+        delete(EmailOutbox).where(or_(
+            EmailOutbox.status == EmailOutboxStatusEnum.sent,
+            (EmailOutbox.status == EmailOutboxStatusEnum.failed) & (EmailOutbox.created_at < failed_before),
+        ))
+    )
+    await session.commit()
+    return result.rowcount
@@ -1,4 +1,8 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, status, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import get_db_session
@@ -6,12 +10,15 @@ from app.domains.users.router import read_current_user
 from app.core.utils import get_current_company_user
 
 from app.domains.job_applications.schemas import (
-    ResumeApplyCreate, JobApplicationRead, JobApplicationStatusUpdate
+    ApplicationStatusEnum, ResumeApplyCreate, JobApplicationRead, JobApplicationStatusUpdate,
+    PaginatedJobApplicationSummaryResponse, PostingApplicationStats,
+    JobApplicationBulkStatusUpdate, JobApplicationBulkStatusResponse, ApplicationExportFormatEnum,
 )
 from app.domains.job_applications.service import (
     create_application, get_user_applications, get_user_application_detail,
     delete_application, get_company_applications,
-    get_company_application_detail, update_application_status
+    get_company_application_detail, get_company_application_stats, update_application_status,
+    bulk_update_application_status, stream_company_applications,
 )
 
 router = APIRouter(prefix="/applications", tags=["지원내역"])  # API 라우터 생성, 경로 접두사와 태그 설정
@@ -36,7 +43,8 @@ async def apply_with_resume(
     application = await create_application(
         user_id=user.id,                           # 인증된 사용자 ID
         job_posting_id=payload.job_posting_id,     # 요청된 공고 ID
-        session=db                                # DB 세션
+        session=db,                               # DB 세션
+        applicant=user,                           # 인증된 사용자 (지원자 재조회 생략)
     )
     return application  # 생성된 지원 내역 반환
 
@@ -88,18 +96,97 @@ async def cancel_my_application(  # 지원 취소를 처리하는 비동기 핸
         "message": "지원취소가 정상적으로 처리되었습니다.",
     }  # 결과 반환
 
-# 기업: 자사 전체 지원 조회
+# 기업: 자사 지원 목록 조회
 @router.get(
     "/company",
-    response_model=list[JobApplicationRead],  # 응답 모델 설정
-    summary="기업 전체 지원 조회",  # 요약 설명
-    description="기업유저가 본인의 기업 공고에 지원된 전체 이력서를 조회합니다."  # 상세 설명
+    response_model=PaginatedJobApplicationSummaryResponse,  # 응답 모델 설정
+    summary="기업 지원 목록 조회",  # 요약 설명
+    description="기업유저가 본인의 기업 공고에 받은 지원 목록을 최신순으로 조회합니다. 이력서 스냅샷은 상세 조회에서 제공합니다."  # 상세 설명
+)
+async def company_list_applications(  # 기업의 지원 목록을 조회하는 비동기 핸들러
+    job_posting_id: Optional[int] = Query(None, description="특정 공고의 지원만 조회"),
+    status_val: Optional[ApplicationStatusEnum] = Query(None, alias="status", description="특정 상태의 지원만 조회"),
+    created_from: Optional[datetime] = Query(None, description="지원 시각 시작 (이상)"),
+    created_to: Optional[datetime] = Query(None, description="지원 시각 끝 (미만)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=100, description="가져올 지원 수"),
+    db: AsyncSession = Depends(get_db_session),  # 데이터베이스 세션 의존성 주입
+    company_user = Depends(get_current_company_user)  # 현재 기업 사용자 의존성 주입
+):
+    return await get_company_applications(  # 기업 사용자의 지원 목록 조회
+        company_user, db,
+        job_posting_id=job_posting_id,
+        status_val=status_val,
+        created_from=created_from,
+        created_to=created_to,
+        cursor=cursor,
+        limit=limit,
+    )
+
+# 기업: 지원 상태 일괄 변경
+@router.patch(
+    "/company/status",
+    response_model=JobApplicationBulkStatusResponse,  # 응답 모델 설정
+    summary="기업 지원 상태 일괄 변경",  # 요약 설명
+    description="기업유저가 여러 지원자의 상태를 한 번에 변경합니다. 자사 공고의 지원만 변경됩니다."  # 상세 설명
+)
+async def company_bulk_change_status(  # 여러 지원의 상태를 변경하는 비동기 핸들러
+    payload: JobApplicationBulkStatusUpdate,  # 요청 본문: 지원 ID 목록과 변경할 상태
+    db: AsyncSession = Depends(get_db_session),  # 데이터베이스 세션 의존성 주입
+    company_user = Depends(get_current_company_user)  # 현재 기업 사용자 의존성 주입
+):
+    return await bulk_update_application_status(  # 지원 상태 일괄 변경 서비스 호출
+        company_user=company_user,
+        application_ids=payload.application_ids,
+        status_val=payload.status,
+        session=db,
+    )
+
+# 기업: 공고별 지원 현황 집계
+@router.get(
+    "/company/stats",
+    response_model=list[PostingApplicationStats],  # 응답 모델 설정
+    summary="기업 공고별 지원 현황",  # 요약 설명
+    description="기업유저의 공고별 상태별 지원 수와 가장 최근 지원 시각을 반환합니다."  # 상세 설명
 )
-async def company_list_applications(  # 기업의 전체 지원 내역을 조회하는 비동기 핸들러
+async def company_application_stats(  # 공고별 지원 현황을 조회하는 비동기 핸들러
     db: AsyncSession = Depends(get_db_session),  # 데이터베이스 세션 의존성 주입
     company_user = Depends(get_current_company_user)  # 현재 기업 사용자 의존성 주입
 ):
-    return await get_company_applications(company_user, db)  # 기업 사용자의 지원 내역 조회
+    return await get_company_application_stats(company_user, db)  # 공고별 지원 현황 집계
+
+# 기업: 지원자 내보내기 (CSV/NDJSON 스트리밍)
+@router.get(
+    "/company/export",
+    response_class=StreamingResponse,  # 응답 클래스 설정
+    summary="기업 지원자 내보내기",  # 요약 설명
+    description="기업유저가 본인의 기업 공고에 받은 지원 전체를 이력서 스냅샷을 펼친 CSV 또는 NDJSON으로 내려받습니다."  # 상세 설명
+)
+async def company_export_applications(  # 지원자 목록을 파일로 내보내는 비동기 핸들러
+    export_format: ApplicationExportFormatEnum = Query(ApplicationExportFormatEnum.csv, alias="format", description="내보내기 형식"),
+    job_posting_id: Optional[int] = Query(None, description="특정 공고의 지원만 내보내기"),
+    status_val: Optional[ApplicationStatusEnum] = Query(None, alias="status", description="특정 상태의 지원만 내보내기"),
+    created_from: Optional[datetime] = Query(None, description="지원 시각 시작 (이상)"),
+    created_to: Optional[datetime] = Query(None, description="지원 시각 끝 (미만)"),
+    db: AsyncSession = Depends(get_db_session),  # 데이터베이스 세션 의존성 주입 (내보내기는 같은 엔진의 별도 세션 사용)
+    company_user = Depends(get_current_company_user)  # 현재 기업 사용자 의존성 주입
+):
+    if export_format == ApplicationExportFormatEnum.ndjson:
+        media_type = "application/x-ndjson"
+    else:
+        media_type = "text/csv; charset=utf-8"
+    filename = f"applications_{datetime.now().strftime('%Y%m%d%H%M%S')}.{export_format.value}"
+    return StreamingResponse(
+        stream_company_applications(  # 지원 내역을 서버 측 커서로 읽어 바로 내보냄
+            company_user, db.bind, export_format.value,
+            job_posting_id=job_posting_id,
+            status_val=status_val,
+            created_from=created_from,
+            created_to=created_to,
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 # 기업: 특정 지원 상세 조회
 @router.get(
@@ -1,7 +1,8 @@
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 from app.models.job_applications import ApplicationStatusEnum
 
@@ -22,16 +23,70 @@ class JobApplicationStatusUpdate(BaseModel):
     """기업이 지원 상태를 변경할 때 사용하는 입력"""
     status: ApplicationStatusEnum = Field(..., description="변경할 지원 상태")
 
+class JobApplicationBulkStatusUpdate(BaseModel):
+    """기업이 여러 지원의 상태를 한 번에 변경할 때 사용하는 입력"""
+    application_ids: list[int] = Field(..., min_length=1, max_length=500, description="상태를 변경할 지원 ID 목록")
+    status: ApplicationStatusEnum = Field(..., description="변경할 지원 상태")
+
+class ApplicationExportFormatEnum(str, Enum):
+    """기업 지원자 내보내기 형식"""
+    csv = "csv"
+    ndjson = "ndjson"
+
 class JobApplicationRead(BaseModel):
     """지원 내역 단건 조회·생성 응답용"""
     id: int                          # 지원 PK
     user_id: int                     # 지원자 사용자 PK
     job_posting_id: int              # 지원된 채용공고 PK
     job_posting: Optional[JobPostingSummary] = Field(None, description="지원한 채용공고 정보")
-    resumes_data: dict = Field(..., description="지원 시점 이력서 데이터")
+    resumes_data: dict = Field(
+        ...,
+        validation_alias=AliasChoices("resume_snapshot", "resumes_data"),  # ORM 객체는 스냅샷 테이블 값 사용
+        description="지원 시점 이력서 데이터",
+    )
     status: ApplicationStatusEnum    # 지원 상태
     email_sent: Optional[bool] = Field(default=True, description="이메일 발송 성공 여부 (기본 True)") # 이메일 발송 여부
     created_at: datetime             # 생성 시각
     updated_at: datetime             # 수정 시각
 
-    model_config = ConfigDict(from_attributes=True)    # ORM 객체를 Pydantic 모델로 읽어올 때 필요
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)    # ORM 객체를 Pydantic 모델로 읽어올 때 필요
+
+class JobApplicationSummary(BaseModel):
+    """기업 지원 목록용 요약 (이력서 스냅샷 제외)"""
+    id: int                          # 지원 PK
+    user_id: int                     # 지원자 사용자 PK
+    job_posting_id: int              # 지원된 채용공고 PK
+    job_posting_title: str           # 채용공고 제목
+    applicant_name: Optional[str] = Field(None, description="지원 시점 지원자 이름")
+    status: ApplicationStatusEnum    # 지원 상태
+    created_at: datetime             # 생성 시각
+    updated_at: datetime             # 수정 시각
+
+    model_config = ConfigDict(from_attributes=True)
+
+class ApplicationStatusChange(BaseModel):
+    """상태가 변경된 지원 한 건"""
+    id: int
+    user_id: int
+    job_posting_id: int
+    status: ApplicationStatusEnum
+    updated_at: datetime
+
+class JobApplicationBulkStatusResponse(BaseModel):
+    """일괄 상태 변경 결과"""
+    updated: list[ApplicationStatusChange] = Field(..., description="상태가 변경된 지원 목록")
+    missing_ids: list[int] = Field(..., description="자사 공고의 지원이 아니거나 존재하지 않아 변경되지 않은 ID")
+
+class PostingApplicationStats(BaseModel):
+    """공고별 지원 현황 (상태별 지원 수, 최근 지원 시각)"""
+    job_posting_id: int
+    job_posting_title: str
+    total: int = Field(..., description="전체 지원 수")
+    status_counts: dict[ApplicationStatusEnum, int] = Field(..., description="상태별 지원 수 (모든 상태 포함)")
+    latest_applied_at: Optional[datetime] = Field(None, description="가장 최근 지원 시각 (지원이 없으면 null)")
+
+class PaginatedJobApplicationSummaryResponse(BaseModel):
+    """커서 기반으로 페이지네이션된 기업 지원 목록 응답"""
+    items: list[JobApplicationSummary]
+    limit: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 조회용 커서 (마지막 페이지면 null)")
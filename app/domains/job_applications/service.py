@@ -1,100 +1,210 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy import delete, exists, func, literal, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.future import select
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import joinedload, noload, selectinload
 
-from app.models import JobApplication, Resume, JobPosting, CompanyUser, User
+from app.models import JobApplication, Resume, ResumeSnapshot, JobPosting, CompanyInfo, CompanyUser, User
+from app.core.config import APPLICATION_EXPORT_BATCH_SIZE
+from app.core.cursor import decode_keyset_cursor, encode_keyset_cursor
+from app.core.datetime_utils import get_now_utc
 from app.domains.job_applications.schemas import ApplicationStatusEnum
-from app.domains.job_applications.utils import build_resume_snapshot, send_resume_email
+from app.domains.job_applications.outbox import build_enqueue_email
+from app.domains.job_applications.utils import (
+    build_resume_snapshot,
+    flatten_application_row,
+    format_export_rows,
+    hash_resume_snapshot,
+    render_resume_email,
+)
 from app.core.logger import logger
 
 
+async def _adjust_application_count(
+    session: AsyncSession, job_posting_id: int, delta: int
+) -> None:
+    """공고의 지원자 수 카운터를 원자적으로 증감 (커밋은 호출한 쪽에서 수행)"""
+    await session.execute(
+        update(JobPosting)
+        .where(JobPosting.id == job_posting_id)
+        .values(application_count=JobPosting.application_count + delta)
+    )
+
+
+def _delete_unreferenced_snapshots():
+    """어떤 지원도 참조하지 않는 이력서 스냅샷을 삭제하는 DELETE 문 (where 조건을 더해 대상 한정 가능)"""
+    return delete(ResumeSnapshot).where(
+        ~exists().where(JobApplication.snapshot_hash == ResumeSnapshot.hash)
+    )
+
+
+async def purge_orphan_resume_snapshots(session: AsyncSession) -> int:
+    """
+    참조하는 지원이 없는 이력서 스냅샷 삭제 (스케줄러 작업)
+    지원 취소는 바로 정리하지만 회원 탈퇴·공고 삭제 cascade나 관리자 화면에서 삭제된 지원의 스냅샷은 여기서 정리한다.
+    """
+    result = await session.execute(_delete_unreferenced_snapshots())
+    await session.commit()
+    return result.rowcount
+
+
 # 사용자가 채용공고에 대해 본인의 이력서로 지원
 async def create_application(
     user_id: int,  # 사용자 ID
     job_posting_id: int,  # 채용공고 ID
     session: AsyncSession,  # DB 세션
-) -> JobApplication:
-    """사용자의 이력서를 채용공고에 지원"""
+    applicant: Optional[User] = None,  # 인증된 지원자 (없으면 조회)
+) -> dict:
+    """
+    사용자의 최신 이력서를 채용공고에 지원
+    (이력서 조회 1회 + 공고/담당자 조회 1회 + INSERT 1회 + 커밋, 중복 지원은 유니크 제약 충돌로 판단)
+    담당자에게 보낼 이력서 메일은 같은 트랜잭션에서 아웃박스에 기록하고, 발송은 스케줄러 워커가 담당한다.
+    """
     try:
         logger.info("이력서 조회 시작")  # 이력서 조회 로그 출력
-        resume = await session.execute(
+        resume = (await session.execute(
             select(Resume)
+            .options(
+                noload(Resume.user),  # 지원자는 인증된 사용자 객체 사용
+                noload(Resume.applications),  # 스냅샷에 필요 없는 지원 내역은 로드하지 않음
+                joinedload(Resume.educations),  # 학력/경력은 같은 쿼리에서 함께 로드
+                joinedload(Resume.experiences),
+            )
             .filter(Resume.user_id == user_id)  # 해당 사용자의 이력서 중
             .order_by(Resume.created_at.desc())  # 가장 최근에 생성된 것
             .limit(1)
-        )
-        resume = resume.scalar_one_or_none()  # 단일 객체 반환
+        )).unique().scalar_one_or_none()  # 단일 객체 반환
         if not resume:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "지원할 이력서가 없습니다.")  # 없으면 404 반환
 
-        logger.info("채용공고 검증 시작")  # 채용공고 조회 로그 출력
-        job = await session.get(JobPosting, job_posting_id)  # 채용공고 조회
+        logger.info("채용공고 검증 시작")  # 채용공고와 담당자 이메일을 한 번에 조회
+        job = (await session.execute(
+            select(
+                JobPosting.id,
+                JobPosting.title,
+                JobPosting.company_id,
+                JobPosting.recruit_period_start,
+                JobPosting.recruit_period_end,
+                JobPosting.work_address,
+                JobPosting.work_place_name,
+                CompanyInfo.id.label("author_company_id"),
+                CompanyInfo.manager_email,
+            )
+            .outerjoin(CompanyUser, CompanyUser.id == JobPosting.author_id)
+            .outerjoin(CompanyInfo, CompanyInfo.id == CompanyUser.company_id)
+            .where(JobPosting.id == job_posting_id)
+        )).one_or_none()
         if job is None:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "채용공고가 존재하지 않습니다.")
 
-        logger.info("중복 지원 검증 시작")  # 기존 지원 여부 체크
-        existing_app = await session.execute(
-            select(JobApplication).filter(
-                JobApplication.user_id == user_id,
-                JobApplication.job_posting_id == job_posting_id,
-            )
-        )
-        if existing_app.scalar_one_or_none():  # 이미 지원한 경우
-            raise HTTPException(status.HTTP_409_CONFLICT, "이미 지원한 공고입니다.")
-
-        applicant = await session.get(User, user_id)  # 지원자 정보 조회 
+        if applicant is None:
+            applicant = await session.get(User, user_id)  # 지원자 정보 조회
         if not applicant:
             # 이 경우는 발생하기 어렵지만, 방어적으로 처리
             logger.error(f"지원자 정보를 찾을 수 없습니다: user_id={user_id}")
             raise HTTPException(status.HTTP_404_NOT_FOUND, "지원자 정보를 찾을 수 없습니다.")
 
         snapshot = build_resume_snapshot(resume, applicant)  # 수정된 함수 호출: applicant 전달
+        snapshot_hash = hash_resume_snapshot(snapshot)  # 같은 내용의 스냅샷은 한 번만 저장
+        now = get_now_utc()
 
-        new_app = JobApplication(
-            user_id=user_id,  # 사용자 ID
-            resume_id=resume.id,  # 이력서 ID
-            job_posting_id=job_posting_id,  # 채용공고 ID
-            resumes_data=snapshot,  # 스냅샷 데이터
-            status=ApplicationStatusEnum.applied,  # 초기 상태
+        # 지원 레코드 추가와 공고 지원자 수 증가, 스냅샷 저장을 한 문장으로 실행
+        # (이미 지원한 공고면 유니크 제약 충돌로 아무것도 추가/증가하지 않고 빈 결과 반환)
+        inserted = (
+            pg_insert(JobApplication)
+            .values(
+                user_id=user_id,  # 사용자 ID
+                resume_id=resume.id,  # 이력서 ID
+                job_posting_id=job_posting_id,  # 채용공고 ID
+                snapshot_hash=snapshot_hash,  # 스냅샷 해시
+                status=ApplicationStatusEnum.applied,  # 초기 상태
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing()
+            .returning(
+                JobApplication.id,
+                JobApplication.job_posting_id,
+                JobApplication.status,
+                JobApplication.created_at,
+                JobApplication.updated_at,
+            )
+            .cte("inserted")
+        )
+        counted = (
+            update(JobPosting)
+            .where(JobPosting.id == inserted.c.job_posting_id)
+            .values(application_count=JobPosting.application_count + 1)
+            .cte("counted")
         )
+        stored = (
+            pg_insert(ResumeSnapshot)
+            .from_select(
+                ["hash", "data", "created_at"],
+                select(
+                    literal(snapshot_hash, ResumeSnapshot.hash.type),
+                    literal(snapshot, ResumeSnapshot.data.type),
+                    literal(now, ResumeSnapshot.created_at.type),
+                ).select_from(inserted),  # 지원 레코드가 추가된 경우에만 저장
+            )
+            .on_conflict_do_nothing()  # 같은 내용의 스냅샷이 이미 있으면 그대로 참조
+            .cte("stored")
+        )
+        statement = select(inserted).add_cte(counted).add_cte(stored)
+
+        if job.author_company_id is not None:  # 회사 정보가 있으면
+            email = job.manager_email  # 담당자 이메일 가져오기
+            if not email:
+                logger.warning(f"이메일 주소가 존재하지 않아 전송이 중단되었습니다. company_id={job.author_company_id}")
+            else:
+                try:
+                    message = render_resume_email(job.title, applicant, snapshot)
+                except Exception as e:
+                    message = None  # 메일 생성에 실패해도 지원은 진행
+                    logger.warning(f"이력서 메일 생성 실패: {e}")
+                if message is not None:
+                    # 지원 레코드가 추가된 경우에만 아웃박스에 이력서 메일 추가
+                    outboxed = build_enqueue_email(to_email=email, source=inserted, **message).cte("outboxed")
+                    statement = statement.add_cte(outboxed)
 
         try:
             logger.info("신규 지원 레코드 추가 시작")  # DB 삽입 시작 로그
-            session.add(new_app)  # 새 지원 추가
+            new_app = (await session.execute(statement)).one_or_none()
+            if new_app is None:  # 이미 지원한 경우
+                await session.rollback()
+                raise HTTPException(status.HTTP_409_CONFLICT, "이미 지원한 공고입니다.")
             await session.commit()  # 커밋
-            await session.refresh(new_app)  # 최신 상태 반영
+        except HTTPException:
+            raise
         except Exception as e:
             await session.rollback()  # 에러 발생 시 롤백
             logger.warning(f"DB 커밋 중 오류: {e}")  # 경고 로그 출력
             raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, f"지원 생성 중 오류: {str(e)}")
 
-        logger.info("이메일 발송 시작")  # 이메일 전송 로그
-        author = await session.get(CompanyUser, job.author_id)  # 기업 사용자 정보 조회
-        # applicant = await session.get(User, user_id)  # 지원자 정보 조회 (위에서 이미 조회했으므로 중복 제거)
-
-        if author and author.company:  # 회사 정보가 있으면
-            email = author.company.manager_email  # 담당자 이메일 가져오기
-            if not email:
-                logger.warning(f"이메일 주소가 존재하지 않아 전송이 중단되었습니다. company_id={author.company.id}")
-            else:
-                logger.info(f"이메일 전송 시도: {email}")
-                await send_resume_email(  # 이메일 전송 함수 호출
-                    job_title=job.title,
-                    applicant=applicant,
-                    resume=snapshot,
-                    to_email=email
-                )
-        res = await session.execute(
-            select(JobApplication)
-            .options(selectinload(JobApplication.job_posting))
-            .where(JobApplication.id == new_app.id)
-        )
-        new_app = res.scalar_one()  # 관계 필드 포함된 완전한 객체로 다시 불러오기
-        return new_app  # 최종 결과 반환
+        # 응답은 INSERT 결과와 위에서 조회한 공고 정보로 구성 (재조회 없음)
+        return {
+            "id": new_app.id,
+            "user_id": user_id,
+            "job_posting_id": job_posting_id,
+            "job_posting": {
+                "id": job.id,
+                "title": job.title,
+                "company_id": job.company_id,
+                "recruit_period_start": job.recruit_period_start,
+                "recruit_period_end": job.recruit_period_end,
+                "work_address": job.work_address,
+                "work_place_name": job.work_place_name,
+            },
+            "resumes_data": snapshot,
+            "status": new_app.status,
+            "created_at": new_app.created_at,
+            "updated_at": new_app.updated_at,
+        }
     except HTTPException:
         raise  # HTTP 예외는 그대로 다시 발생
     except SQLAlchemyError as e:
@@ -114,6 +224,7 @@ async def get_user_applications(
         res = await session.execute(
             select(JobApplication, JobPosting)
             .join(JobPosting, JobApplication.job_posting_id == JobPosting.id)
+            .options(joinedload(JobApplication.snapshot))  # 응답에 이력서 스냅샷 포함
             .filter(JobApplication.user_id == user_id)
             .order_by(JobApplication.created_at.desc())
         )
@@ -134,7 +245,7 @@ async def get_user_applications(
                     "work_address": posting.work_address,
                     "work_place_name": posting.work_place_name,
                 },
-                "resumes_data": application.resumes_data,
+                "resumes_data": application.resume_snapshot,
                 "status": application.status.value,
                 "created_at": application.created_at,
                 "updated_at": application.updated_at,
@@ -154,7 +265,7 @@ async def get_user_application_detail(
     try:
         res = await session.execute(
             select(JobApplication)
-            .options(selectinload(JobApplication.job_posting))  # 관계 미리 로딩
+            .options(selectinload(JobApplication.job_posting), joinedload(JobApplication.snapshot))  # 관계 미리 로딩
             .filter(
                 JobApplication.user_id == user_id,
                 JobApplication.job_posting_id == job_posting_id,
@@ -182,6 +293,16 @@ async def delete_application(
         if app is None:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "지원 내역이 없습니다.")
         await session.delete(app)
+        await _adjust_application_count(session, app.job_posting_id, -1)  # 공고 지원자 수 감소
+        if app.snapshot_hash is not None:
+            # 다른 지원이 참조하지 않으면 이력서 스냅샷(개인정보)도 함께 삭제
+            try:
+                async with session.begin_nested():
+                    await session.execute(
+                        _delete_unreferenced_snapshots().where(ResumeSnapshot.hash == app.snapshot_hash)
+                    )
+            except IntegrityError:
+                pass  # 동시에 같은 스냅샷으로 지원이 추가되어 참조 중이면 유지
         await session.commit()
     except SQLAlchemyError as e:
         await session.rollback()
@@ -189,22 +310,173 @@ async def delete_application(
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, f"지원 취소 중 오류: {str(e)}")
 
 
+def _filter_company_applications(
+    query,
+    company_user: CompanyUser,
+    job_posting_id: Optional[int],
+    status_val: Optional[ApplicationStatusEnum],
+    created_from: Optional[datetime],
+    created_to: Optional[datetime],
+):
+    """기업 지원 목록/내보내기 공통 조건 (자사 공고의 지원만, 공고·상태·지원 시각 필터)"""
+    query = query.filter(JobPosting.company_id == company_user.company_id)
+    if job_posting_id is not None:
+        query = query.filter(JobApplication.job_posting_id == job_posting_id)
+    if status_val is not None:
+        query = query.filter(JobApplication.status == status_val)
+    if created_from is not None:
+        query = query.filter(JobApplication.created_at >= created_from)
+    if created_to is not None:
+        query = query.filter(JobApplication.created_at < created_to)
+    return query
+
+
 async def get_company_applications(
+    company_user: CompanyUser,
+    session: AsyncSession,
+    job_posting_id: Optional[int] = None,  # 특정 공고만
+    status_val: Optional[ApplicationStatusEnum] = None,  # 특정 상태만
+    created_from: Optional[datetime] = None,  # 지원 시각 시작 (이상)
+    created_to: Optional[datetime] = None,  # 지원 시각 끝 (미만)
+    cursor: Optional[str] = None,  # 이전 응답의 next_cursor
+    limit: int = 20,
+) -> dict:
+    """
+    기업유저가 자사 공고에 받은 지원 목록을 최신순 커서 페이지네이션으로 조회
+    (이력서 스냅샷은 제외하고 목록에 필요한 컬럼만 조회, 스냅샷은 상세 조회에서 제공)
+    """
+    if cursor is not None:
+        try:
+            last_created_at, last_id = decode_keyset_cursor(cursor, parse=datetime.fromisoformat)
+        except ValueError as e:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e))
+    try:
+        query = (
+            select(
+                JobApplication.id,
+                JobApplication.user_id,
+                JobApplication.job_posting_id,
+                JobPosting.title.label("job_posting_title"),
+                func.coalesce(
+                    ResumeSnapshot.data["applicant_name"].as_string(),
+                    JobApplication.resumes_data["applicant_name"].as_string(),  # 이전 방식으로 저장된 지원
+                ).label("applicant_name"),
+                JobApplication.status,
+                JobApplication.created_at,
+                JobApplication.updated_at,
+            )
+            .join(JobPosting, JobApplication.job_posting_id == JobPosting.id)
+            .outerjoin(ResumeSnapshot, JobApplication.snapshot_hash == ResumeSnapshot.hash)
+        )
+        query = _filter_company_applications(
+            query, company_user, job_posting_id, status_val, created_from, created_to
+        )
+        if cursor is not None:
+            # (created_at, id) 기준 keyset 조건 (id를 보조 정렬 키로 사용해 커서 위치를 유일하게 함)
+            query = query.filter(
+                tuple_(JobApplication.created_at, JobApplication.id) < (last_created_at, last_id)
+            )
+        query = query.order_by(JobApplication.created_at.desc(), JobApplication.id.desc()).limit(limit)
+
+        items = (await session.execute(query)).mappings().all()
+        next_cursor = None
+        if len(items) == limit:  # 페이지가 가득 찼으면 마지막 지원 기준으로 다음 커서 생성
+            next_cursor = encode_keyset_cursor(items[-1]["created_at"], items[-1]["id"])
+        return {"items": items, "limit": limit, "next_cursor": next_cursor}
+    except SQLAlchemyError as e:
+        await session.rollback()
+        logger.warning(f"회사 지원 내역 조회 중 SQLAlchemy 에러: {e}")
+        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, f"회사 지원 내역 조회 중 오류: {str(e)}")
+
+
+async def stream_company_applications(
+    company_user: CompanyUser,
+    bind: AsyncEngine,
+    export_format: str,
+    job_posting_id: Optional[int] = None,  # 특정 공고만
+    status_val: Optional[ApplicationStatusEnum] = None,  # 특정 상태만
+    created_from: Optional[datetime] = None,  # 지원 시각 시작 (이상)
+    created_to: Optional[datetime] = None,  # 지원 시각 끝 (미만)
+) -> AsyncIterator[str]:
+    """
+    기업유저가 자사 공고에 받은 지원 전체를 CSV/NDJSON 텍스트 조각으로 내보내기 (StreamingResponse 본문용)
+    서버 측 커서로 APPLICATION_EXPORT_BATCH_SIZE건씩 읽어 바로 펼쳐 내보내므로 지원 수와 관계없이 메모리 사용량이 일정하다.
+    응답 본문은 요청 세션이 닫힌 뒤 전송되므로 같은 엔진(bind)으로 내보내기 전용 세션을 열어 사용한다.
+    """
+    query = (
+        select(
+            JobApplication.id,
+            JobApplication.job_posting_id,
+            JobPosting.title.label("job_posting_title"),
+            JobApplication.status,
+            JobApplication.created_at,
+            JobApplication.updated_at,
+            func.coalesce(ResumeSnapshot.data, JobApplication.resumes_data).label("resumes_data"),  # 이전 방식으로 저장된 지원 포함
+        )
+        .join(JobPosting, JobApplication.job_posting_id == JobPosting.id)
+        .outerjoin(ResumeSnapshot, JobApplication.snapshot_hash == ResumeSnapshot.hash)
+    )
+    query = _filter_company_applications(
+        query, company_user, job_posting_id, status_val, created_from, created_to
+    )
+    query = (
+        query.order_by(JobApplication.created_at.desc(), JobApplication.id.desc())
+        .execution_options(yield_per=APPLICATION_EXPORT_BATCH_SIZE)
+    )
+
+    async with AsyncSession(bind) as session:
+        try:
+            result = await session.stream(query)
+            include_header = True
+            async for rows in result.partitions():
+                yield format_export_rows(
+                    [flatten_application_row(row) for row in rows], export_format, include_header
+                )
+                include_header = False
+            if include_header:  # 지원이 없어도 CSV 헤더는 내보냄
+                yield format_export_rows([], export_format, include_header)
+        except SQLAlchemyError as e:
+            # 응답 헤더가 이미 전송되어 HTTP 오류로 바꿀 수 없으므로 기록 후 연결을 끊음
+            logger.warning(f"지원자 내보내기 중 SQLAlchemy 에러: {e}")
+            raise
+
+
+async def get_company_application_stats(
     company_user: CompanyUser, session: AsyncSession
-) -> List[JobApplication]:
-    """기업유저가 자사 공고에 받은 모든 지원 리스트 조회"""
+) -> List[dict]:
+    """기업유저의 공고별 상태별 지원 수와 최근 지원 시각을 한 번의 그룹 쿼리로 집계"""
     try:
+        status_counts = [
+            func.count(JobApplication.id).filter(JobApplication.status == status_enum).label(status_enum.name)
+            for status_enum in ApplicationStatusEnum
+        ]
         res = await session.execute(
-            select(JobApplication)
-            .join(JobPosting)
+            select(
+                JobPosting.id,
+                JobPosting.title,
+                func.count(JobApplication.id).label("total"),
+                func.max(JobApplication.created_at).label("latest_applied_at"),
+                *status_counts,
+            )
+            .outerjoin(JobApplication, JobApplication.job_posting_id == JobPosting.id)  # 지원이 없는 공고도 포함
             .filter(JobPosting.company_id == company_user.company_id)
-            .order_by(JobApplication.created_at.desc())
+            .group_by(JobPosting.id)
+            .order_by(JobPosting.created_at.desc(), JobPosting.id.desc())
         )
-        return res.scalars().all()
+        return [
+            {
+                "job_posting_id": row.id,
+                "job_posting_title": row.title,
+                "total": row.total,
+                "status_counts": {status_enum: row._mapping[status_enum.name] for status_enum in ApplicationStatusEnum},
+                "latest_applied_at": row.latest_applied_at,
+            }
+            for row in res.all()
+        ]
     except SQLAlchemyError as e:
         await session.rollback()
-        logger.warning(f"회사 지원 내역 조회 중 SQLAlchemy 에러: {e}")
-        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, f"회사 지원 내역 조회 중 오류: {str(e)}")
+        logger.warning(f"공고별 지원 현황 집계 중 SQLAlchemy 에러: {e}")
+        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, f"공고별 지원 현황 조회 중 오류: {str(e)}")
 
 
 async def get_company_application_detail(
@@ -215,6 +487,7 @@ async def get_company_application_detail(
         res = await session.execute(
             select(JobApplication)
             .join(JobPosting)
+            .options(joinedload(JobApplication.snapshot))  # 응답에 이력서 스냅샷 포함
             .filter(
                 JobApplication.id == application_id,
                 JobPosting.company_id == company_user.company_id,
@@ -250,3 +523,40 @@ async def update_application_status(
     except Exception as e:
         logger.warning(f"예상치 못한 오류 발생: {e}")
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "예상치 못한 오류 발생")
+
+
+async def bulk_update_application_status(
+    company_user: CompanyUser,
+    application_ids: List[int],
+    status_val: ApplicationStatusEnum,
+    session: AsyncSession,
+) -> dict:
+    """기업유저가 자사 공고에 받은 여러 지원의 상태를 UPDATE 한 번으로 변경 (변경된 행은 RETURNING으로 반환)"""
+    try:
+        res = await session.execute(
+            update(JobApplication)
+            .where(
+                JobApplication.id.in_(application_ids),
+                JobApplication.job_posting_id == JobPosting.id,
+                JobPosting.company_id == company_user.company_id,  # 자사 공고의 지원만 변경
+            )
+            .values(status=status_val, updated_at=get_now_utc())
+            .returning(
+                JobApplication.id,
+                JobApplication.user_id,
+                JobApplication.job_posting_id,
+                JobApplication.status,
+                JobApplication.updated_at,
+            )
+        )
+        updated = res.mappings().all()
+        await session.commit()
+        updated_ids = {row["id"] for row in updated}
+        return {
+            "updated": updated,
+            "missing_ids": [i for i in dict.fromkeys(application_ids) if i not in updated_ids],
+        }
+    except SQLAlchemyError as e:
+        await session.rollback()
+        logger.warning(f"지원 상태 일괄 변경 중 SQLAlchemy 에러: {e}")
+        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, f"지원 상태 일괄 변경 중 오류: {str(e)}")
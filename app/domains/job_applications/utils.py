@@ -1,3 +1,7 @@
+import csv
+import hashlib
+import io
+import json
 import os
 from email.message import EmailMessage
 from typing import Optional
@@ -16,6 +20,12 @@ jinja_env = Environment(
     autoescape=select_autoescape(["html", "xml"])
 )
 
+def hash_resume_snapshot(snapshot: dict) -> str:
+    """스냅샷 내용의 SHA-256 hex (키 정렬, 공백 없는 JSON 기준, resume_snapshots의 키로 사용)"""
+    canonical = json.dumps(snapshot, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 async def send_email(
     to_email: str,
     subject: str,
@@ -76,25 +86,106 @@ def build_resume_snapshot(resume: Resume, applicant: User) -> dict:
         ],
     }
 
-async def send_resume_email(
-    job_title: str,
-    applicant: dict,
-    resume: dict,
-    to_email: str,
-) -> None:
-    try:
-        template = jinja_env.get_template("resume_email.html")
-        html = template.render(
-            job_title=job_title,
-            applicant=applicant,
-            resume=resume,
-        )
-        await send_email(
-            to_email=to_email,
-            subject=f"[{job_title}] 지원자 이력서",
-            html_content=html,
-            text_content="지원자 이력서를 확인해주세요.",
-        )
-    except Exception as e:
-        import logging
-        logging.warning(f"이메일 전송 실패: {e}")
+def render_resume_email(job_title: str, applicant, resume: dict) -> dict:
+    """지원자 이력서 메일의 제목/본문 생성 (send_email 인자 형태로 반환)"""
+    template = jinja_env.get_template("resume_email.html")
+    html = template.render(
+        job_title=job_title,
+        applicant=applicant,
+        resume=resume,
+    )
+    return {
+        "subject": f"[{job_title}] 지원자 이력서",
+        "html_content": html,
+        "text_content": "지원자 이력서를 확인해주세요.",
+    }
+
+
+# --- 지원자 내보내기(CSV/NDJSON) 헬퍼 ---
+# 내보내기 행은 지원 정보와 이력서 스냅샷을 펼친 평평한 dict이며 두 형식 모두 같은 필드를 사용한다.
+
+APPLICATION_EXPORT_FIELDS = [
+    "application_id",
+    "job_posting_id",
+    "job_posting_title",
+    "status",
+    "applied_at",
+    "updated_at",
+    "applicant_name",
+    "applicant_gender",
+    "applicant_email",
+    "applicant_phone_number",
+    "desired_area",
+    "introduction",
+    "resume_image",
+    "educations",
+    "experiences",
+]
+
+
+def _period(item: dict) -> str:
+    start, end = item.get("start_date"), item.get("end_date")
+    return f"{start or ''}~{end or ''}" if start or end else ""
+
+
+def _describe(*parts, details=()) -> str:
+    """값이 있는 항목만 공백으로 잇고 세부 항목은 괄호로 덧붙임 (예: '서울고 (고등학교, 졸업, 2001-03-01~2004-02-01)')"""
+    details = ", ".join(str(detail) for detail in details if detail)
+    return " ".join(str(part) for part in [*parts, f"({details})" if details else None] if part)
+
+
+def flatten_application_row(row) -> dict:
+    """지원 한 건(내보내기 쿼리 행)을 내보내기 필드의 평평한 dict로 변환 (학력/경력은 각각 한 칸의 문자열로 합침)"""
+    snapshot = row.resumes_data or {}
+    educations = [
+        _describe(edu.get("school_name"), details=(edu.get("education_type"), edu.get("education_status"), _period(edu)))
+        for edu in snapshot.get("educations") or []
+    ]
+    experiences = [
+        _describe(exp.get("company_name"), exp.get("position"), details=(_period(exp), exp.get("description")))
+        for exp in snapshot.get("experiences") or []
+    ]
+    return {
+        "application_id": row.id,
+        "job_posting_id": row.job_posting_id,
+        "job_posting_title": row.job_posting_title,
+        "status": row.status.value,
+        "applied_at": row.created_at.isoformat(),
+        "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+        "applicant_name": snapshot.get("applicant_name"),
+        "applicant_gender": snapshot.get("applicant_gender"),
+        "applicant_email": snapshot.get("applicant_email"),
+        "applicant_phone_number": snapshot.get("applicant_phone_number"),
+        "desired_area": snapshot.get("desired_area"),
+        "introduction": snapshot.get("introduction"),
+        "resume_image": snapshot.get("resume_image"),
+        "educations": " / ".join(educations),
+        "experiences": " / ".join(experiences),
+    }
+
+
+# 스프레드시트가 수식으로 해석하는 시작 문자 (CSV/수식 인젝션 방지)
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_safe(value):
+    """지원자가 입력한 문자열이 엑셀 등에서 수식으로 실행되지 않도록 수식 시작 문자 앞에 ' 를 붙임"""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def format_export_rows(rows: list[dict], export_format: str, include_header: bool = False) -> str:
+    """
+    펼친 행 묶음을 CSV 또는 NDJSON 텍스트 조각으로 변환 (CSV 첫 조각은 엑셀 한글 인식을 위한 BOM과 헤더 포함)
+    CSV는 스프레드시트에서 열리므로 수식으로 해석될 값을 무력화하고, NDJSON은 원래 값을 그대로 내보낸다.
+    """
+    if export_format == "ndjson":
+        return "".join(json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in rows)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=APPLICATION_EXPORT_FIELDS)
+    if include_header:
+        buffer.write("\ufeff")
+        writer.writeheader()
+    writer.writerows({key: _csv_safe(value) for key, value in row.items()} for row in rows)
+    return buffer.getvalue()
@@ -0,0 +1,275 @@
+import asyncio
+import heapq
+import logging
+import math
+import time
+from array import array
+from datetime import date, datetime, time as dt_time, timezone
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job_postings import JobCategoryEnum, JobPosting, PaymentMethodEnum
+from app.models.job_posting_age_stats import JobPostingAgeStat
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 직무 카테고리 -> 정수 인덱스 (특성 배열에 1바이트로 저장)
+CATEGORY_INDEX = {category: index for index, category in enumerate(JobCategoryEnum)}
+
+# 급여 지급 방식 -> 정수 인덱스 (지급 방식이 없으면 -1)
+PAYMENT_INDEX = {method: index for index, method in enumerate(PaymentMethodEnum)}
+
+# 추천 점수 가중치 (각 특성은 0~1 범위)
+RECOMMEND_WEIGHTS = {
+    "recency": 1.0,     # 최신 등록
+    "deadline": 0.5,    # 마감 임박
+    "popularity": 0.3,  # 전체 지원자 수
+    "age": 0.7,         # 같은 연령대 지원자 수
+    "region": 1.5,      # 희망 지역 일치
+    "salary": 0.3,      # 같은 지급 방식 내 상대 급여
+}
+
+# 다른 워커의 변경, 마감일 경과, 지원자 수 변화를 반영하기 위한 전체 재적재 주기
+FULL_REFRESH_SECONDS = 300
+
+SECONDS_PER_DAY = 86400
+
+
+def _to_timestamp(value: Optional[datetime]) -> float:
+    """datetime을 epoch 초로 변환 (None이면 0)"""
+    if value is None:
+        return 0.0
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _date_to_timestamp(value: Optional[date]) -> float:
+    """마감일(date)을 해당 날짜가 끝나는 시점의 epoch 초로 변환 (None이면 0)"""
+    if value is None:
+        return 0.0
+    return datetime.combine(value, dt_time.max, tzinfo=timezone.utc).timestamp()
+
+
+class RecommendationEngine:
+    """
+    모집 중인 공고의 특성을 메모리에 압축 보관하고, 사용자 조건으로 점수를 매겨 상위 공고 ID를 반환하는 추천 엔진.
+
+    특성은 공고별 병렬 배열(array)로 저장한다 (카테고리, 등록/마감 시각, 지원자 수, 급여/지급 방식, 근무지 문자열).
+    급여는 원래 값으로 보관하고 점수 계산 시 지급 방식별 최대 급여로 나누므로 적재 순서와 관계없이 같은 점수가 나온다.
+    공고 생성/수정/삭제 시 레포지토리가 mark_changed/mark_removed를 호출하면 다음 추천 요청 때 해당 공고만 다시 읽고,
+    FULL_REFRESH_SECONDS마다 전체를 다시 적재한다. 워커 프로세스마다 별도로 유지된다.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._loaded_at = 0.0
+        self._changed_ids: set[int] = set()
+        self._reset()
+
+    def _reset(self) -> None:
+        """특성 배열 초기화"""
+        self.ids = array("i")
+        self.categories = array("b")
+        self.created_ts = array("d")
+        self.deadline_ts = array("d")  # 0이면 상시 채용/마감일 없음
+        self.application_counts = array("i")
+        self.salaries = array("q")
+        self.payment_methods = array("b")
+        self.locations: List[str] = []
+        self._index_by_id: Dict[int, int] = {}
+        self._by_category: Dict[int, List[int]] = {}
+        self._max_salary: Optional[Dict[int, int]] = None  # 지급 방식 -> 최대 급여 (공고가 바뀌면 다시 계산)
+        self.age_counts: Dict[int, Dict[int, int]] = {}  # 연령대 -> {공고 ID: 지원자 수}
+
+    def __len__(self) -> int:
+        return len(self._index_by_id)
+
+    # --- 변경 알림 (레포지토리에서 호출) ---
+
+    def mark_changed(self, posting_id: int) -> None:
+        """공고가 생성/수정되었음을 기록 (다음 추천 요청 때 다시 읽음)"""
+        self._changed_ids.add(posting_id)
+
+    def mark_removed(self, posting_id: int) -> None:
+        """공고가 삭제되었음을 반영 (즉시 추천 대상에서 제외)"""
+        self._changed_ids.discard(posting_id)
+        self._remove(posting_id)
+
+    # --- 특성 적재 ---
+
+    @staticmethod
+    def _feature_query():
+        """추천에 필요한 컬럼만 모집 중인 공고에서 조회하는 쿼리"""
+        return select(
+            JobPosting.id,
+            JobPosting.job_category,
+            JobPosting.region1,
+            JobPosting.region2,
+            JobPosting.work_address,
+            JobPosting.salary,
+            JobPosting.payment_method,
+            JobPosting.created_at,
+            JobPosting.recruit_period_end,
+            JobPosting.is_always_recruiting,
+            JobPosting.application_count,
+        ).where(
+            or_(
+                JobPosting.is_always_recruiting.is_(True),
+                JobPosting.recruit_period_end.is_(None),
+                JobPosting.recruit_period_end >= func.current_date(),
+            )
+        )
+
+    def _upsert(self, row) -> None:
+        """조회된 공고 한 건의 특성을 배열에 추가하거나 갱신"""
+        if row.job_category not in CATEGORY_INDEX:
+            self._remove(row.id)
+            return
+        payment = PAYMENT_INDEX.get(row.payment_method, -1)
+        salary = row.salary or 0
+        self._max_salary = None
+        deadline_ts = 0.0 if row.is_always_recruiting else _date_to_timestamp(row.recruit_period_end)
+        location = " ".join(filter(None, (row.region1, row.region2, row.work_address)))
+        category = CATEGORY_INDEX[row.job_category]
+
+        index = self._index_by_id.get(row.id)
+        if index is None:
+            index = len(self.ids)
+            self._index_by_id[row.id] = index
+            self.ids.append(row.id)
+            self.categories.append(category)
+            self.created_ts.append(_to_timestamp(row.created_at))
+            self.deadline_ts.append(deadline_ts)
+            self.application_counts.append(row.application_count or 0)
+            self.salaries.append(salary)
+            self.payment_methods.append(payment)
+            self.locations.append(location)
+            self._by_category.setdefault(category, []).append(index)
+            return
+
+        if self.categories[index] != category:
+            # 카테고리가 바뀌면 기존 버킷에서 빼고 새 버킷에 추가
+            self._by_category[self.categories[index]].remove(index)
+            self._by_category.setdefault(category, []).append(index)
+            self.categories[index] = category
+        self.created_ts[index] = _to_timestamp(row.created_at)
+        self.deadline_ts[index] = deadline_ts
+        self.application_counts[index] = row.application_count or 0
+        self.salaries[index] = salary
+        self.payment_methods[index] = payment
+        self.locations[index] = location
+
+    def _remove(self, posting_id: int) -> None:
+        """공고를 추천 대상에서 제외 (배열 자리는 다음 전체 재적재 때 정리)"""
+        index = self._index_by_id.pop(posting_id, None)
+        if index is None:
+            return
+        self._by_category[self.categories[index]].remove(index)
+        self._max_salary = None
+
+    def _salary_maxima(self) -> Dict[int, int]:
+        """추천 대상 공고의 지급 방식별 최대 급여 (공고 추가/수정/제외 후 처음 호출될 때 다시 계산)"""
+        if self._max_salary is None:
+            maxima: Dict[int, int] = {}
+            for index in self._index_by_id.values():
+                payment = self.payment_methods[index]
+                maxima[payment] = max(maxima.get(payment, 0), self.salaries[index])
+            self._max_salary = maxima
+        return self._max_salary
+
+    async def _load_all(self, session: AsyncSession) -> None:
+        """모집 중인 공고 전체와 연령대별 지원자 수 집계를 다시 적재"""
+        rows = (await session.execute(self._feature_query())).all()
+        age_rows = (await session.execute(
+            select(
+                JobPostingAgeStat.age_group,
+                JobPostingAgeStat.job_posting_id,
+                JobPostingAgeStat.application_count,
+            )
+        )).all()
+
+        self._reset()
+        for row in rows:
+            self._upsert(row)
+        for age_group, posting_id, count in age_rows:
+            self.age_counts.setdefault(age_group, {})[posting_id] = count
+        self._changed_ids.clear()
+        self._loaded_at = time.monotonic()
+        logger.info(f"추천 엔진 전체 적재 완료: 공고 {len(self)}개")
+
+    async def _load_changed(self, session: AsyncSession) -> None:
+        """변경 알림을 받은 공고만 다시 읽어 반영 (마감되었거나 조건에서 빠진 공고는 제외)"""
+        changed_ids = list(self._changed_ids)
+        self._changed_ids.clear()
+        rows = (await session.execute(
+            self._feature_query().where(JobPosting.id.in_(changed_ids))
+        )).all()
+        found = set()
+        for row in rows:
+            self._upsert(row)
+            found.add(row.id)
+        for posting_id in changed_ids:
+            if posting_id not in found:
+                self._remove(posting_id)
+
+    async def ensure_fresh(self, session: AsyncSession) -> None:
+        """추천 전에 특성을 최신 상태로 맞춤 (필요한 경우에만 DB 조회)"""
+        async with self._lock:
+            if not self._loaded_at or time.monotonic() - self._loaded_at > FULL_REFRESH_SECONDS:
+                await self._load_all(session)
+            elif self._changed_ids:
+                await self._load_changed(session)
+
+    # --- 점수 계산 ---
+
+    def top_ids(
+        self,
+        categories: Iterable[JobCategoryEnum | str],
+        desired_areas: List[str],
+        age_group: Optional[int],
+        k: int,
+        now: Optional[float] = None,
+    ) -> List[int]:
+        """
+        관심 카테고리의 공고를 한 번씩만 훑으며 점수를 계산하고 상위 k개 공고 ID를 점수 순으로 반환.
+        마감일이 지난 공고는 제외한다.
+        """
+        now = time.time() if now is None else now
+        weights = RECOMMEND_WEIGHTS
+        age_counts = self.age_counts.get(age_group, {}) if age_group is not None else {}
+        max_salary = self._salary_maxima()
+
+        candidates: List[int] = []
+        for category in categories:
+            category_index = CATEGORY_INDEX.get(JobCategoryEnum(category))
+            candidates.extend(self._by_category.get(category_index, []))
+
+        def scored():
+            for index in candidates:
+                deadline = self.deadline_ts[index]
+                if deadline and deadline < now:
+                    continue
+                days_old = max(now - self.created_ts[index], 0.0) / SECONDS_PER_DAY
+                score = weights["recency"] / (1.0 + days_old / 7.0)
+                if deadline:
+                    score += weights["deadline"] / (1.0 + (deadline - now) / SECONDS_PER_DAY / 7.0)
+                score += weights["popularity"] * min(math.log1p(self.application_counts[index]) / 5.0, 1.0)
+                payment_max = max_salary.get(self.payment_methods[index])
+                if payment_max:
+                    score += weights["salary"] * self.salaries[index] / payment_max
+                posting_id = self.ids[index]
+                if age_counts:
+                    score += weights["age"] * min(math.log1p(age_counts.get(posting_id, 0)) / 4.0, 1.0)
+                if desired_areas and any(area in self.locations[index] for area in desired_areas):
+                    score += weights["region"]
+                yield score, posting_id
+
+        return [posting_id for _, posting_id in heapq.nlargest(k, scored())]
+
+
+# 워커 프로세스 단위 추천 엔진 인스턴스
+recommendation_engine = RecommendationEngine()
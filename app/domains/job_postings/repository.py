@@ -1,45 +1,159 @@
 from typing import List, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, and_, cast, Date
+from sqlalchemy import select, insert, update, delete, func, desc, asc, and_, or_, case, cast, Integer, tuple_, text
 
+from app.core.cache import TTLCache
+from app.domains.job_postings.recommender import recommendation_engine
+from app.domains.job_postings.schemas import SortOptions
+from app.domains.job_postings.utils import geo_cell_ranges
 from app.models.job_postings import JobPosting
+from app.models.job_posting_age_stats import JobPostingAgeStat
 from app.models.job_applications import JobApplication
 from app.models.users import User
 
 
+# 공고 개수 캐시 (정규화된 필터 조합 -> 개수)
+# 공고 생성/수정/삭제 시 비워지며, 다른 워커의 변경은 TTL 경과 후 반영된다.
+COUNT_CACHE_TTL_SECONDS = 30
+_count_cache = TTLCache(maxsize=512, ttl=COUNT_CACHE_TTL_SECONDS)
+
+# 검색 결과 캐시 (정규화된 검색 조건 + 정렬/페이지 -> 공고 ID 목록)
+# 사용자별 즐겨찾기 여부는 캐시하지 않고, 조회 시 ID 목록을 다시 읽으면서 함께 계산한다.
+SEARCH_CACHE_TTL_SECONDS = 30
+_search_cache = TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL_SECONDS)
+
+
 class JobPostingRepository:
     """채용 공고 데이터베이스 상호작용을 담당하는 레포지토리"""
 
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @staticmethod
+    def _count_cache_key(filters: List, keyword: str | None) -> tuple:
+        """필터 조합을 순서와 무관한 캐시 키로 정규화합니다 (SQL 문자열 + 바인딩 값)."""
+        parts = []
+        for condition in filters or []:
+            compiled = condition.compile()
+            params = tuple(sorted((k, repr(v)) for k, v in compiled.params.items()))
+            parts.append((str(compiled), params))
+        return ("search", (keyword or "").strip().lower(), tuple(sorted(parts)))
+
+    @staticmethod
+    def invalidate_caches() -> None:
+        """공고 데이터가 바뀌었을 때 개수 캐시와 검색 결과 캐시를 비웁니다."""
+        _count_cache.clear()
+        _search_cache.clear()
+
     async def create(self, job_posting_data: dict) -> JobPosting:
         """새로운 채용 공고를 데이터베이스에 생성합니다."""
         job_posting = JobPosting(**job_posting_data)
         self.session.add(job_posting)
         await self.session.commit()
         await self.session.refresh(job_posting)
+        self.invalidate_caches()
+        recommendation_engine.mark_changed(job_posting.id)
         return job_posting
 
     async def get_by_id(self, job_posting_id: int) -> JobPosting | None:
         """ID로 특정 채용 공고를 조회합니다."""
         return await self.session.get(JobPosting, job_posting_id)
 
-    async def list_all(self, skip: int, limit: int) -> List[JobPosting]:
-        """모든 채용 공고 목록을 페이지네이션하여 조회합니다 (최신순)."""
-        query = (
-            select(JobPosting)
-            .order_by(desc(JobPosting.created_at))
-            .offset(skip)
-            .limit(limit)
+    @staticmethod
+    def _select_postings(user_id: int | None = None):
+        """
+        공고 조회용 기본 SELECT를 생성합니다.
+        로그인 사용자면 즐겨찾기 여부를 EXISTS 서브쿼리 컬럼(is_favorited)으로 같은 쿼리에서 함께 조회합니다.
+        """
+        # 순환 참조 방지를 위해 함수 내에서 Favorite 모델 import
+        from app.models.favorites import Favorite
+        if user_id is None:
+            return select(JobPosting)
+        is_favorited = (
+            select(Favorite.id)
+            .where(Favorite.user_id == user_id, Favorite.job_posting_id == JobPosting.id)
+            .exists()
+            .label("is_favorited")
+        )
+        return select(JobPosting, is_favorited)
+
+    @staticmethod
+    def _postings_from_rows(rows) -> List[JobPosting]:
+        """조회 결과 행에서 공고를 꺼내 is_favorited 값을 설정합니다 (비로그인이면 None)."""
+        postings = []
+        for row in rows:
+            posting = row[0]
+            setattr(posting, 'is_favorited', row._mapping.get("is_favorited"))
+            postings.append(posting)
+        return postings
+
+    @staticmethod
+    def _sort_key(sort: SortOptions) -> tuple[Any, bool]:
+        """정렬 옵션에 해당하는 (정렬 컬럼, 내림차순 여부)를 반환합니다."""
+        if sort == SortOptions.SALARY_HIGH:
+            return JobPosting.salary, True
+        if sort == SortOptions.SALARY_LOW:
+            return JobPosting.salary, False
+        return JobPosting.created_at, True # 기본값: 최신순
+
+    def _apply_sort_and_page(
+        self,
+        query,
+        sort: SortOptions,
+        skip: int,
+        limit: int,
+        cursor: tuple[Any, int] | None = None,
+    ):
+        """
+        정렬과 페이지네이션을 적용합니다.
+        커서가 주어지면 (정렬 컬럼, id) 기준 keyset 조건을 사용하고 OFFSET은 무시합니다.
+        """
+        column, descending = self._sort_key(sort)
+        direction = desc if descending else asc
+        # id를 보조 정렬 키로 사용해 같은 값끼리의 순서를 고정 (커서 위치가 유일해짐)
+        query = query.order_by(direction(column), direction(JobPosting.id))
+
+        if cursor is not None:
+            last_value, last_id = cursor
+            row = tuple_(column, JobPosting.id)
+            query = query.where(row < (last_value, last_id) if descending else row > (last_value, last_id))
+            return query.limit(limit)
+        return query.offset(skip).limit(limit)
+
+    async def list_all(
+        self,
+        skip: int,
+        limit: int,
+        cursor: tuple[Any, int] | None = None,
+        user_id: int | None = None,
+    ) -> List[JobPosting]:
+        """모든 채용 공고 목록을 페이지네이션하여 조회합니다 (최신순, 커서 지정 시 keyset, 로그인 시 즐겨찾기 여부 포함)."""
+        query = self._apply_sort_and_page(
+            self._select_postings(user_id), SortOptions.LATEST, skip, limit, cursor
         )
         result = await self.session.execute(query)
-        return result.scalars().all()
+        return self._postings_from_rows(result.all())
 
     async def count_all(self) -> int:
-        """전체 채용 공고 개수를 조회합니다."""
+        """전체 채용 공고 개수를 조회합니다 (캐시 사용)."""
+        cached = _count_cache.get("all")
+        if cached is not None:
+            return cached
         query = select(func.count(JobPosting.id))
-        return await self.session.scalar(query) or 0
+        total = await self.session.scalar(query) or 0
+        _count_cache.set("all", total)
+        return total
+
+    async def estimate_count_all(self) -> int:
+        """
+        플래너 통계(pg_class.reltuples)로 전체 공고 수를 추정합니다.
+        테이블을 스캔하지 않으며, 아직 ANALYZE되지 않은 테이블이면 정확한 개수로 대체합니다.
+        """
+        query = text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)")
+        estimate = await self.session.scalar(query, {"table": JobPosting.__tablename__})
+        if estimate is None or estimate < 0:
+            return await self.count_all()
+        return estimate
 
     async def update(self, job_posting_id: int, update_data: Dict[str, Any]) -> JobPosting | None:
         """기존 채용 공고를 업데이트합니다."""
@@ -55,6 +169,8 @@ class JobPostingRepository:
 
         await self.session.commit()
         await self.session.refresh(job_posting)
+        self.invalidate_caches() # 필터/정렬 대상 컬럼이 바뀌었을 수 있음
+        recommendation_engine.mark_changed(job_posting.id)
         return job_posting
 
     async def delete(self, job_posting_id: int) -> bool:
@@ -65,87 +181,293 @@ class JobPostingRepository:
 
         await self.session.delete(job_posting)
         await self.session.commit()
+        self.invalidate_caches()
+        recommendation_engine.mark_removed(job_posting_id)
         return True
 
+    @staticmethod
+    def _keyword_filter(keyword: str):
+        """키워드 검색 조건 생성 (search_text 컬럼의 pg_trgm GIN 인덱스 사용)"""
+        return JobPosting.search_text.ilike(f"%{keyword}%")
+
+    def _build_search_query(self, filters: List, keyword: str | None, user_id: int | None = None):
+        """검색 조건(필터 + 키워드)이 적용된 기본 쿼리를 생성합니다."""
+        query = self._select_postings(user_id)
+        if keyword:
+            query = query.where(self._keyword_filter(keyword))
+        if filters:
+            query = query.where(*filters)
+        return query
+
     async def search(
         self,
         filters: List,
-        order_by_clause: Any,
+        sort: SortOptions,
         skip: int,
-        limit: int
+        limit: int,
+        keyword: str | None = None,
+        cursor: tuple[Any, int] | None = None,
+        user_id: int | None = None,
     ) -> List[JobPosting]:
-        """필터링, 정렬, 페이지네이션을 적용하여 채용 공고를 검색합니다."""
-        query = select(JobPosting)
-        if filters:
-            query = query.where(*filters)
+        """
+        필터링, 키워드 검색, 정렬, 페이지네이션(offset 또는 커서)을 적용하여 채용 공고를 검색합니다.
+        같은 조건의 결과 ID 목록은 캐시하며, 캐시 적중 시 ID로 공고를 다시 읽습니다.
+        """
+        cache_key = ("page", self._count_cache_key(filters, keyword), sort, skip, limit, cursor)
+        cached_ids = _search_cache.get(cache_key)
+        if cached_ids is not None:
+            return await self.get_many_by_ids(cached_ids, user_id)
 
-        query = query.order_by(order_by_clause).offset(skip).limit(limit)
+        query = self._build_search_query(filters, keyword, user_id)
+        query = self._apply_sort_and_page(query, sort, skip, limit, cursor)
         result = await self.session.execute(query)
-        return result.scalars().all()
+        postings = self._postings_from_rows(result.all())
+        _search_cache.set(cache_key, [p.id for p in postings])
+        return postings
 
-    async def count_search(self, filters: List) -> int:
-        """필터링된 채용 공고의 전체 개수를 계산합니다."""
-        base_query = select(JobPosting)
-        if filters:
-            base_query = base_query.where(*filters)
+    async def search_with_total(
+        self,
+        filters: List,
+        sort: SortOptions,
+        skip: int,
+        limit: int,
+        keyword: str | None = None,
+        user_id: int | None = None,
+    ) -> tuple[List[JobPosting], int]:
+        """
+        검색 결과 페이지와 전체 개수를 한 번의 쿼리로 조회합니다.
+        윈도 함수 count(*) over()는 LIMIT/OFFSET 적용 전에 계산되므로 각 행에 필터링된 전체 개수가 담깁니다.
+        (ID 목록, 전체 개수)는 search와 같은 방식으로 캐시합니다.
+        """
+        cache_key = ("page_total", self._count_cache_key(filters, keyword), sort, skip, limit)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            cached_ids, total = cached
+            return await self.get_many_by_ids(cached_ids, user_id), total
+
+        query = self._build_search_query(filters, keyword, user_id).add_columns(
+            func.count().over().label("total_count")
+        )
+        query = self._apply_sort_and_page(query, sort, skip, limit)
+        rows = (await self.session.execute(query)).all()
+
+        if rows:
+            total = rows[0].total_count
+            # 같은 필터 조합의 이후 count_search 호출이 재사용하도록 캐시에 기록
+            _count_cache.set(self._count_cache_key(filters, keyword), total)
+            postings = self._postings_from_rows(rows)
+        elif skip == 0:
+            postings, total = [], 0
+        else:
+            # 결과 페이지가 비어 있으면 행이 없어 개수를 알 수 없음 (범위를 벗어난 페이지만 별도 count)
+            postings, total = [], await self.count_search(filters=filters, keyword=keyword)
+        _search_cache.set(cache_key, ([p.id for p in postings], total))
+        return postings, total
 
+    async def get_many_by_ids(self, posting_ids: List[int], user_id: int | None = None) -> List[JobPosting]:
+        """ID 목록 순서대로 공고를 조회합니다 (로그인 시 즐겨찾기 여부 포함, 그 사이 삭제된 공고는 제외)."""
+        if not posting_ids:
+            return []
+        query = self._select_postings(user_id).where(JobPosting.id.in_(posting_ids))
+        postings_by_id = {p.id: p for p in self._postings_from_rows((await self.session.execute(query)).all())}
+        return [postings_by_id[i] for i in posting_ids if i in postings_by_id]
+
+    async def count_search(self, filters: List, keyword: str | None = None) -> int:
+        """필터링/키워드 검색된 채용 공고의 전체 개수를 계산합니다 (필터 조합별 캐시 사용)."""
+        cache_key = self._count_cache_key(filters, keyword)
+        cached = _count_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        base_query = self._build_search_query(filters, keyword)
         count_query = select(func.count()).select_from(base_query.subquery())
-        return await self.session.scalar(count_query) or 0
+        total = await self.session.scalar(count_query) or 0
+        _count_cache.set(cache_key, total)
+        return total
+
+    # 패싯 집계 대상 컬럼 (응답 키 -> 컬럼)
+    FACET_COLUMNS = {
+        "job_category": JobPosting.job_category,
+        "region1": JobPosting.region1,
+        "employment_type": JobPosting.employment_type,
+        "is_always_recruiting": JobPosting.is_always_recruiting,
+    }
 
-    async def list_popular(self, limit: int) -> List[JobPosting]:
+    async def search_facets(
+        self, filters: List, keyword: str | None = None
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        검색 조건에 맞는 공고의 패싯별(직무, 지역, 고용 형태, 상시 채용) 개수를 한 번의 쿼리로 집계합니다.
+        GROUPING SETS로 컬럼별 그룹을 한 번에 만들고, grouping() 값으로 각 행이 어느 패싯인지 구분합니다.
+        """
+        columns = list(self.FACET_COLUMNS.values())
+        query = select(
+            *columns,
+            *(func.grouping(column) for column in columns),
+            func.count(),
+        )
+        if keyword:
+            query = query.where(self._keyword_filter(keyword))
+        if filters:
+            query = query.where(*filters)
+        query = query.group_by(func.grouping_sets(*(tuple_(column) for column in columns)))
+
+        facets: Dict[str, Dict[str, int]] = {name: {} for name in self.FACET_COLUMNS}
+        names = list(self.FACET_COLUMNS)
+        for row in (await self.session.execute(query)).all():
+            values = row[:len(columns)]
+            grouping_flags = row[len(columns):-1]
+            count = row[-1]
+            # grouping(col) == 0 인 컬럼이 이 행의 그룹 기준
+            index = grouping_flags.index(0)
+            value = values[index]
+            if value is None:
+                continue # 값이 비어 있는 공고는 패싯 선택지로 노출하지 않음
+            if isinstance(value, bool):
+                key = "true" if value else "false"
+            else:
+                key = getattr(value, "value", value) # Enum은 값 문자열 사용
+            facets[names[index]][key] = count
+        return facets
+
+    async def list_popular(self, limit: int, user_id: int | None = None) -> List[JobPosting]:
         """지원자 수 기준으로 인기 채용 공고 목록을 조회합니다."""
-        # 지원자 수를 계산하는 서브쿼리
-        applications_count_sq = (
-            select(
-                JobApplication.job_posting_id,
-                func.count().label('app_count')
-            )
-            .group_by(JobApplication.job_posting_id)
-            .subquery('app_counts')
+        # 지원 생성/취소 시 갱신되는 application_count 컬럼 인덱스로 정렬 (지원 테이블 집계 없음)
+        query = (
+            self._select_postings(user_id)
+            # 지원자 수 내림차순, 같으면 최신순 정렬
+            .order_by(desc(JobPosting.application_count), desc(JobPosting.created_at))
+            .limit(limit)
         )
+        result = await self.session.execute(query)
+        return self._postings_from_rows(result.all())
 
-        # 공고와 지원자 수 서브쿼리 조인 (지원자 없는 공고 포함)
+    async def list_popular_by_age_group(
+        self, age_group: int, limit: int, user_id: int | None = None
+    ) -> List[JobPosting]:
+        """특정 연령대 지원자 수 기준으로 인기 채용 공고 목록을 조회합니다 (집계 테이블 사용)."""
+        # 스케줄러가 미리 계산한 (공고, 연령대) 집계를 인덱스로 조회 (지원자 있는 공고만 포함)
         query = (
-            select(JobPosting)
-            .outerjoin(applications_count_sq, JobPosting.id == applications_count_sq.c.job_posting_id)
-            # 지원자 수 내림차순, 같으면 최신순 정렬 (coalesce로 NULL 처리)
-            .order_by(desc(func.coalesce(applications_count_sq.c.app_count, 0)), desc(JobPosting.created_at))
+            self._select_postings(user_id)
+            .join(JobPostingAgeStat, JobPosting.id == JobPostingAgeStat.job_posting_id)
+            .where(JobPostingAgeStat.age_group == age_group)
+            .order_by(desc(JobPostingAgeStat.application_count), desc(JobPosting.created_at))
             .limit(limit)
         )
         result = await self.session.execute(query)
-        return result.scalars().all()
+        return self._postings_from_rows(result.all())
+
+    @staticmethod
+    def _distance_km(latitude: float, longitude: float):
+        """공고 좌표와 주어진 좌표 사이의 거리(km)를 계산하는 하버사인 SQL 식"""
+        lat1, lat2 = func.radians(latitude), func.radians(JobPosting.latitude)
+        d_lat = func.radians(JobPosting.latitude - latitude)
+        d_lon = func.radians(JobPosting.longitude - longitude)
+        a = (
+            func.power(func.sin(d_lat / 2), 2)
+            + func.cos(lat1) * func.cos(lat2) * func.power(func.sin(d_lon / 2), 2)
+        )
+        return 2 * 6371.0 * func.asin(func.least(1.0, func.sqrt(a)))
 
-    async def list_popular_by_age_group(self, age_start: int, age_end: int, limit: int) -> List[JobPosting]:
-        """특정 연령대 지원자 수 기준으로 인기 채용 공고 목록을 조회합니다."""
-        # User.birthday(문자열)를 Date로 캐스팅하고 AGE 함수를 사용하여 정확한 만 나이 계산
+    async def list_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        skip: int,
+        limit: int,
+        user_id: int | None = None,
+    ) -> List[JobPosting]:
+        """
+        주어진 좌표 반경 내 채용 공고를 가까운 순으로 조회합니다.
+        geo_cell 인덱스로 반경을 감싸는 격자의 공고만 추린 뒤 정확한 거리로 거르고 정렬합니다.
+        각 공고에는 distance_km 값이 설정됩니다.
+        """
+        distance = self._distance_km(latitude, longitude)
+        cell_ranges = geo_cell_ranges(latitude, longitude, radius_km)
+        query = (
+            self._select_postings(user_id)
+            .add_columns(distance.label("distance_km"))
+            .where(or_(*(JobPosting.geo_cell.between(start, end) for start, end in cell_ranges)))
+            .where(distance <= radius_km)
+            .order_by(distance, JobPosting.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = (await self.session.execute(query)).all()
+        postings = self._postings_from_rows(rows)
+        for posting, row in zip(postings, rows):
+            setattr(posting, 'distance_km', round(row.distance_km, 2))
+        return postings
+
+    async def refresh_age_group_stats(self) -> int:
+        """
+        공고별/연령대별 지원자 수 집계 테이블을 다시 계산합니다.
+        나이는 날짜가 지나면 바뀌므로 증분 갱신 대신 한 트랜잭션에서 전체를 교체합니다.
+        """
+        # User.birthday(문자열) 앞 10자리(YYYY-MM-DD)로 생년월일을 만들고 AGE 함수로 정확한 만 나이 계산
         # PostgreSQL의 AGE(end_date, start_date) 함수는 interval을 반환
         # date_part('year', interval)로 년 단위 차이를 추출
-        age_expr = func.date_part('year', func.age(cast(User.birthday, Date)))
+        # 형식이 잘못되었거나 존재하지 않는 날짜(2000-02-30, 1990-13-01 등)는 한 건만으로도 캐스팅 오류로
+        # 전체 집계 트랜잭션이 실패하므로 NULL로 만들어 집계에서 제외한다.
+        # (CASE는 조건을 순서대로 평가하므로 형식 검사를 통과한 값만 숫자로 변환되고 make_date에 전달됨)
+        birthday = func.substr(User.birthday, 1, 10)
+        year = cast(func.substr(birthday, 1, 4), Integer)
+        month = cast(func.substr(birthday, 6, 2), Integer)
+        day = cast(func.substr(birthday, 9, 2), Integer)
+        last_day = func.date_part(
+            'day', func.make_date(year, month, 1) + text("interval '1 month'") - text("interval '1 day'")
+        )
+        birth_date = case(
+            (
+                birthday.op("~")(r"^[1-9]\d{3}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$"),
+                case((day <= last_day, func.make_date(year, month, day))),
+            ),
+        )
+        age_expr = func.date_part('year', func.age(birth_date))
+        age_group_expr = cast(func.floor(age_expr / 10) * 10, Integer)
 
-        # 특정 연령대 지원자 수를 계산하는 서브쿼리
-        applications_count_sq = (
+        aggregate = (
             select(
                 JobApplication.job_posting_id,
-                func.count().label('app_count')
+                age_group_expr.label("age_group"),
+                func.count().label("application_count"),
+                func.now(),
             )
             .join(User, User.id == JobApplication.user_id)
-            .where(
-                age_expr >= age_start,
-                age_expr < age_end
+            .where(birth_date.is_not(None))
+            .group_by(JobApplication.job_posting_id, age_group_expr)
+        )
+
+        await self.session.execute(delete(JobPostingAgeStat))
+        result = await self.session.execute(
+            insert(JobPostingAgeStat).from_select(
+                ["job_posting_id", "age_group", "application_count", "refreshed_at"],
+                aggregate,
             )
-            .group_by(JobApplication.job_posting_id)
-            .subquery()
         )
+        await self.session.commit()
+        return result.rowcount
 
-        # 공고와 연령대별 지원자 수 서브쿼리 조인 (지원자 있는 공고만 포함)
-        query = (
-            select(JobPosting)
-            .join(applications_count_sq, JobPosting.id == applications_count_sq.c.job_posting_id)
-            .order_by(desc(applications_count_sq.c.app_count), desc(JobPosting.created_at))
-            .limit(limit)
+    async def reconcile_application_counts(self) -> int:
+        """
+        공고별 지원자 수 카운터(application_count)를 실제 지원 수로 맞춥니다.
+        카운터는 지원/지원 취소 API에서만 증감하므로 사용자 탈퇴 cascade나 관리자 화면 삭제로 생긴 차이를 주기적으로 바로잡습니다.
+        값이 다른 공고만 갱신하며 갱신된 공고 수를 반환합니다.
+        """
+        actual = (
+            select(func.count(JobApplication.id))
+            .where(JobApplication.job_posting_id == JobPosting.id)
+            .correlate(JobPosting)
+            .scalar_subquery()
         )
-        result = await self.session.execute(query)
-        return result.scalars().all()
+        result = await self.session.execute(
+            update(JobPosting)
+            .where(JobPosting.application_count != actual)
+            .values(application_count=actual)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount
 
     async def get_favorited_posting_ids(self, user_id: int, posting_ids: List[int]) -> set[int]:
         """주어진 공고 ID 목록 중 사용자가 즐겨찾기한 공고 ID들을 반환합니다."""
@@ -21,6 +21,7 @@ from pydantic import ValidationError
 
 from app.domains.job_postings.repository import JobPostingRepository
 from app.domains.job_postings.service import get_job_posting_repository
+from app.domains.job_postings.utils import build_next_cursor
 
 from app.models.company_users import CompanyUser
 from app.models.job_postings import JobPosting
@@ -169,26 +170,30 @@ async def create_job_posting(
     description="채용공고 목록을 페이지네이션하여 조회합니다. 로그인 시 즐겨찾기 여부가 포함됩니다.",
 )
 async def list_postings(
-    skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
+    skip: int = Query(0, ge=0, description="건너뛸 레코드 수 (cursor 지정 시 무시)"),
     limit: int = Query(10, ge=1, le=100, description="가져올 레코드 수"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (지정 시 커서 기반 페이지네이션)"),
+    estimate_total: bool = Query(False, description="true면 total을 통계 기반 추정치로 반환 (빠르지만 근사값)"),
     current_user: Optional[User] = Depends(get_current_user_optional), # 로그인 사용자 (선택적)
     repository: JobPostingRepository = Depends(get_job_posting_repository)
 ) -> PaginatedJobPostingResponse:
     """채용공고 목록 조회 API (페이지네이션)"""
-    logger.info(f"GET /posting 요청 수신: skip={skip}, limit={limit}, user_id={current_user.id if current_user else None}")
+    logger.info(f"GET /posting 요청 수신: skip={skip}, limit={limit}, cursor={cursor}, estimate_total={estimate_total}, user_id={current_user.id if current_user else None}")
     # 1. 현재 로그인 사용자 ID 추출 (없으면 None)
     user_id = current_user.id if current_user else None
     # 2. 서비스 호출하여 공고 목록 및 전체 개수 조회
     postings, total_count = await service.list_job_postings(
         repository=repository,
-        skip=skip, limit=limit, user_id=user_id
+        skip=skip, limit=limit, user_id=user_id, cursor=cursor,
+        estimate_total=estimate_total
     )
     # 3. 페이지네이션 응답 스키마에 맞춰 결과 반환
     return PaginatedJobPostingResponse(
         items=postings,
         total=total_count,
-        skip=skip,
+        skip=0 if cursor else skip,
         limit=limit,
+        next_cursor=build_next_cursor(postings, limit),
     )
 
 
@@ -205,18 +210,21 @@ async def search_postings(
     job_category: JobCategoryEnum | None = Query(None, description="직무 카테고리"),
     employment_type: str | None = Query(None, description="고용 형태"),
     is_always_recruiting: bool | None = Query(None, description="상시 채용 여부"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor 지정 시 무시)"),
     limit: int = Query(10, ge=1, le=100, description="페이지당 결과 수"),
     sort: SortOptions = Query(SortOptions.LATEST, description="정렬 기준"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (지정 시 커서 기반 페이지네이션)"),
+    with_total: bool = Query(True, description="전체 개수 포함 여부 (false면 total 없이 has_next만 반환)"),
+    with_facets: bool = Query(False, description="직무/지역/고용 형태/상시 채용별 개수(facets) 포함 여부"),
     current_user: Optional[User] = Depends(get_current_user_optional), # 로그인 사용자 (선택적)
     repository: JobPostingRepository = Depends(get_job_posting_repository)
 ) -> PaginatedJobPostingResponse:
     """채용공고 검색 API (필터링, 정렬, 페이지네이션)"""
-    logger.info(f"GET /posting/search 요청 수신: keyword={keyword}, location1={location1}, location2={location2}, job_category={job_category}, employment_type={employment_type}, is_always_recruiting={is_always_recruiting}, page={page}, limit={limit}, sort={sort}, user_id={current_user.id if current_user else None}")
+    logger.info(f"GET /posting/search 요청 수신: keyword={keyword}, location1={location1}, location2={location2}, job_category={job_category}, employment_type={employment_type}, is_always_recruiting={is_always_recruiting}, page={page}, limit={limit}, sort={sort}, cursor={cursor}, with_total={with_total}, with_facets={with_facets}, user_id={current_user.id if current_user else None}")
     # 1. 현재 로그인 사용자 ID 추출 (없으면 None)
     user_id = current_user.id if current_user else None
-    # 2. 서비스 호출하여 검색 조건에 맞는 공고 목록 및 전체 개수 조회
-    postings, total_count = await service.search_job_postings(
+    # 2. 서비스 호출하여 검색 조건에 맞는 공고 목록, 전체 개수, 다음 페이지 존재 여부, 패싯 개수 조회
+    postings, total_count, has_next, facets = await service.search_job_postings(
         repository=repository,
         keyword=keyword,
         location1=location1,
@@ -227,14 +235,20 @@ async def search_postings(
         page=page,
         limit=limit,
         sort=sort,
-        user_id=user_id
+        user_id=user_id,
+        cursor=cursor,
+        with_total=with_total,
+        with_facets=with_facets
     )
     # 3. 페이지네이션 응답 스키마에 맞춰 결과 반환
     return PaginatedJobPostingResponse(
         items=postings,
         total=total_count,
-        skip=(page - 1) * limit, # 스킵 계산
+        skip=0 if cursor else (page - 1) * limit, # 스킵 계산
         limit=limit,
+        has_next=has_next,
+        next_cursor=build_next_cursor(postings, limit, sort) if has_next else None,
+        facets=facets,
     )
 
 
@@ -300,6 +314,45 @@ async def list_popular_postings_by_my_age(
     )
 
 
+@router.get(
+    "/nearby",
+    response_model=PaginatedJobPostingResponse,
+    summary="주변 채용공고 조회",
+    description="주어진 위치(위도/경도)에서 반경 내 채용공고를 가까운 순으로 조회합니다. 로그인 시 즐겨찾기 여부가 포함됩니다.",
+)
+async def list_nearby_postings(
+    latitude: float = Query(..., ge=-90, le=90, description="기준 위치 위도"),
+    longitude: float = Query(..., ge=-180, le=180, description="기준 위치 경도"),
+    radius_km: float = Query(3.0, gt=0, le=50, description="검색 반경 (km)"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    limit: int = Query(10, ge=1, le=100, description="페이지당 결과 수"),
+    current_user: Optional[User] = Depends(get_current_user_optional), # 로그인 사용자 (선택적)
+    repository: JobPostingRepository = Depends(get_job_posting_repository)
+) -> PaginatedJobPostingResponse:
+    """주변 채용공고 조회 API (거리순)"""
+    logger.info(f"GET /posting/nearby 요청 수신: latitude={latitude}, longitude={longitude}, radius_km={radius_km}, page={page}, limit={limit}, user_id={current_user.id if current_user else None}")
+    # 1. 현재 로그인 사용자 ID 추출 (없으면 None)
+    user_id = current_user.id if current_user else None
+    # 2. 서비스 호출하여 반경 내 공고 목록 및 다음 페이지 존재 여부 조회
+    postings, has_next = await service.get_nearby_job_postings(
+        latitude=latitude,
+        longitude=longitude,
+        repository=repository,
+        radius_km=radius_km,
+        page=page,
+        limit=limit,
+        user_id=user_id
+    )
+    # 3. 페이지네이션 응답 스키마에 맞춰 결과 반환 (전체 개수는 계산하지 않음)
+    return PaginatedJobPostingResponse(
+        items=postings,
+        total=None,
+        skip=(page - 1) * limit,
+        limit=limit,
+        has_next=has_next,
+    )
+
+
 @router.get(
     "/{job_posting_id}",
     response_model=JobPostingResponse,
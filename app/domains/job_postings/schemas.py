@@ -214,6 +214,7 @@ class JobPostingResponse(JobPostingBase):
     created_at: datetime
     updated_at: datetime
     is_favorited: Optional[bool] = Field(None, description="현재 로그인한 사용자의 즐겨찾기 여부 (비로그인 시 null)")
+    distance_km: Optional[float] = Field(None, description="검색 위치로부터의 거리(km, 주변 공고 검색 시에만 포함)")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -260,9 +261,14 @@ class JobPostingUpdate(JobPostingBase):
 class PaginatedJobPostingResponse(BaseModel):
     """페이지네이션된 채용 공고 목록 응답 스키마"""
     items: list[JobPostingResponse]
-    total: int
+    total: Optional[int] = Field(..., description="전체 개수 (개수 생략 모드면 null)")
     skip: int
     limit: int
+    has_next: Optional[bool] = Field(None, description="다음 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 조회용 커서 (마지막 페이지면 null)")
+    facets: Optional[dict[str, dict[str, int]]] = Field(
+        None, description="검색 조건 기준 패싯별 개수 (예: {\"region1\": {\"서울\": 12}}, 요청 시에만 포함)"
+    )
 
 
 class JobPostingCreateFormData:
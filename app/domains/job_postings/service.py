@@ -1,6 +1,5 @@
-from typing import Optional, Union, List
+from typing import Any, Optional, Union, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import desc
 from fastapi import Depends, HTTPException, status
 from datetime import datetime
 import logging
@@ -9,6 +8,7 @@ from app.domains.job_postings.schemas import JobPostingUpdate, JobPostingCreate,
 from app.models.job_postings import JobPosting
 from app.models.users import User
 from app.domains.job_postings.repository import JobPostingRepository
+from app.domains.job_postings.utils import decode_cursor
 from app.core.db import get_db_session
 
 
@@ -59,6 +59,16 @@ async def _attach_favorite_status(
         setattr(p, 'is_favorited', p.id in favorited_posting_ids) # 해당 공고 ID가 즐겨찾기 목록에 있는지 여부 설정
 
 
+def _decode_cursor_or_400(cursor: str | None, sort: SortOptions) -> tuple[Any, int] | None:
+    """요청된 커서 문자열을 복원합니다. 형식이 잘못되었으면 400 에러를 발생시킵니다."""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor, sort)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 # --- 서비스 함수 --- (비즈니스 로직 담당)
 
 async def create_job_posting(
@@ -94,23 +104,30 @@ async def list_job_postings(
     repository: JobPostingRepository = Depends(get_job_posting_repository),
     skip: int = 0,
     limit: int = 10,
-    user_id: Optional[int] = None
+    user_id: Optional[int] = None,
+    cursor: str | None = None,
+    estimate_total: bool = False
 ) -> tuple[List[JobPosting], int]:
     """채용 공고 목록 조회 (페이지네이션, 로그인 시 즐겨찾기 여부 포함)"""
-    # 1. 전체 공고 수 조회
-    total_count = await repository.count_all()
+    # 커서가 있으면 keyset 페이지네이션 (skip 무시)
+    decoded_cursor = _decode_cursor_or_400(cursor, SortOptions.LATEST)
 
-    # 2. 공고가 없으면 빈 목록 반환
-    if total_count == 0:
-        return [], 0
+    # 1. 전체 공고 수 조회 (estimate_total이면 플래너 통계 기반 추정치)
+    if estimate_total:
+        total_count = await repository.estimate_count_all()
+    else:
+        total_count = await repository.count_all()
 
-    # 3. 페이지네이션 적용하여 공고 목록 조회
-    postings = await repository.list_all(skip=skip, limit=limit)
+    # 2. 공고가 없으면 빈 목록 반환 (추정치는 오차가 있으므로 정확한 개수일 때만)
+    if total_count == 0 and not estimate_total:
+        return [], 0
 
-    # 4. 로그인 사용자라면 즐겨찾기 상태 첨부
-    await _attach_favorite_status(postings, user_id, repository)
+    # 3. 페이지네이션 적용하여 공고 목록 조회 (로그인 사용자면 즐겨찾기 여부를 같은 쿼리로 조회)
+    postings = await repository.list_all(
+        skip=skip, limit=limit, cursor=decoded_cursor, user_id=user_id
+    )
 
-    # 5. 결과 반환
+    # 4. 결과 반환
     return postings, total_count
 
 
@@ -211,19 +228,25 @@ async def search_job_postings(
     page: int = 1,
     limit: int = 10,
     sort: SortOptions = SortOptions.LATEST,
-    user_id: Optional[int] = None
-) -> tuple[List[JobPosting], int]:
-    """채용 공고 검색 (필터링, 정렬, 페이지네이션, 로그인 시 즐겨찾기 여부 포함)"""
-    logger.info(f"채용 공고 검색 시작: keyword='{keyword}', location1='{location1}', location2='{location2}', category='{job_category}', page={page}, limit={limit}, sort='{sort}', user_id={user_id}")
+    user_id: Optional[int] = None,
+    cursor: str | None = None,
+    with_total: bool = True,
+    with_facets: bool = False
+) -> tuple[List[JobPosting], Optional[int], bool, Optional[dict]]:
+    """
+    채용 공고 검색 (필터링, 정렬, 페이지네이션, 로그인 시 즐겨찾기 여부 포함)
+
+    반환값은 (공고 목록, 전체 개수, 다음 페이지 존재 여부, 패싯 개수)이며,
+    with_total=False이면 전체 개수 계산을 생략하고 None을 반환합니다 (무한 스크롤용).
+    with_facets=True이면 현재 조건의 직무/지역/고용 형태/상시 채용별 개수를 함께 반환합니다 (아니면 None).
+    """
+    logger.info(f"채용 공고 검색 시작: keyword='{keyword}', location1='{location1}', location2='{location2}', category='{job_category}', page={page}, limit={limit}, sort='{sort}', cursor={cursor}, with_total={with_total}, with_facets={with_facets}, user_id={user_id}")
+    # 커서가 있으면 keyset 페이지네이션 (page 무시)
+    decoded_cursor = _decode_cursor_or_400(cursor, sort)
+
     # 1. 검색 필터 조건 생성
+    # (키워드는 제목, 설명, 요약을 합친 검색 컬럼에서 레포지토리가 인덱스로 검색)
     filters = []
-    if keyword:
-        # 키워드는 제목, 설명, 요약에서 검색 (ILIKE는 대소문자 구분 없음)
-        filters.append(
-            JobPosting.title.ilike(f"%{keyword}%") |
-            JobPosting.description.ilike(f"%{keyword}%") |
-            JobPosting.summary.ilike(f"%{keyword}%")
-        )
     if location1:
         filters.append(JobPosting.region1.ilike(f"%{location1}%"))
     if location2:
@@ -235,39 +258,43 @@ async def search_job_postings(
     if is_always_recruiting is not None:
         filters.append(JobPosting.is_always_recruiting == is_always_recruiting)
 
-    # 2. 정렬 조건 생성
-    if sort == SortOptions.LATEST:
-        order_by_clause = desc(JobPosting.created_at)
-    elif sort == SortOptions.SALARY_HIGH:
-        order_by_clause = desc(JobPosting.salary)
-    elif sort == SortOptions.SALARY_LOW:
-        order_by_clause = JobPosting.salary
-    else: # 기본값: 최신순
-        order_by_clause = desc(JobPosting.created_at)
-
-    # 3. 필터링된 전체 공고 수 조회
-    total_count = await repository.count_search(filters=filters)
-    logger.info(f"검색 조건에 맞는 공고 수: {total_count}") # 중간 결과 로그
-
-    # 4. 검색 결과가 없으면 빈 목록 반환
-    if total_count == 0:
-        return [], 0
-
-    # 5. 페이지네이션 적용하여 공고 검색
     skip = (page - 1) * limit
-    postings = await repository.search(
-        filters=filters,
-        order_by_clause=order_by_clause,
-        skip=skip,
-        limit=limit
-    )
-
-    # 6. 로그인 사용자라면 즐겨찾기 상태 첨부
-    await _attach_favorite_status(postings, user_id, repository)
-
-    # 7. 결과 반환
+    if with_total and decoded_cursor is None:
+        # 2-a. 오프셋 페이지: 페이지와 전체 개수를 한 번의 쿼리로 조회 (윈도 count)
+        postings, total_count = await repository.search_with_total(
+            filters=filters,
+            sort=sort,
+            skip=skip,
+            limit=limit,
+            keyword=keyword,
+            user_id=user_id
+        )
+        has_next = skip + len(postings) < total_count
+    else:
+        # 2-b. 커서 페이지 또는 개수 생략: limit + 1개를 조회해 다음 페이지 존재 여부 판단
+        postings = await repository.search(
+            filters=filters,
+            sort=sort,
+            skip=skip,
+            limit=limit + 1,
+            keyword=keyword,
+            cursor=decoded_cursor,
+            user_id=user_id
+        )
+        has_next = len(postings) > limit
+        postings = postings[:limit]
+        # 커서 페이지에서 전체 개수가 필요하면 별도 count (keyset 조건은 개수에 포함하지 않음)
+        total_count = await repository.count_search(filters=filters, keyword=keyword) if with_total else None
+    logger.info(f"검색 조건에 맞는 공고 수: {total_count}, 다음 페이지 존재: {has_next}") # 중간 결과 로그
+
+    # 3. 요청 시 패싯별 개수 집계 (GROUPING SETS 단일 쿼리)
+    facets = None
+    if with_facets:
+        facets = await repository.search_facets(filters=filters, keyword=keyword)
+
+    # 4. 결과 반환 (로그인 사용자의 즐겨찾기 여부는 검색 쿼리에서 함께 조회됨)
     logger.info(f"채용 공고 검색 완료: {len(postings)}개 반환 (총 {total_count}개)") # 완료 로그
-    return postings, total_count
+    return postings, total_count, has_next, facets
 
 
 async def get_popular_job_postings(
@@ -277,18 +304,47 @@ async def get_popular_job_postings(
 ) -> tuple[List[JobPosting], int]:
     """인기 채용 공고 목록 조회 (지원자 수 기준, 로그인 시 즐겨찾기 여부 포함)"""
     logger.info(f"인기 채용 공고 조회 시작: limit={limit}, user_id={user_id}") # 시작 로그
-    # 1. 레포지토리 통해 인기 공고 목록 조회 (지원자 수 기준 정렬됨)
-    postings = await repository.list_popular(limit=limit)
-
-    # 2. 로그인 사용자라면 즐겨찾기 상태 첨부
-    await _attach_favorite_status(postings, user_id, repository)
+    # 1. 레포지토리 통해 인기 공고 목록 조회 (지원자 수 기준 정렬됨, 로그인 시 즐겨찾기 여부 포함)
+    postings = await repository.list_popular(limit=limit, user_id=user_id)
 
-    # 3. 조회된 공고 수 계산 및 결과 반환
+    # 2. 조회된 공고 수 계산 및 결과 반환
     total_count = len(postings) # 인기 공고는 별도 count 없이 조회된 개수가 전체
     logger.info(f"인기 채용 공고 {total_count}개 조회 완료") # 성공 로그
     return postings, total_count
 
 
+async def get_nearby_job_postings(
+    latitude: float,
+    longitude: float,
+    repository: JobPostingRepository = Depends(get_job_posting_repository),
+    radius_km: float = 3.0,
+    page: int = 1,
+    limit: int = 10,
+    user_id: Optional[int] = None
+) -> tuple[List[JobPosting], bool]:
+    """주변 채용 공고 조회 (반경 내 가까운 순, 로그인 시 즐겨찾기 여부 포함)"""
+    logger.info(f"주변 채용 공고 조회 시작: lat={latitude}, lng={longitude}, radius_km={radius_km}, page={page}, limit={limit}, user_id={user_id}") # 시작 로그
+    # 1. 좌표 범위 검증
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="위도/경도 값이 올바르지 않습니다.")
+
+    # 2. limit + 1개를 조회해 다음 페이지 존재 여부 판단
+    skip = (page - 1) * limit
+    postings = await repository.list_nearby(
+        latitude=latitude,
+        longitude=longitude,
+        radius_km=radius_km,
+        skip=skip,
+        limit=limit + 1,
+        user_id=user_id
+    )
+    has_next = len(postings) > limit
+
+    # 3. 결과 반환
+    logger.info(f"주변 채용 공고 {len(postings[:limit])}개 조회 완료") # 성공 로그
+    return postings[:limit], has_next
+
+
 async def get_popular_job_postings_for_user_age_group(
     user: User,
     repository: JobPostingRepository = Depends(get_job_posting_repository),
@@ -314,21 +370,17 @@ async def get_popular_job_postings_for_user_age_group(
     # 2. 사용자 나이 및 연령대 계산
     today = datetime.today().date()
     age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
-    age_start = (age // 10) * 10 # 10대, 20대, 30대... 시작 나이
-    age_end = age_start + 10 # 10대 (10~19), 20대 (20~29)... 끝 나이
-    logger.info(f"사용자 연령대 계산 완료: user_id={user.id}, age={age}, age_group={age_start}s") # 정보 로그
+    age_group = (age // 10) * 10 # 10대 (10~19), 20대 (20~29)... 시작 나이
+    logger.info(f"사용자 연령대 계산 완료: user_id={user.id}, age={age}, age_group={age_group}s") # 정보 로그
 
-    # 3. 레포지토리 통해 해당 연령대 인기 공고 목록 조회
+    # 3. 레포지토리 통해 해당 연령대 인기 공고 목록 조회 (스케줄러가 갱신하는 집계 테이블 기준)
     postings = await repository.list_popular_by_age_group(
-        age_start=age_start,
-        age_end=age_end,
-        limit=limit
+        age_group=age_group,
+        limit=limit,
+        user_id=user.id # 즐겨찾기 여부를 같은 쿼리로 조회
     )
 
-    # 4. 로그인 사용자 즐겨찾기 상태 첨부 (user.id 사용)
-    await _attach_favorite_status(postings, user.id, repository)
-
-    # 5. 조회된 공고 수 계산 및 결과 반환
+    # 4. 조회된 공고 수 계산 및 결과 반환
     total_count = len(postings) # 인기 공고는 별도 count 없이 조회된 개수가 전체
     logger.info(f"사용자 연령대 기반 인기 공고 {total_count}개 조회 완료") # 성공 로그
     return postings, total_count
\ No newline at end of file
@@ -0,0 +1,59 @@
+import math
+from datetime import datetime
+from typing import Any, List, Optional
+
+from app.core.cursor import decode_keyset_cursor, encode_keyset_cursor
+from app.domains.job_postings.schemas import SortOptions
+from app.models.job_postings import JobPosting, GEO_CELLS_PER_DEGREE, GEO_CELL_LAT_FACTOR
+
+
+# --- 커서(Keyset) 페이지네이션 헬퍼 ---
+# 인코딩은 app.core.cursor를 사용하고, 정렬 기준별 값만 여기서 정한다.
+# 최신순은 (created_at, id), 급여순은 (salary, id)를 기준으로 한다.
+
+def _is_salary_sort(sort: SortOptions) -> bool:
+    return sort in (SortOptions.SALARY_HIGH, SortOptions.SALARY_LOW)
+
+
+def encode_cursor(posting: JobPosting, sort: SortOptions = SortOptions.LATEST) -> str:
+    """공고 한 건과 정렬 기준으로 다음 페이지 조회용 커서 문자열 생성"""
+    value = posting.salary if _is_salary_sort(sort) else posting.created_at
+    return encode_keyset_cursor(value, posting.id, sort.value)
+
+
+def decode_cursor(cursor: str, sort: SortOptions = SortOptions.LATEST) -> tuple[Any, int]:
+    """커서 문자열을 (정렬 기준 값, id) 튜플로 복원 (형식 오류 시 ValueError)"""
+    return decode_keyset_cursor(cursor, sort.value, int if _is_salary_sort(sort) else datetime.fromisoformat)
+
+
+def build_next_cursor(
+    postings: List[JobPosting], limit: int, sort: SortOptions = SortOptions.LATEST
+) -> Optional[str]:
+    """조회된 페이지가 가득 찼으면 마지막 공고 기준의 다음 커서를, 아니면 None 반환"""
+    if not postings or len(postings) < limit:
+        return None
+    return encode_cursor(postings[-1], sort)
+
+
+# --- 위치(격자) 검색 헬퍼 ---
+# 공고의 geo_cell 컬럼은 좌표를 1/GEO_CELLS_PER_DEGREE 도 크기의 격자로 나눈 키이다.
+# 반경을 감싸는 사각형을 위도 띠별 geo_cell 구간으로 바꾸면 인덱스 범위 검색으로 후보를 좁힐 수 있다.
+
+KM_PER_DEGREE_LAT = 111.32
+
+
+def geo_cell_ranges(latitude: float, longitude: float, radius_km: float) -> List[tuple[int, int]]:
+    """중심 좌표와 반경을 감싸는 격자들을 위도 띠별 (시작 키, 끝 키) 구간 목록으로 반환"""
+    lat_delta = radius_km / KM_PER_DEGREE_LAT
+    # 고위도에서 경도 1도의 거리가 0에 가까워지는 것을 방지
+    lon_delta = radius_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(latitude)), 0.01))
+
+    lat_start = math.floor((latitude - lat_delta) * GEO_CELLS_PER_DEGREE)
+    lat_end = math.floor((latitude + lat_delta) * GEO_CELLS_PER_DEGREE)
+    lon_start = math.floor((longitude - lon_delta) * GEO_CELLS_PER_DEGREE)
+    lon_end = math.floor((longitude + lon_delta) * GEO_CELLS_PER_DEGREE)
+
+    return [
+        (band * GEO_CELL_LAT_FACTOR + lon_start, band * GEO_CELL_LAT_FACTOR + lon_end)
+        for band in range(lat_start, lat_end + 1)
+    ]
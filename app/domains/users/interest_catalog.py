@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, List
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Interest
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 다른 워커에서 추가된 사용자 정의 관심분야를 반영하기 위한 전체 재적재 주기
+CATALOG_REFRESH_SECONDS = 600
+
+
+class InterestCatalog:
+    """
+    관심분야 테이블 전체(이름/코드 -> ID, ID -> 이름)를 메모리에 보관하는 카탈로그.
+
+    전체 적재는 시작 시, CATALOG_REFRESH_SECONDS마다, invalidate()로 요청 버전을 올렸을 때만 수행한다.
+    모르는 이름/ID(다른 워커가 추가한 사용자 정의 관심분야, 사용자가 입력한 새 이름)는 해당 항목만 조회해 합치고,
+    이 워커에서 추가한 관심분야는 remember()로 바로 합친다.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self.version = 0            # 적재한 카탈로그 버전
+        self._wanted_version = 1    # 다음 조회 때 맞춰야 할 버전 (invalidate 시 증가)
+        self._loaded_at = 0.0
+        self.ids_by_name: Dict[str, int] = {}
+        self.ids_by_code: Dict[str, int] = {}
+        self.names_by_id: Dict[int, str] = {}
+
+    def invalidate(self) -> None:
+        """관심분야가 추가되었음을 기록 (다음 조회 때 다시 적재)"""
+        self._wanted_version += 1
+
+    def _is_stale(self) -> bool:
+        return (
+            self.version < self._wanted_version
+            or time.monotonic() - self._loaded_at > CATALOG_REFRESH_SECONDS
+        )
+
+    async def load(self, session: AsyncSession) -> None:
+        """관심분야 전체를 다시 적재"""
+        async with self._lock:
+            wanted_version = self._wanted_version
+            rows = (await session.execute(
+                select(Interest.id, Interest.code, Interest.name).order_by(Interest.id)
+            )).all()
+            ids_by_name: Dict[str, int] = {}
+            for interest_id, _, name in rows:
+                ids_by_name.setdefault(name, interest_id)  # 같은 이름이면 먼저 생성된 항목 사용
+            self.ids_by_name = ids_by_name
+            self.ids_by_code = {code: interest_id for interest_id, code, _ in rows}
+            self.names_by_id = {interest_id: name for interest_id, _, name in rows}
+            self.version = wanted_version
+            self._loaded_at = time.monotonic()
+        logger.info(f"관심분야 카탈로그 적재 완료: {len(rows)}개 (버전 {self.version})")
+
+    def remember(self, rows: Iterable[tuple]) -> None:
+        """(id, code, name) 행을 카탈로그에 합침 (같은 이름이면 먼저 생성된 항목 유지)"""
+        for interest_id, code, name in rows:
+            if name not in self.ids_by_name or interest_id < self.ids_by_name[name]:
+                self.ids_by_name[name] = interest_id
+            self.ids_by_code[code] = interest_id
+            self.names_by_id[interest_id] = name
+
+    async def _fetch(self, session: AsyncSession, condition) -> None:
+        """조건에 맞는 관심분야만 조회해 카탈로그에 합침"""
+        rows = (await session.execute(
+            select(Interest.id, Interest.code, Interest.name).where(condition)
+        )).all()
+        self.remember(rows)
+
+    async def ensure_fresh(self, session: AsyncSession) -> None:
+        """버전이 뒤처졌거나 재적재 주기가 지났으면 다시 적재"""
+        if self._is_stale():
+            await self.load(session)
+
+    async def ids_for_names(self, session: AsyncSession, names: Iterable[str]) -> Dict[str, int]:
+        """
+        이름 -> ID 매핑 반환 (모르는 이름은 이름 또는 code(소문자)가 같은 항목만 조회, 그래도 없는 이름은 결과에서 제외)
+        """
+        await self.ensure_fresh(session)
+        names = list(names)
+        missing = [name for name in names if name not in self.ids_by_name]
+        if missing:
+            await self._fetch(session, or_(
+                Interest.name.in_(missing),
+                Interest.code.in_([name.lower() for name in missing]),
+            ))
+        return {name: self.ids_by_name[name] for name in names if name in self.ids_by_name}
+
+    async def names_for_ids(self, session: AsyncSession, interest_ids: Iterable[int]) -> List[str]:
+        """ID 목록을 같은 순서의 이름 목록으로 변환 (모르는 ID는 해당 항목만 조회)"""
+        await self.ensure_fresh(session)
+        interest_ids = list(interest_ids)
+        missing = [interest_id for interest_id in interest_ids if interest_id not in self.names_by_id]
+        if missing:
+            await self._fetch(session, Interest.id.in_(missing))
+        return [self.names_by_id[i] for i in interest_ids if i in self.names_by_id]
+
+
+# 워커 프로세스 단위 관심분야 카탈로그 인스턴스
+interest_catalog = InterestCatalog()
@@ -1,11 +1,15 @@
+from typing import Optional
+
 import jwt
 from fastapi import APIRouter, Depends, Header, HTTPException, BackgroundTasks, Query
-from sqlalchemy import select, delete as sql_alchemy_delete
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import inspect, select, delete as sql_alchemy_delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.core.db import get_db_session
-from app.models import User, UserInterest, EmailVerification
+from app.core.principal_cache import principal_cache
+from app.models import User, EmailVerification
+from app.models.loaders import load_profile
 
 from app.domains.users.schemas import (
     TokenRefreshRequest,
@@ -24,6 +28,7 @@ from .service import (
     delete_user,
     get_user_details,
     login_user,
+    logout_user,
     recommend_jobs,
     refresh_access_token,
     register_user,
@@ -86,7 +91,6 @@ async def request_email_verification(
 
 
 # 인증된 현재 사용자 의존성 확인
-@router.get("/user/me", tags=["사용자"])
 async def read_current_user(
     Authorization: str = Header(...), db=Depends(get_db_session)
 ):
@@ -110,18 +114,54 @@ async def read_current_user(
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="토큰 검증 실패.")
 
+    # 인증 주체 캐시 확인 (적중 시 DB 조회 생략)
+    user = principal_cache.get("user", str(user_id), db)
+    if user is not None:
+        return user
+
     from sqlalchemy.future import select
 
     result = await db.execute(
         select(User)
-        .options(selectinload(User.user_interests).selectinload(UserInterest.interest))
+        .options(*load_profile(User, "principal"))
         .filter(User.id == int(user_id))
     )
     user = result.scalar_one_or_none()  # 조회된 사용자 객체 반환 또는 예외 발생
     if user is None:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    principal_cache.put("user", str(user_id), user, payload.get("exp"))
     return user  # 조회된 사용자 객체 반환
 
+
+# 현재 사용자 정보 조회
+@router.get("/user/me", tags=["사용자"])
+async def read_me(
+    Authorization: str = Header(...), db=Depends(get_db_session)
+):
+    """
+    현재 인증된 사용자의 정보를 반환하는 엔드포인트.
+    캐시된 사용자에는 이력서/지원내역/즐겨찾기 목록과 관심분야 이름이 없으므로 full 프로필로 다시 조회.
+    """
+    current_user = await read_current_user(Authorization=Authorization, db=db)
+    result = await db.execute(
+        select(User)
+        .options(*load_profile(User, "full"))
+        .where(User.id == current_user.id)
+        .execution_options(populate_existing=True)
+    )
+    user = result.scalar_one()
+
+    # 지원내역은 컬럼 값만 내려주고 resumes_data를 스냅샷 값으로 대체
+    response = jsonable_encoder(user, exclude={"applications"})
+    response["applications"] = jsonable_encoder([
+        {
+            **{attr.key: getattr(application, attr.key) for attr in inspect(application).mapper.column_attrs},
+            "resumes_data": application.resume_snapshot,
+        }
+        for application in user.applications
+    ])
+    return response
+
 # 회원가입
 @router.post("/user/register", tags=["사용자"])
 async def register(
@@ -161,13 +201,14 @@ async def verify_email(
 
 # 로그아웃
 @router.post("/user/logout", tags=["사용자"])
-async def logout():
+async def logout(
+    token_data: Optional[TokenRefreshRequest] = None, db=Depends(get_db_session)
+):
     """
     사용자가 로그아웃하는 엔드포인트입니다.
-    JWT 기반의 로그아웃 처리로, 단순 성공 메시지를 반환합니다.
+    리프레쉬 토큰을 함께 보내면 해당 토큰을 폐기하여 더 이상 액세스 토큰을 재발급할 수 없게 합니다.
     """
-    # (실제 운영에서는 토큰 블랙리스트 관리 등 추가 검증 필요)
-    return {"status": "success", "message": "로그아웃이 정상적으로 처리되었습니다."}
+    return await logout_user(db, token_data)  # service의 logout_user 호출
 
 
 # 사용자 프로필 업데이트
@@ -218,13 +259,17 @@ async def refresh_token(token_data: TokenRefreshRequest, db=Depends(get_db_sessi
 # 관심분야 기반 추천 채용공고 제공
 @router.get("/user/recommend", tags=["사용자"])
 async def recommend(
-    current_user: User = Depends(read_current_user), db=Depends(get_db_session)
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    limit: int = Query(20, ge=1, le=100, description="페이지당 추천 공고 수"),
+    current_user: User = Depends(read_current_user),
+    db=Depends(get_db_session),
 ):
     """
     사용자에게 추천 채용공고를 제공하는 엔드포인트입니다.
     현재 사용자의 정보를 받아 추천 비즈니스 로직을 호출합니다.
+    추천 점수(최신성, 마감 임박, 인기도, 희망 지역 일치) 순으로 요청한 페이지만 반환합니다.
     """
-    result = await recommend_jobs(db, current_user)  # service의 recommend_jobs 호출
+    result = await recommend_jobs(db, current_user, page=page, limit=limit)  # service의 recommend_jobs 호출
     return result  # 결과 반환
 
 
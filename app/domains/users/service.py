@@ -1,19 +1,26 @@
+from datetime import date, datetime
+
 import jwt
 from dotenv import load_dotenv
 from fastapi import HTTPException
-from sqlalchemy import and_, delete
+from sqlalchemy import and_, delete, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
+from app.domains.job_postings.recommender import recommendation_engine
 from app.domains.job_postings.repository import JobPostingRepository
-from app.models import Interest, User, UserInterest, JobPosting
+from app.domains.users.interest_catalog import interest_catalog
+from app.models import Interest, User, UserInterest, Resume
+from app.models.loaders import load_profile
+from app.models.job_postings import JobCategoryEnum
 from app.domains.users.schemas import (TokenRefreshRequest, UserLogin,
                                     UserProfileUpdate, UserRegister, PasswordResetverify)
-from app.domains.company_users.utiles import verify_password
-from app.domains.job_postings.service import _attach_favorite_status
-from app.core.config import SECRET_KEY, ALGORITHM
-from app.core.utils import hash_password, create_access_token, create_refresh_token
+from app.core.config import SECRET_KEY, ALGORITHM, STATELESS_TOKEN_REFRESH
+from app.core.password_hasher import password_hasher
+from app.core.principal_cache import principal_cache
+from app.core.token_revocation import SUBJECT_USER, token_revocations
+from app.core.utils import create_access_token, create_refresh_token
 from app.models.users import EmailVerification
 
 load_dotenv()
@@ -40,6 +47,63 @@ async def check_email_is_verified(email: str, user_type: str, db: AsyncSession)
 
     return verification
 
+# 관심분야 이름 목록을 ID 목록으로 변환 (없는 이름은 사용자 정의 관심분야로 일괄 생성)
+async def _resolve_interest_ids(db: AsyncSession, interest_names: list[str]) -> list[int]:
+    names = list(dict.fromkeys(interest_names))  # 중복 제거 (입력 순서 유지)
+    if not names:
+        return []
+
+    # 1. 기존 관심분야는 카탈로그에서 조회 (모르는 이름은 이름/code가 같은 항목만 DB에서 조회)
+    ids_by_name = await interest_catalog.ids_for_names(db, names)
+
+    # 2. 없는 이름은 code로 기존 항목을 찾고, 그래도 없는 것만 한 번의 INSERT로 생성
+    missing = [name for name in names if name not in ids_by_name]
+    if missing:
+        names_by_code = {name.lower(): name for name in missing}
+        ids_by_code = {
+            code: interest_catalog.ids_by_code[code]
+            for code in names_by_code if code in interest_catalog.ids_by_code
+        }
+        new_codes = [code for code in names_by_code if code not in ids_by_code]
+        if new_codes:
+            result = await db.execute(
+                pg_insert(Interest)
+                .values([
+                    {"code": code, "name": names_by_code[code], "is_custom": True}
+                    for code in new_codes
+                ])
+                .on_conflict_do_nothing(index_elements=[Interest.code])
+                .returning(Interest.code, Interest.id)
+            )
+            inserted = dict(result.all())
+            ids_by_code.update(inserted)
+            # 새 관심분야는 카탈로그에 바로 합침 (전체 재적재 없음)
+            interest_catalog.remember(
+                (interest_id, code, names_by_code[code]) for code, interest_id in inserted.items()
+            )
+            # 카탈로그 적재 이후 다른 요청이 먼저 만든 code는 다시 조회
+            conflicted = [code for code in new_codes if code not in inserted]
+            if conflicted:
+                result = await db.execute(
+                    select(Interest.code, Interest.id).where(Interest.code.in_(conflicted))
+                )
+                ids_by_code.update(result.all())
+        for name in missing:
+            ids_by_name[name] = ids_by_code[name.lower()]
+
+    return list(dict.fromkeys(ids_by_name[name] for name in names))
+
+
+# 사용자에 관심분야 연결 (UserInterest 행을 한 번의 INSERT로 추가)
+async def _add_user_interests(db: AsyncSession, user_id: int, interest_names: list[str]) -> None:
+    interest_ids = await _resolve_interest_ids(db, interest_names)
+    if interest_ids:
+        await db.execute(
+            insert(UserInterest),
+            [{"user_id": user_id, "interest_id": interest_id} for interest_id in interest_ids],
+        )
+
+
 async def register_user(
     db: AsyncSession, user_data: UserRegister
 ) -> dict:
@@ -67,7 +131,7 @@ async def register_user(
     new_user = User(
         name=user_data.name,  # 이름 할당
         email=user_data.email,  # 이메일 할당
-        password=hash_password(user_data.password),  # 비밀번호 해시 후 할당
+        password=await password_hasher.hash(user_data.password),  # 비밀번호 해시 후 할당
         phone_number=user_data.phone_number,  # 전화번호 할당
         birthday=user_data.birthday,  # 생년월일 할당
         gender=user_data.gender,  # 성별 할당
@@ -77,40 +141,12 @@ async def register_user(
     )
     # 새로운 User 인스턴스 생성 (비밀번호는 해시 처리)
     db.add(new_user)  # DB 세션에 새 사용자 추가
-    await db.commit()  # 변경사항 커밋
-    await db.refresh(new_user)  # 최신 사용자 정보 갱신
+    await db.flush()  # 사용자 ID 발급
 
-    # 관심분야 처리
+    # 관심분야 처리 (관심분야 수와 관계없이 일정한 쿼리 수로 연결)
     if user_data.interests:  # 관심분야 데이터가 있을 경우
-        for interest_name in user_data.interests:  # 각 관심분야에 대해 반복
-            # 기존 관심분야 검색
-            result = await db.execute(
-                select(Interest).filter(Interest.name == interest_name)
-            )  # 해당 이름의 Interest 검색
-            interest = result.scalar_one_or_none()  # 결과에서 하나 또는 None 반환
-            if not interest:
-                # 존재하지 않으면 사용자 정의 관심분야로 새 Interest 생성
-                interest = Interest(
-                    code=interest_name.lower(), name=interest_name, is_custom=True
-                )  # 새 Interest 생성
-                db.add(interest)  # 새 Interest 추가
-                await db.commit()  # 커밋
-                await db.refresh(interest)  # 최신 정보 갱신
-            # User와 Interest 간의 연결(UserInterest) 생성
-            user_interest = UserInterest(
-                user_id=new_user.id, interest_id=interest.id
-            )  # 연결 객체 생성
-            db.add(user_interest)  # 연결 객체 세션에 추가
-        await db.commit()  # 모든 연결 정보 커밋
-
-        result = await db.execute(
-            select(User)
-            .options(
-                selectinload(User.user_interests).selectinload(UserInterest.interest)
-            )
-            .filter(User.id == new_user.id)
-        )
-        new_user = result.unique().scalar_one()
+        await _add_user_interests(db, new_user.id, user_data.interests)
+    await db.commit()  # 사용자와 관심분야 연결을 한 번에 커밋
 
     # 응답 데이터 생성 (민감 정보 제외)
     response_data = {
@@ -144,7 +180,7 @@ async def login_user(db: AsyncSession, user_data: UserLogin) -> dict:
     if not user.is_active:
         raise HTTPException(status_code=403, detail="이메일 인증이 필요합니다.")
     # 비밀번호 검증
-    if not verify_password(
+    if not await password_hasher.verify(
         user_data.password, user.password
     ):  # 비밀번호가 일치하지 않으면
         raise HTTPException(
@@ -181,7 +217,7 @@ async def update_user(
     # 사용자 조회
     result = await db.execute(
         select(User)
-        .options(selectinload(User.user_interests).selectinload(UserInterest.interest))
+        .options(*load_profile(User, "profile"))
         .filter(User.id == user_id)
     )  # 해당 사용자 검색 쿼리
     user = result.unique().scalar_one_or_none()  # 사용자 객체 또는 None 반환
@@ -195,9 +231,9 @@ async def update_user(
     if update_data.password is not None:
         if update_data.current_password is None:
             raise HTTPException(status_code=400, detail="현재 비밀번호를 입력해야 합니다.")
-        if not verify_password(update_data.current_password, user.password):
+        if not await password_hasher.verify(update_data.current_password, user.password):
             raise HTTPException(status_code=401, detail="현재 비밀번호가 일치하지 않습니다.")
-        user.password = hash_password(update_data.password)  # 새 비밀번호로 업데이트
+        user.password = await password_hasher.hash(update_data.password)  # 새 비밀번호로 업데이트
     if update_data.phone_number is not None:
         user.phone_number = update_data.phone_number  # 전화번호 업데이트
     if update_data.birthday is not None:
@@ -211,37 +247,22 @@ async def update_user(
 
     # 관심분야 업데이트: interests가 있으면 기존 연결 제거 후 새로 추가
     if update_data.interests is not None:
-        user.user_interests.clear()  # 기존 관심분야 연결 제거
-        await db.commit()  # 커밋으로 변경사항 반영
-        for interest_name in update_data.interests:
-            result = await db.execute(
-                select(Interest).filter(Interest.name == interest_name)
-            )  # 해당 관심분야 검색
-            interest = result.scalar_one_or_none()  # 결과 반환
-            if not interest:
-                interest = Interest(
-                    code=interest_name.lower(), name=interest_name, is_custom=True
-                )  # 새 관심분야 생성
-                db.add(interest)  # DB 세션에 추가
-                await db.commit()  # 커밋
-                await db.refresh(interest)  # 최신 정보 업데이트
-            user_interest = UserInterest(
-                user_id=user.id, interest_id=interest.id
-            )  # 연결 객체 생성
-            db.add(user_interest)  # DB 세션에 추가
-        await db.commit()  # 관심분야 업데이트 커밋
-
-    await db.commit()         # 사용자 정보 업데이트 후 최종 커밋
-    await db.refresh(user)    # user 객체를 최신 상태로 갱신
-
-    # Lazy loading 방지용 eager loading 재조회
+        await db.execute(
+            delete(UserInterest).where(UserInterest.user_id == user.id)
+        )  # 기존 관심분야 연결 일괄 제거
+        await _add_user_interests(db, user.id, update_data.interests)
+
+    await db.commit()         # 사용자 정보와 관심분야 변경을 한 번에 커밋
+    principal_cache.invalidate_user(user.id, user.email)  # 인증 주체 캐시에서 변경 전 정보 제거
+
+    # 갱신된 관심분야까지 반영해 재조회 (이미 로드된 객체도 최신 값으로 덮어씀)
     result = await db.execute(
         select(User)
-        .options(selectinload(User.user_interests).selectinload(UserInterest.interest))
+        .options(*load_profile(User, "profile"))
         .filter(User.id == user.id)
+        .execution_options(populate_existing=True)
     )
     user = result.unique().scalar_one()
-    # 기존 result 객체를 재사용하는 부분을 제거하여 오류 방지
 
     response_data = {
         "id": user.id,  # 사용자 ID
@@ -250,9 +271,9 @@ async def update_user(
         "gender": user.gender,  # 성별
         "birthday": user.birthday,  # 생년월일
         "phone_number": user.phone_number,  # 전화번호
-        "interests": [
-            ui.interest.name for ui in user.user_interests
-        ],  # 연결된 관심분야 목록
+        "interests": await interest_catalog.names_for_ids(
+            db, [ui.interest_id for ui in user.user_interests]
+        ),  # 연결된 관심분야 목록
         "signup_purpose": user.signup_purpose,  # 가입 목적
         "referral_source": user.referral_source,  # 유입경로
         "user_image": user.user_image,  # 사용자 이미지 URL
@@ -281,13 +302,30 @@ async def delete_user(db: AsyncSession, user_id: int, current_user: User) -> dic
         )
     )  # 회원탈퇴 시 해당 이메일의 인증 기록도 삭제
     await db.delete(user)  # 사용자 삭제 요청
+    await token_revocations.revoke_subject(db, SUBJECT_USER, str(user.id))  # 발급된 리프레쉬 토큰 폐기
     await db.commit()  # 삭제 커밋
+    principal_cache.invalidate_user(user.id, user.email)  # 탈퇴한 사용자를 인증 주체 캐시에서 제거
     return {
         "status": "success",
         "message": "회원탈퇴가 정상적으로 처리되었습니다.",
     }  # 결과 반환
 
 
+# 로그아웃 기능: 전달받은 리프레쉬 토큰을 폐기 목록에 추가
+async def logout_user(db: AsyncSession, token_data: TokenRefreshRequest = None) -> dict:
+    if token_data is not None:
+        try:
+            payload = jwt.decode(
+                token_data.refresh_token, SECRET_KEY, algorithms=[ALGORITHM]
+            )  # 리프레쉬 토큰 디코딩
+        except jwt.PyJWTError:
+            payload = None  # 이미 만료되었거나 유효하지 않은 토큰은 폐기할 필요 없음
+        if payload is not None:
+            await token_revocations.revoke_token(db, payload)
+            await db.commit()
+    return {"status": "success", "message": "로그아웃이 정상적으로 처리되었습니다."}
+
+
 # 리프레쉬 토큰을 통한 액세스 토큰 재발급 기능
 async def refresh_access_token(
     db: AsyncSession, token_data: TokenRefreshRequest
@@ -302,14 +340,21 @@ async def refresh_access_token(
         raise HTTPException(
             status_code=401, detail="유효하지 않은 리프레쉬 토큰입니다."
         )
-    result = await db.execute(
-        select(User).filter(User.id == int(user_id))
-    )  # 사용자 검색
-    user = result.scalar_one_or_none()  # 결과에서 사용자 객체 반환
-    if not user:
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    if user_id is None:
+        raise HTTPException(
+            status_code=401, detail="유효하지 않은 리프레쉬 토큰입니다."
+        )
+    # 로그아웃/탈퇴/비밀번호 재설정으로 폐기된 토큰인지 메모리 폐기 목록으로 확인
+    if token_revocations.is_revoked(SUBJECT_USER, payload):
+        raise HTTPException(status_code=401, detail="폐기된 리프레쉬 토큰입니다.")
+    if not STATELESS_TOKEN_REFRESH:
+        result = await db.execute(
+            select(User.id).filter(User.id == int(user_id))
+        )  # 사용자 존재 여부 확인
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
     new_access_token = await create_access_token(
-        data={"sub": str(user.id)}
+        data={"sub": user_id}
     )  # 새 액세스 토큰 생성
     return {"status": "success", "data": {"accesstoken": new_access_token}}  # 결과 반환
 
@@ -320,17 +365,17 @@ async def get_user_details(db: AsyncSession, user_id: int, current_user: User) -
     if current_user.id != user_id:
         raise HTTPException(status_code=403, detail="자신의 정보만 조회할 수 있습니다.")
 
-    # User와 연결된 UserInterest, 그리고 각각의 Interest까지 미리 로드한다.
+    # User와 연결된 UserInterest를 미리 로드한다. (관심분야 이름은 카탈로그에서 조회)
     result = await db.execute(
         select(User)
-        .options(selectinload(User.user_interests).selectinload(UserInterest.interest))
+        .options(*load_profile(User, "profile"))
         .filter(User.id == user_id)
     )
     user = result.unique().scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="유저가 조회되지 않습니다.")
 
-    # 응답 데이터 구성 시, 각 user_interest를 순회하며 interest.name을 가져옵니다.
+    # 응답 데이터 구성 시, 각 user_interest의 interest_id를 카탈로그에서 이름으로 변환합니다.
     response_data = {
         "id": user.id,
         "name": user.name,
@@ -338,7 +383,9 @@ async def get_user_details(db: AsyncSession, user_id: int, current_user: User) -
         "gender": user.gender,
         "birthday": user.birthday,
         "phone_number": user.phone_number,
-        "interests": [ui.interest.name for ui in user.user_interests],
+        "interests": await interest_catalog.names_for_ids(
+            db, [ui.interest_id for ui in user.user_interests]
+        ),
         "signup_purpose": user.signup_purpose,
         "referral_source": user.referral_source,
         "user_image": user.user_image,
@@ -377,28 +424,62 @@ async def reset_password_after_verification(db: AsyncSession, user_id: int, new_
         raise HTTPException(status_code=404, detail="유저가 조회되지 않습니다.")
 
     # 비밀번호 해시 후 저장
-    user.password = hash_password(new_password)
+    user.password = await password_hasher.hash(new_password)
+    await token_revocations.revoke_subject(db, SUBJECT_USER, str(user.id))  # 이전 비밀번호로 발급된 리프레쉬 토큰 폐기
     await db.commit()  # 변경사항 커밋
+    principal_cache.invalidate_user(user.id, user.email)  # 인증 주체 캐시에서 이전 비밀번호 정보 제거
     return {"status": "success", "message": "비밀번호가 재설정되었습니다."}
 
 
 # 관심분야 기반 추천 채용공고 제공 기능
-async def recommend_jobs(db: AsyncSession, current_user: User) -> dict:
-    """관심분야 기반 추천 채용공고 제공 + 즐겨찾기 여부 포함"""
-    # 사용자의 관심분야 추출
-    user_interests = [ui.interest.name for ui in current_user.user_interests]
-
-    # 관심분야에 해당하는 채용공고 조회
-    result = await db.execute(
-        select(JobPosting).filter(JobPosting.job_category.in_(user_interests))
+async def recommend_jobs(
+    db: AsyncSession, current_user: User, page: int = 1, limit: int = 20
+) -> dict:
+    """관심분야 기반 추천 채용공고 제공 (추천 점수 순 페이지 단위) + 즐겨찾기 여부 포함"""
+    # 사용자의 관심분야 중 직무 카테고리에 해당하는 것만 추출
+    category_values = {category.value for category in JobCategoryEnum}
+    interest_names = await interest_catalog.names_for_ids(
+        db, [ui.interest_id for ui in current_user.user_interests]
     )
-    job_postings = result.scalars().all()
+    user_interests = [name for name in interest_names if name in category_values]
+
+    # 가장 최근 이력서의 희망 지역 (쉼표로 여러 지역 입력 가능)
+    desired_area = await db.scalar(
+        select(Resume.desired_area)
+        .filter(Resume.user_id == current_user.id)
+        .order_by(Resume.created_at.desc())
+        .limit(1)
+    )
+    desired_areas = [area.strip() for area in (desired_area or "").split(",") if area.strip()]
 
-    if not job_postings:
-        raise HTTPException(status_code=404, detail="해당 채용정보를 찾을 수 없습니다.")
+    # 사용자 연령대 (생년월일이 없거나 형식이 다르면 연령대 가중치 없이 추천)
+    age_group = None
+    try:
+        birth_date = datetime.strptime((current_user.birthday or "")[:10], "%Y-%m-%d").date()
+        today = date.today()
+        age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
+        age_group = (age // 10) * 10
+    except ValueError:
+        pass
+
+    # 추천 엔진으로 요청한 페이지까지의 상위 공고 ID 계산 (limit + 1개로 다음 페이지 존재 여부 판단)
+    await recommendation_engine.ensure_fresh(db)
+    skip = (page - 1) * limit
+    ranked_ids = recommendation_engine.top_ids(
+        categories=user_interests,
+        desired_areas=desired_areas,
+        age_group=age_group,
+        k=skip + limit + 1,
+    )
+    has_next = len(ranked_ids) > skip + limit
+    page_ids = ranked_ids[skip:skip + limit]
 
+    # 해당 페이지 공고만 조회 (즐겨찾기 여부를 같은 쿼리로 조회)
     repository = JobPostingRepository(db)  # db는 AsyncSession
-    await _attach_favorite_status(job_postings, current_user.id, repository)
+    job_postings = await repository.get_many_by_ids(page_ids, user_id=current_user.id)
+
+    if not job_postings and page == 1:
+        raise HTTPException(status_code=404, detail="해당 채용정보를 찾을 수 없습니다.")
 
     # 최종 직렬화된 응답 데이터
     job_list = [
@@ -413,7 +494,11 @@ async def recommend_jobs(db: AsyncSession, current_user: User) -> dict:
         for job in job_postings
     ]
 
-    return {"status": "success", "data": job_list}
+    return {
+        "status": "success",
+        "data": job_list,
+        "pagination": {"page": page, "limit": limit, "has_next": has_next},
+    }
 
 # 이메일로 사용자 조회 함수 (외부 참조용)
 async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
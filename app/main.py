@@ -1,3 +1,5 @@
+import asyncio
+import logging
 import os
 
 from fastapi import FastAPI
@@ -8,11 +10,14 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.admin.admin import setup_admin
 from app.core.config import ENVIRONMENT
+from app.core.db import AsyncSessionFactory
 from app.core.scheduler import start_scheduler
+from app.core.token_revocation import token_revocations
 from app.domains.favorites.router import router as favorites_router
 from app.domains.job_postings.router import router as job_postings_router
 from app.domains.users.oauth.social_router import router as social_router
 from app.domains.users.router import router as users_router
+from app.domains.users.interest_catalog import interest_catalog
 from app.domains.company_users.router import router as company_users_router
 from app.domains.company_info.router import router as company_info_router
 from app.domains.resumes.router import router as resumes_router
@@ -68,6 +73,30 @@ def custom_openapi():
 app.openapi = custom_openapi
 
 
+logger = logging.getLogger(__name__)
+
+
+@app.on_event("startup")
+async def load_interest_catalog():
+    """관심분야 카탈로그 미리 적재 (실패해도 첫 조회 시 다시 적재하므로 기동은 계속)"""
+    try:
+        async with AsyncSessionFactory() as session:
+            await interest_catalog.load(session)
+    except Exception as e:
+        logger.warning(f"관심분야 카탈로그 적재 실패: {e}")
+
+
+@app.on_event("startup")
+async def start_token_revocation_sync():
+    """리프레쉬 토큰 폐기 목록 주기 동기화 시작 (워커마다 실행)"""
+    app.state.token_revocation_sync = asyncio.create_task(token_revocations.sync_forever())
+
+
+@app.on_event("shutdown")
+async def stop_token_revocation_sync():
+    app.state.token_revocation_sync.cancel()
+
+
 @app.get("/")
 async def root():
     return {"message": f"Hello World in {ENVIRONMENT} environment"}
@@ -2,12 +2,16 @@ from .admin_users import AdminUser
 from .base import Base
 from .company_info import CompanyInfo
 from .company_users import CompanyUser
+from .email_outbox import EmailOutbox
 from .favorites import Favorite
 from .interests import Interest
 from .job_applications import JobApplication
 from .job_postings import JobPosting
+from .job_posting_age_stats import JobPostingAgeStat
 from .resumes import Resume
+from .resume_snapshots import ResumeSnapshot
 from .resumes_educations import ResumeEducation
+from .token_revocations import TokenRevocation
 from .users import User
 from .users_interests import UserInterest
 from .job_experience import ResumeExperience
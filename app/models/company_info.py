@@ -25,8 +25,9 @@ class CompanyInfo(Base):
     address = Column(String(100), nullable=True)  # 사업장 주소 (선택)
     company_image = Column(String(255), nullable=True)  # 회사 이미지 URL (선택)
 
-    job_postings = relationship("JobPosting", back_populates="company",lazy="selectin")
-    company_users = relationship("CompanyUser", back_populates="company",lazy="selectin")
+    # 관계 (기본은 lazy="raise", 필요한 관계는 app.models.loaders의 로딩 프로필로 함께 로드)
+    job_postings = relationship("JobPosting", back_populates="company", lazy="raise")
+    company_users = relationship("CompanyUser", back_populates="company", lazy="raise")
 
     def __str__(self):
         return self.company_name
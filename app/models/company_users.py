@@ -29,8 +29,9 @@ class CompanyUser(Base):
         onupdate=get_now_utc # 유틸리티 함수 사용
     )  # 수정 날짜
 
-    job_postings = relationship("JobPosting", back_populates="author",lazy="selectin")
-    company = relationship("CompanyInfo", back_populates="company_users",lazy="selectin")
+    # 관계 (기본은 lazy="raise", 필요한 관계는 app.models.loaders의 로딩 프로필로 함께 로드)
+    job_postings = relationship("JobPosting", back_populates="author", lazy="raise")
+    company = relationship("CompanyInfo", back_populates="company_users", lazy="raise")
     company_name = association_proxy("company", "company_name")
 
     def __str__(self):
@@ -0,0 +1,45 @@
+from enum import Enum
+
+from sqlalchemy import Column, DateTime
+from sqlalchemy import Enum as SQLAEnum
+from sqlalchemy import Index, Integer, String, Text
+
+# 유틸리티 함수 임포트
+from app.core.datetime_utils import get_now_utc
+from app.models.base import Base
+
+
+class EmailOutboxStatusEnum(str, Enum):
+    pending = "pending"    # 발송 대기 (재시도 대기 포함)
+    sending = "sending"    # 워커가 가져가 발송 중
+    sent = "sent"          # 발송 완료
+    failed = "failed"      # 최대 재시도 횟수 초과
+
+
+class EmailOutbox(Base):
+    """발송할 이메일 (업무 데이터와 같은 트랜잭션에 기록하고 스케줄러 워커가 발송)"""
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True)
+    to_email = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    html_content = Column(Text, nullable=False)
+    text_content = Column(Text, nullable=True)
+    status = Column(
+        SQLAEnum(EmailOutboxStatusEnum, name="email_outbox_status_enum"),
+        nullable=False,
+        default=EmailOutboxStatusEnum.pending,
+    )
+    attempts = Column(Integer, nullable=False, default=0)  # 발송 시도 횟수
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, default=get_now_utc)  # 다음 발송(재시도) 가능 시각
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=get_now_utc)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # 워커가 발송할 항목을 찾는 인덱스 (상태 -> 다음 발송 시각)
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    def __str__(self):
+        return f"{self.id} - {self.to_email} ({self.status.value})"
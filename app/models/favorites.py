@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 # 유틸리티 함수 임포트
@@ -18,5 +18,10 @@ class Favorite(Base):
     user = relationship("User", back_populates="favorites")
     job_posting = relationship("JobPosting", back_populates="favorites")
 
+    __table_args__ = (
+        # 공고 목록 조회 시 사용자별 즐겨찾기 여부(EXISTS) 확인용 인덱스
+        Index("ix_favorite_user_id_job_posting_id", "user_id", "job_posting_id"),
+    )
+
     def __str__(self):
         return f"{self.id} - {self.created_at}"
\ No newline at end of file
@@ -2,7 +2,7 @@ from enum import Enum
 
 from sqlalchemy import Column, DateTime, JSON
 from sqlalchemy import Enum as SQLAEnum
-from sqlalchemy import ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 # 유틸리티 함수 임포트
@@ -25,10 +25,12 @@ class JobApplication(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     job_posting_id = Column(Integer, ForeignKey("job_postings.id"), nullable=False)
     resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False)
+    # 지원 시점 이력서 스냅샷 (resume_snapshots의 해시, 같은 내용은 한 번만 저장)
+    snapshot_hash = Column(String(64), ForeignKey("resume_snapshots.hash"), nullable=True, index=True)
     resumes_data = Column(
         JSON,
-        nullable=False,
-        comment="지원 시점 이력서 데이터 스냅샷"
+        nullable=True,
+        comment="지원 시점 이력서 데이터 스냅샷 (이전 방식, 새 지원은 snapshot_hash 사용)"
     )
 
 
@@ -48,10 +50,22 @@ class JobApplication(Base):
     user = relationship("User", back_populates="applications")
     job_posting = relationship("JobPosting", back_populates="applications")
     resume = relationship("Resume", back_populates="applications")
+    # 스냅샷은 크기가 커서 필요한 조회에서만 joinedload(JobApplication.snapshot)로 명시적으로 로드
+    snapshot = relationship("ResumeSnapshot", lazy="raise")
 
-    # 유저는 같은 공고에 중복 지원 못하게
+    @property
+    def resume_snapshot(self) -> dict:
+        """지원 시점 이력서 데이터 (스냅샷 테이블 우선, 이전 방식으로 저장된 지원은 resumes_data)"""
+        if self.snapshot is not None:
+            return self.snapshot.data
+        return self.resumes_data
+
+    # 유저는 같은 공고에 중복 지원 못하게 (지원 생성 시 ON CONFLICT로 중복 판단)
     __table_args__ = (
         UniqueConstraint("resume_id", "job_posting_id", name="uq_resume_jobposting"),
+        UniqueConstraint("user_id", "job_posting_id", name="uq_user_jobposting"),
+        # 기업 지원 목록 조회용 인덱스 (공고별 최신순 + id 보조 정렬로 커서 페이지네이션)
+        Index("ix_job_applications_posting_created_at_id", "job_posting_id", "created_at", "id"),
     )
 
     def __str__(self):
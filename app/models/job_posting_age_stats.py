@@ -0,0 +1,25 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer
+
+# 유틸리티 함수 임포트
+from app.core.datetime_utils import get_now_utc
+from app.models.base import Base
+
+
+class JobPostingAgeStat(Base):
+    """공고별/연령대별 지원자 수 집계 (스케줄러가 주기적으로 재계산)"""
+    __tablename__ = "job_posting_age_stats"
+
+    job_posting_id = Column(
+        Integer, ForeignKey("job_postings.id", ondelete="CASCADE"), primary_key=True
+    )
+    age_group = Column(Integer, primary_key=True)  # 연령대 시작 나이 (20 -> 20~29세)
+    application_count = Column(Integer, nullable=False, default=0)
+    refreshed_at = Column(DateTime(timezone=True), default=get_now_utc)
+
+    __table_args__ = (
+        # 연령대별 인기 공고 조회용 인덱스 (연령대 -> 지원자 수)
+        Index("ix_job_posting_age_stats_age_group_count", "age_group", "application_count"),
+    )
+
+    def __str__(self):
+        return f"{self.job_posting_id} - {self.age_group}대"
@@ -1,15 +1,21 @@
 from enum import Enum
 
-from sqlalchemy import Boolean, Column, Date, DateTime
+from sqlalchemy import Boolean, Column, Computed, Date, DateTime, DDL, Index, event
 from sqlalchemy import Enum as SQLAlchemyEnum
-from sqlalchemy import ForeignKey, Integer, String, Text, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import BigInteger, ForeignKey, Integer, String, Text, Float
+from sqlalchemy.orm import deferred, relationship
 
 # 유틸리티 함수 임포트
 from app.core.datetime_utils import get_now_utc
 from app.models.base import Base
 
 
+# 위치 검색용 격자 크기 (1도를 20칸으로 분할 -> 위도 방향 약 5.5km)
+GEO_CELLS_PER_DEGREE = 20
+# 격자 키 = 위도 칸 번호 * GEO_CELL_LAT_FACTOR + 경도 칸 번호 (같은 위도 띠의 격자가 연속된 값이 되도록)
+GEO_CELL_LAT_FACTOR = 100000
+
+
 class EducationEnum(str, Enum):
     none = "학력 무관"
     high = "고졸"
@@ -108,6 +114,32 @@ class JobPosting(Base):
     postings_image = Column(String(255), nullable=False)
     latitude = Column(Float, nullable=True)
     longitude = Column(Float, nullable=True)
+    # 위치 검색용 격자 키 (좌표로부터 DB가 계산하는 생성 컬럼, 좌표가 없으면 NULL)
+    geo_cell = deferred(
+        Column(
+            BigInteger,
+            Computed(
+                f"CAST(floor(latitude * {GEO_CELLS_PER_DEGREE}) AS BIGINT) * {GEO_CELL_LAT_FACTOR}"
+                f" + CAST(floor(longitude * {GEO_CELLS_PER_DEGREE}) AS BIGINT)",
+                persisted=True,
+            ),
+        )
+    )
+
+    # 키워드 검색용 문서 (제목 + 요약 + 상세 설명, DB가 자동 갱신하는 생성 컬럼)
+    # 목록 조회 시 불필요하게 읽지 않도록 deferred 처리
+    search_text = deferred(
+        Column(
+            Text,
+            Computed(
+                "coalesce(title, '') || ' ' || coalesce(summary, '') || ' ' || coalesce(description, '')",
+                persisted=True,
+            ),
+        )
+    )
+
+    # 지원자 수 (지원 생성/취소 시 함께 갱신되는 비정규화 카운터, 인기 공고 정렬용)
+    application_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     created_at = Column(DateTime(timezone=True), default=get_now_utc)
     updated_at = Column(DateTime(timezone=True), default=get_now_utc, onupdate=get_now_utc)
@@ -122,5 +154,30 @@ class JobPosting(Base):
         "JobApplication", back_populates="job_posting", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # ILIKE '%키워드%' 검색을 인덱스로 처리하기 위한 pg_trgm GIN 인덱스
+        Index(
+            "ix_job_postings_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        # 커서(keyset) 페이지네이션용 정렬 인덱스 (최신순 / 급여순)
+        Index("ix_job_postings_created_at_id", "created_at", "id"),
+        Index("ix_job_postings_salary_id", "salary", "id"),
+        # 인기 공고 정렬용 인덱스 (지원자 수 -> 최신순)
+        Index("ix_job_postings_application_count", "application_count", "created_at"),
+        # 주변 공고 검색용 격자 인덱스
+        Index("ix_job_postings_geo_cell", "geo_cell"),
+    )
+
     def __str__(self):
         return self.title
+
+
+# create_all 로 테이블을 만들 때도 trigram 인덱스가 생성될 수 있도록 확장 활성화
+event.listen(
+    JobPosting.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
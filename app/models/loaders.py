@@ -0,0 +1,56 @@
+from sqlalchemy.orm import selectinload
+
+from app.models.company_info import CompanyInfo
+from app.models.company_users import CompanyUser
+from app.models.job_applications import JobApplication
+from app.models.resumes import Resume
+from app.models.users import User
+from app.models.users_interests import UserInterest
+
+# 모델별 관계 로딩 프로필
+# User / CompanyUser / CompanyInfo의 관계는 기본이 lazy="raise"라서 프로필 없이 접근하면 예외가 발생한다.
+# - principal: 인증된 사용자 객체에 필요한 관계 (인증 의존성, 인증 주체 캐시)
+#   (관심분야 이름은 app.domains.users.interest_catalog에서 ID로 조회하므로 Interest는 로드하지 않음)
+# - profile: 마이페이지/상세 조회 응답에 필요한 관계
+# - full: 모든 관계 (현재 사용자 전체 정보 응답, 관심분야 이름과 지원 시점 이력서 스냅샷까지 포함)
+# 관계가 필요 없는 단순 조회(로그인, 이메일 조회 등)는 프로필을 지정하지 않는다.
+LOADER_PROFILES = {
+    User: {
+        "principal": (selectinload(User.user_interests),),
+        "profile": (selectinload(User.user_interests),),
+        "full": (
+            selectinload(User.user_interests).joinedload(UserInterest.interest),
+            # Resume.applications는 selectin이라 지원내역이 이력서 쪽에서 먼저 로드되므로 스냅샷을 양쪽 경로에 지정
+            selectinload(User.resumes).selectinload(Resume.applications).joinedload(JobApplication.snapshot),
+            selectinload(User.applications).joinedload(JobApplication.snapshot),
+            selectinload(User.favorites),
+        ),
+    },
+    CompanyUser: {
+        "principal": (selectinload(CompanyUser.company),),
+        "profile": (
+            selectinload(CompanyUser.company),
+            selectinload(CompanyUser.job_postings),
+        ),
+        "full": (
+            selectinload(CompanyUser.company),
+            selectinload(CompanyUser.job_postings),
+        ),
+    },
+    CompanyInfo: {
+        "principal": (),
+        "profile": (selectinload(CompanyInfo.job_postings),),
+        "full": (
+            selectinload(CompanyInfo.job_postings),
+            selectinload(CompanyInfo.company_users),
+        ),
+    },
+}
+
+
+def load_profile(model, profile: str) -> tuple:
+    """모델의 로딩 프로필에 해당하는 loader option 목록 반환 (select(...).options(*load_profile(...)))"""
+    try:
+        return LOADER_PROFILES[model][profile]
+    except KeyError:
+        raise ValueError(f"{model.__name__} 모델에 '{profile}' 로딩 프로필이 없습니다.")
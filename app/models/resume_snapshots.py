@@ -0,0 +1,21 @@
+from sqlalchemy import JSON, Column, DateTime, String
+
+# 유틸리티 함수 임포트
+from app.core.datetime_utils import get_now_utc
+from app.models.base import Base
+
+
+class ResumeSnapshot(Base):
+    """
+    지원 시점 이력서 스냅샷 (내용의 SHA-256 해시를 키로 한 번만 저장)
+    같은 이력서로 여러 공고에 지원하면 지원 내역들이 같은 스냅샷을 참조한다.
+    스냅샷은 수정하지 않으므로 이력서가 바뀌어도 지원 시점 내용이 유지된다.
+    """
+    __tablename__ = "resume_snapshots"
+
+    hash = Column(String(64), primary_key=True)  # 정규화한 스냅샷 JSON의 SHA-256 (hex)
+    data = Column(JSON, nullable=False)  # 큰 값은 PostgreSQL TOAST로 압축 저장
+    created_at = Column(DateTime(timezone=True), default=get_now_utc)
+
+    def __str__(self):
+        return self.hash
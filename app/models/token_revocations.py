@@ -0,0 +1,27 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String
+
+# 유틸리티 함수 임포트
+from app.core.datetime_utils import get_now_utc
+from app.models.base import Base
+
+
+class TokenRevocation(Base):
+    """
+    리프레쉬 토큰 폐기 목록 (각 API 워커가 주기적으로 메모리에 동기화)
+    - key가 "jti:<토큰 ID>"이면 해당 리프레쉬 토큰 하나만 폐기 (로그아웃)
+    - key가 "<user|company>:<sub>"이면 revoked_at 이전에 발급된 해당 주체의 토큰 전부 폐기 (탈퇴, 비밀번호 재설정)
+    """
+    __tablename__ = "token_revocations"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    key = Column(String(255), nullable=False, unique=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=False, default=get_now_utc)
+    expires_at = Column(DateTime(timezone=True), nullable=False)  # 이 시각 이후에는 폐기할 토큰이 모두 만료되어 삭제 가능
+
+    __table_args__ = (
+        # 만료 항목 정리 / 동기화 조회용 인덱스
+        Index("ix_token_revocations_expires_at", "expires_at"),
+    )
+
+    def __str__(self):
+        return self.key
@@ -45,31 +45,31 @@ class User(Base):
         onupdate=get_now_utc # 유틸리티 함수 사용
     )
 
-    # 관계
+    # 관계 (기본은 lazy="raise", 필요한 관계는 app.models.loaders의 로딩 프로필로 함께 로드)
     resumes = relationship(
         "Resume", 
         back_populates="user", 
         cascade="all, delete-orphan", 
         passive_deletes=True,
-        lazy="selectin"
+        lazy="raise"
     )
     applications = relationship(
         "JobApplication", 
         back_populates="user", 
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise"
     )
     favorites = relationship(
         "Favorite", 
         back_populates="user", 
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise"
     )
     user_interests = relationship(
         "UserInterest",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
     )
 
     def __str__(self):
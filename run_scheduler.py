@@ -1,11 +1,20 @@
 import asyncio
 import logging
+from datetime import datetime
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 # 스케줄러가 실행할 작업을 임포트
-from app.core.tasks import delete_unverified_users
+from app.core.tasks import (
+    delete_unverified_users,
+    deliver_outbox_emails,
+    purge_email_outbox,
+    purge_resume_snapshots,
+    purge_token_revocations,
+    reconcile_application_counts,
+    refresh_age_group_popularity,
+)
 
 # 로깅 설정: 기본 정보 레벨 이상으로 로깅하고, 로그 형식을 지정.
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -27,6 +36,55 @@ async def main():
     # 어떤 작업이 어떤 트리거로 추가되었는지 로그 기록
     logger.info(f"'{delete_unverified_users.__name__}' 작업이 트리거 '{IntervalTrigger(minutes=1)}'(으)로 추가되었습니다.")
 
+    scheduler.add_job(
+        refresh_age_group_popularity,  # 실행할 함수 (연령대별 인기 공고 집계 갱신)
+        trigger=IntervalTrigger(minutes=10), # 트리거: 10분 간격
+        id="refresh_age_group_popularity_job", # 작업 ID
+        next_run_time=datetime.now(),  # 시작 직후 한 번 실행하여 집계 테이블 채우기
+        replace_existing=True
+    )
+    logger.info(f"'{refresh_age_group_popularity.__name__}' 작업이 트리거 '{IntervalTrigger(minutes=10)}'(으)로 추가되었습니다.")
+
+    scheduler.add_job(
+        reconcile_application_counts,  # 실행할 함수 (공고별 지원자 수 카운터 보정)
+        trigger=IntervalTrigger(minutes=30), # 트리거: 30분 간격
+        id="reconcile_application_counts_job",
+        replace_existing=True
+    )
+    logger.info(f"'{reconcile_application_counts.__name__}' 작업이 트리거 '{IntervalTrigger(minutes=30)}'(으)로 추가되었습니다.")
+
+    scheduler.add_job(
+        purge_resume_snapshots,        # 실행할 함수 (참조 없는 이력서 스냅샷 정리)
+        trigger=IntervalTrigger(hours=1), # 트리거: 1시간 간격
+        id="purge_resume_snapshots_job",
+        replace_existing=True
+    )
+    logger.info(f"'{purge_resume_snapshots.__name__}' 작업이 트리거 '{IntervalTrigger(hours=1)}'(으)로 추가되었습니다.")
+
+    scheduler.add_job(
+        purge_token_revocations,       # 실행할 함수 (만료된 토큰 폐기 항목 정리)
+        trigger=IntervalTrigger(hours=1), # 트리거: 1시간 간격
+        id="purge_token_revocations_job",
+        replace_existing=True
+    )
+    logger.info(f"'{purge_token_revocations.__name__}' 작업이 트리거 '{IntervalTrigger(hours=1)}'(으)로 추가되었습니다.")
+
+    scheduler.add_job(
+        deliver_outbox_emails,         # 실행할 함수 (이메일 아웃박스 발송, 실패 시 백오프 후 재시도)
+        trigger=IntervalTrigger(seconds=10), # 트리거: 10초 간격
+        id="deliver_outbox_emails_job",
+        replace_existing=True          # 이전 실행이 끝나지 않았으면 이번 실행은 건너뜀 (max_instances=1)
+    )
+    logger.info(f"'{deliver_outbox_emails.__name__}' 작업이 트리거 '{IntervalTrigger(seconds=10)}'(으)로 추가되었습니다.")
+
+    scheduler.add_job(
+        purge_email_outbox,            # 실행할 함수 (발송 완료/보관 기간이 지난 실패 아웃박스 항목 정리)
+        trigger=IntervalTrigger(hours=1), # 트리거: 1시간 간격
+        id="purge_email_outbox_job",
+        replace_existing=True
+    )
+    logger.info(f"'{purge_email_outbox.__name__}' 작업이 트리거 '{IntervalTrigger(hours=1)}'(으)로 추가되었습니다.")
+
     # 스케줄러 시작 (백그라운드에서 실행됨)
     scheduler.start()
     logger.info("스케줄러가 시작되었습니다. 중단될 때까지 계속 실행됩니다...")
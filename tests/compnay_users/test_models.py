@@ -1,13 +1,15 @@
 from datetime import datetime
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import sessionmaker
 
 # 여러분의 모델과 Base를 가져옵니다
 from app.models.base import Base
 from app.models.company_info import CompanyInfo
 from app.models.company_users import CompanyUser
+from app.models.loaders import load_profile
 
 
 @pytest.fixture(scope="module")
@@ -85,11 +87,25 @@ def test_create_company_user_with_relation(db_session):
     assert isinstance(user.created_at, datetime)
     assert user.company_id == company.id
 
-    # 관계 검증
+    # 로딩 프로필 없이 관계에 접근하면 예외 발생 (lazy="raise")
+    with pytest.raises(InvalidRequestError):
+        user.company
+
+    # 관계 검증 (principal 프로필로 기업 정보 로드)
+    user = db_session.execute(
+        select(CompanyUser)
+        .options(*load_profile(CompanyUser, "principal"))
+        .where(CompanyUser.id == user.id)
+    ).scalar_one()
     assert user.company.company_name == "관계테스트회사"
     assert user.company_name == "관계테스트회사"  # association_proxy
 
-    # 역참조 검증
+    # 역참조 검증 (full 프로필로 담당자 목록 로드)
+    company = db_session.execute(
+        select(CompanyInfo)
+        .options(*load_profile(CompanyInfo, "full"))
+        .where(CompanyInfo.id == company.id)
+    ).scalar_one()
     assert any(u.id == user.id for u in company.company_users)
 
     # __str__ 검증
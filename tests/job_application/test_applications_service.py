@@ -1,13 +1,19 @@
+import csv
+import io
+import json
 from datetime import date
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app  # FastAPI 앱 임포트
 from app.core.db import get_db_session  # DB 세션 의존성
-from app.models import User, Resume, JobPosting, CompanyUser, CompanyInfo  # 테스트에 필요한 모델 임포트
+from app.models import User, Resume, JobPosting, JobApplication, ResumeSnapshot, CompanyUser, CompanyInfo  # 테스트에 필요한 모델 임포트
 from app.core.utils import create_access_token  # JWT 토큰 생성 유틸
+from app.domains.job_applications.service import purge_orphan_resume_snapshots
+from app.domains.job_postings.repository import JobPostingRepository
 from app.models.job_postings import EducationEnum, PaymentMethodEnum, JobCategoryEnum, WorkDurationEnum
 
 
@@ -182,4 +188,256 @@ async def test_full_application_flow(async_client: AsyncClient, user_token_and_i
         json={"status": "서류통과"},
     )  # PATCH 상태 변경
     assert patch_resp.status_code == 200  # 수정 성공
-    assert patch_resp.json()["status"] == "서류통과"  # 상태 값 확인
\ No newline at end of file
+    assert patch_resp.json()["status"] == "서류통과"  # 상태 값 확인
+
+@pytest.mark.asyncio
+async def test_duplicate_application_returns_conflict(async_client: AsyncClient, user_token_and_id, base_data, db_session: AsyncSession):
+    """
+    같은 공고에 다시 지원하면 409를 반환하고 지원자 수는 한 번만 증가
+    """
+    access_token, _ = user_token_and_id
+    _, posting, _, _ = base_data
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    first = await async_client.post("/applications", headers=headers, json={"job_posting_id": posting.id})
+    assert first.status_code == 201
+    assert first.json()["job_posting"]["title"] == "테스트공고"  # 응답에 공고 요약 포함
+
+    second = await async_client.post("/applications", headers=headers, json={"job_posting_id": posting.id})
+    assert second.status_code == 409
+
+    await db_session.refresh(posting)
+    assert posting.application_count == 1
+
+
+@pytest.mark.asyncio
+async def test_company_applications_summary_page(async_client: AsyncClient, user_token_and_id, base_data):
+    """
+    기업 지원 목록은 이력서 스냅샷 없이 요약만 반환하고 상태로 필터링
+    """
+    access_token, user_id = user_token_and_id
+    _, posting, _, comp_user_token = base_data
+    await async_client.post(
+        "/applications",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"job_posting_id": posting.id},
+    )
+    headers = {"Authorization": f"Bearer {comp_user_token}"}
+
+    resp = await async_client.get("/applications/company", headers=headers, params={"limit": 1})
+    assert resp.status_code == 200
+    page = resp.json()
+    assert len(page["items"]) == 1 and page["next_cursor"] is not None
+    item = page["items"][0]
+    assert item["user_id"] == user_id and item["applicant_name"] == "테스트유저"
+    assert item["job_posting_title"] == "테스트공고"
+    assert "resumes_data" not in item
+
+    next_page = await async_client.get(
+        "/applications/company", headers=headers, params={"cursor": page["next_cursor"]}
+    )
+    assert next_page.json()["items"] == []
+
+    filtered = await async_client.get("/applications/company", headers=headers, params={"status": "합격"})
+    assert filtered.json()["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_company_application_stats(async_client: AsyncClient, user_token_and_id, base_data):
+    """
+    공고별 지원 현황은 상태별 지원 수와 최근 지원 시각을 함께 반환
+    """
+    access_token, _ = user_token_and_id
+    _, posting, _, comp_user_token = base_data
+    created = await async_client.post(
+        "/applications",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"job_posting_id": posting.id},
+    )
+
+    resp = await async_client.get(
+        "/applications/company/stats", headers={"Authorization": f"Bearer {comp_user_token}"}
+    )
+    assert resp.status_code == 200
+    (stats,) = resp.json()
+    assert stats["job_posting_id"] == posting.id and stats["total"] == 1
+    assert stats["status_counts"] == {"지원완료": 1, "서류통과": 0, "합격": 0, "불합격": 0}
+    assert stats["latest_applied_at"] == created.json()["created_at"]
+
+
+@pytest.mark.asyncio
+async def test_company_bulk_status_update(async_client: AsyncClient, user_token_and_id, base_data):
+    """
+    일괄 상태 변경은 자사 공고의 지원만 변경하고 나머지 ID는 missing_ids로 반환
+    """
+    access_token, _ = user_token_and_id
+    _, posting, _, comp_user_token = base_data
+    created = await async_client.post(
+        "/applications",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"job_posting_id": posting.id},
+    )
+    app_id = created.json()["id"]
+
+    resp = await async_client.patch(
+        "/applications/company/status",
+        headers={"Authorization": f"Bearer {comp_user_token}"},
+        json={"application_ids": [app_id, app_id + 1000], "status": "불합격"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [row["id"] for row in data["updated"]] == [app_id]
+    assert data["updated"][0]["status"] == "불합격"
+    assert data["missing_ids"] == [app_id + 1000]
+
+
+@pytest.mark.asyncio
+async def test_same_resume_snapshot_is_stored_once(async_client: AsyncClient, user_token_and_id, base_data, db_session: AsyncSession):
+    """
+    같은 이력서로 여러 공고에 지원하면 스냅샷은 resume_snapshots에 한 번만 저장되고 응답에는 그대로 포함
+    """
+    access_token, _ = user_token_and_id
+    _, posting, _, _ = base_data
+    copied = {
+        column.name: getattr(posting, column.name)
+        for column in JobPosting.__table__.columns
+        if column.computed is None and column.name not in ("id", "created_at", "updated_at", "application_count")
+    }
+    other_posting = JobPosting(**{**copied, "title": "두번째공고"})
+    db_session.add(other_posting)
+    await db_session.commit()
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    responses = [
+        await async_client.post("/applications", headers=headers, json={"job_posting_id": posting_id})
+        for posting_id in (posting.id, other_posting.id)
+    ]
+    assert [resp.status_code for resp in responses] == [201, 201]
+    assert responses[0].json()["resumes_data"] == responses[1].json()["resumes_data"] != {}
+
+    hashes = (await db_session.execute(select(JobApplication.snapshot_hash))).scalars().all()
+    assert len(hashes) == 2 and len(set(hashes)) == 1
+    assert (await db_session.execute(select(func.count()).select_from(ResumeSnapshot))).scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_user_me_returns_application_resume_snapshot(async_client: AsyncClient, user_token_and_id, base_data, db_session: AsyncSession):
+    """
+    /user/me의 지원내역에는 지원 시점 이력서 스냅샷이 resumes_data로 포함
+    """
+    access_token, _ = user_token_and_id
+    _, posting, _, _ = base_data
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    created = await async_client.post("/applications", headers=headers, json={"job_posting_id": posting.id})
+    db_session.expunge_all()  # 새 요청처럼 지원 생성 때 로드된 객체 없이 조회
+    me = await async_client.get("/user/me", headers=headers)
+    assert me.status_code == 200
+    [application] = me.json()["applications"]
+    assert application["id"] == created.json()["id"]
+    assert application["resumes_data"] == created.json()["resumes_data"] != {}
+    assert "snapshot" not in application
+
+
+@pytest.mark.asyncio
+async def test_company_applications_export(async_client: AsyncClient, user_token_and_id, base_data):
+    """
+    지원자 내보내기는 이력서 스냅샷을 펼친 CSV/NDJSON을 스트리밍하고 필터를 적용
+    """
+    access_token, user_id = user_token_and_id
+    _, posting, _, comp_user_token = base_data
+    created = await async_client.post(
+        "/applications",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"job_posting_id": posting.id},
+    )
+    headers = {"Authorization": f"Bearer {comp_user_token}"}
+
+    resp = await async_client.get("/applications/company/export", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert "attachment" in resp.headers["content-disposition"]
+    (row,) = list(csv.DictReader(io.StringIO(resp.content.decode("utf-8-sig"))))
+    assert row["application_id"] == str(created.json()["id"])
+    assert row["applicant_name"] == "테스트유저" and row["job_posting_title"] == "테스트공고"
+
+    resp = await async_client.get("/applications/company/export", headers=headers, params={"format": "ndjson"})
+    (line,) = resp.text.splitlines()
+    assert json.loads(line)["applicant_email"] == "testuser@example.com"
+
+    filtered = await async_client.get(
+        "/applications/company/export", headers=headers, params={"format": "ndjson", "status": "합격"}
+    )
+    assert filtered.status_code == 200 and filtered.text == ""
+
+
+@pytest.mark.asyncio
+async def test_reconcile_application_counts_after_delete_outside_api(async_client: AsyncClient, user_token_and_id, base_data, db_session: AsyncSession):
+    """
+    API를 거치지 않고 지원이 삭제되어(탈퇴 cascade, 관리자 삭제) 어긋난 지원자 수를 보정
+    """
+    access_token, _ = user_token_and_id
+    _, posting, _, _ = base_data
+    created = await async_client.post(
+        "/applications",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"job_posting_id": posting.id},
+    )
+    await db_session.execute(delete(JobApplication).where(JobApplication.id == created.json()["id"]))
+    await db_session.commit()
+    await db_session.refresh(posting)
+    assert posting.application_count == 1  # 카운터는 그대로
+
+    assert await JobPostingRepository(db_session).reconcile_application_counts() == 1
+    await db_session.refresh(posting)
+    assert posting.application_count == 0
+    assert await JobPostingRepository(db_session).reconcile_application_counts() == 0
+
+
+@pytest.mark.asyncio
+async def test_orphan_resume_snapshots_are_deleted(async_client: AsyncClient, user_token_and_id, base_data, db_session: AsyncSession):
+    """
+    지원 취소 시 참조가 없어진 스냅샷은 바로 삭제되고, API 밖에서 지원이 삭제되어 남은 스냅샷은 정리 작업이 삭제
+    """
+    access_token, _ = user_token_and_id
+    _, posting, _, _ = base_data
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    created = await async_client.post("/applications", headers=headers, json={"job_posting_id": posting.id})
+    cancel = await async_client.delete(f"/applications/{created.json()['id']}", headers=headers)
+    assert cancel.status_code == 200
+    assert (await db_session.execute(select(func.count()).select_from(ResumeSnapshot))).scalar() == 0
+
+    created = await async_client.post("/applications", headers=headers, json={"job_posting_id": posting.id})
+    await db_session.execute(delete(JobApplication).where(JobApplication.id == created.json()["id"]))
+    await db_session.commit()
+    assert (await db_session.execute(select(func.count()).select_from(ResumeSnapshot))).scalar() == 1
+
+    assert await purge_orphan_resume_snapshots(db_session) == 1
+    assert (await db_session.execute(select(func.count()).select_from(ResumeSnapshot))).scalar() == 0
+
+
+@pytest.mark.asyncio
+async def test_company_applications_export_neutralizes_csv_formulas(async_client: AsyncClient, user_token_and_id, base_data, db_session: AsyncSession):
+    """
+    CSV 내보내기는 수식으로 시작하는 지원자 입력값 앞에 ' 를 붙이고, NDJSON은 원래 값을 그대로 내보냄
+    """
+    access_token, user_id = user_token_and_id
+    _, posting, _, comp_user_token = base_data
+    formula = '=HYPERLINK("http://evil.example","클릭")'
+    user = await db_session.get(User, user_id)
+    user.name = formula
+    await db_session.commit()
+    await async_client.post(
+        "/applications",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"job_posting_id": posting.id},
+    )
+    headers = {"Authorization": f"Bearer {comp_user_token}"}
+
+    resp = await async_client.get("/applications/company/export", headers=headers)
+    (row,) = list(csv.DictReader(io.StringIO(resp.content.decode("utf-8-sig"))))
+    assert row["applicant_name"] == "'" + formula
+
+    resp = await async_client.get("/applications/company/export", headers=headers, params={"format": "ndjson"})
+    assert json.loads(resp.text)["applicant_name"] == formula
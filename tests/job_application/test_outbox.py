@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.datetime_utils import get_now_utc
+from app.domains.job_applications import outbox
+from app.models import EmailOutbox
+from app.models.email_outbox import EmailOutboxStatusEnum
+
+
+@pytest.mark.asyncio
+async def test_drain_sends_and_schedules_retry(db_session: AsyncSession, monkeypatch):
+    """발송 성공 항목은 sent, 실패 항목은 시도 횟수를 늘리고 백오프 후 재시도 대기"""
+    for to_email in ["ok@example.com", "fail@example.com"]:
+        await db_session.execute(outbox.build_enqueue_email(to_email, "제목", "<p>본문</p>"))
+    await db_session.commit()
+
+    async def fake_send_email(to_email, **kwargs):
+        if to_email == "fail@example.com":
+            raise RuntimeError("smtp down")
+
+    monkeypatch.setattr(outbox, "send_email", fake_send_email)
+    counts = await outbox.drain_email_outbox(db_session)
+
+    assert counts == {"sent": 1, "retry": 1, "failed": 0}
+    rows = {
+        row.to_email: row
+        for row in (await db_session.execute(
+            select(EmailOutbox).execution_options(populate_existing=True)
+        )).scalars()
+    }
+    assert rows["ok@example.com"].status == EmailOutboxStatusEnum.sent
+    failed = rows["fail@example.com"]
+    assert failed.status == EmailOutboxStatusEnum.pending
+    assert failed.attempts == 1 and failed.last_error == "smtp down"
+    assert failed.next_attempt_at > failed.created_at
+
+    # 재시도 시각 전에는 다시 가져가지 않음
+    assert await outbox.drain_email_outbox(db_session) == {"sent": 0, "retry": 0, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_purge_removes_sent_and_expired_failed_rows(db_session: AsyncSession):
+    """발송 완료 항목과 보관 기간이 지난 실패 항목만 삭제 (대기/최근 실패 항목은 유지)"""
+    old = get_now_utc() - timedelta(days=outbox.EMAIL_OUTBOX_FAILED_RETENTION_DAYS + 1)
+    statuses = {
+        "sent@example.com": (EmailOutboxStatusEnum.sent, None),
+        "pending@example.com": (EmailOutboxStatusEnum.pending, None),
+        "failed-recent@example.com": (EmailOutboxStatusEnum.failed, None),
+        "failed-old@example.com": (EmailOutboxStatusEnum.failed, old),
+    }
+    for to_email, (status, created_at) in statuses.items():
+        await db_session.execute(outbox.build_enqueue_email(to_email, "제목", "<p>이력서</p>"))
+        values = {"status": status}
+        if created_at is not None:
+            values["created_at"] = created_at
+        await db_session.execute(update(EmailOutbox).where(EmailOutbox.to_email == to_email).values(**values))
+    await db_session.commit()
+
+    assert await outbox.purge_finished_email_outbox(db_session) == 2
+    remaining = (await db_session.execute(select(EmailOutbox.to_email).order_by(EmailOutbox.to_email))).scalars().all()
+    assert remaining == ["failed-recent@example.com", "pending@example.com"]
@@ -0,0 +1,76 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.domains.job_postings.recommender import RecommendationEngine
+from app.models.job_postings import JobCategoryEnum, PaymentMethodEnum
+
+
+def make_row(id: int, **overrides):
+    """추천 엔진 특성 조회 결과 한 행을 흉내 낸 객체 생성"""
+    data = {
+        "id": id,
+        "job_category": JobCategoryEnum.food,
+        "region1": "서울",
+        "region2": "강남구",
+        "work_address": "서울 강남구 테헤란로 1",
+        "salary": 10000,
+        "payment_method": PaymentMethodEnum.hourly,
+        "created_at": datetime.now(timezone.utc),
+        "recruit_period_end": None,
+        "is_always_recruiting": True,
+        "application_count": 0,
+    }
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+def test_top_ids_filters_by_interest_category():
+    engine = RecommendationEngine()
+    engine._upsert(make_row(1))
+    engine._upsert(make_row(2, job_category=JobCategoryEnum.sales))
+    assert engine.top_ids([JobCategoryEnum.food.value], [], None, k=10) == [1]
+
+
+def test_top_ids_prefers_region_match_and_recency():
+    engine = RecommendationEngine()
+    old = datetime.now(timezone.utc) - timedelta(days=60)
+    engine._upsert(make_row(1, created_at=old))
+    engine._upsert(make_row(2, created_at=old, region1="부산", region2="해운대구", work_address="부산 해운대구"))
+    engine._upsert(make_row(3, region1="부산", region2="수영구", work_address="부산 수영구"))
+    assert engine.top_ids([JobCategoryEnum.food], ["부산"], None, k=3) == [3, 2, 1]
+
+
+def test_top_ids_excludes_closed_postings():
+    engine = RecommendationEngine()
+    yesterday = date.today() - timedelta(days=1)
+    engine._upsert(make_row(1, is_always_recruiting=False, recruit_period_end=yesterday))
+    engine._upsert(make_row(2))
+    assert engine.top_ids([JobCategoryEnum.food], [], None, k=10) == [2]
+
+
+def test_age_group_popularity_and_removal():
+    engine = RecommendationEngine()
+    engine._upsert(make_row(1))
+    engine._upsert(make_row(2))
+    engine.age_counts = {60: {1: 30}}
+    assert engine.top_ids([JobCategoryEnum.food], [], 60, k=2, now=time.time())[0] == 1
+    engine.mark_removed(1)
+    assert engine.top_ids([JobCategoryEnum.food], [], 60, k=2) == [2]
+    assert len(engine) == 1
+
+
+def test_salary_score_does_not_depend_on_load_order():
+    created_at = datetime.now(timezone.utc)
+    salaries = {1: 1_000_000, 2: 3_000_000, 3: 2_000_000}
+    for order in ([1, 2, 3], [2, 3, 1], [3, 1, 2]):
+        engine = RecommendationEngine()
+        for posting_id in order:
+            engine._upsert(make_row(
+                posting_id, salary=salaries[posting_id], payment_method=PaymentMethodEnum.monthly, created_at=created_at
+            ))
+        assert engine.top_ids([JobCategoryEnum.food], [], None, k=3, now=time.time()) == [2, 3, 1]
+
+    # 최대 급여 공고가 빠지면 같은 지급 방식의 최대 급여도 다시 계산
+    engine.mark_removed(2)
+    assert engine._salary_maxima()[engine.payment_methods[engine._index_by_id[3]]] == 2_000_000
@@ -0,0 +1,81 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domains.job_postings.repository import JobPostingRepository
+from app.models import CompanyInfo, CompanyUser, JobApplication, JobPosting, Resume, User
+from app.models.job_posting_age_stats import JobPostingAgeStat
+from app.models.job_postings import EducationEnum, JobCategoryEnum, PaymentMethodEnum, WorkDurationEnum
+
+
+@pytest.fixture()
+async def posting(db_session: AsyncSession) -> JobPosting:
+    """집계 대상 채용공고 생성"""
+    company = CompanyInfo(
+        company_name="집계테스트",
+        ceo_name="홍길동",
+        business_reg_number="1234567890",
+        opening_date="2020-01-01",
+        company_intro="집계 테스트 기업",
+        manager_name="김담당",
+        manager_phone="01012345678",
+        manager_email="manager@example.com",
+    )
+    db_session.add(company)
+    await db_session.flush()
+    comp_user = CompanyUser(email="stats@example.com", password="qwe123!@#", company_id=company.id)
+    db_session.add(comp_user)
+    await db_session.flush()
+    posting = JobPosting(
+        title="집계공고",
+        company_id=company.id,
+        author_id=comp_user.id,
+        recruit_period_start=date(2025, 5, 1),
+        recruit_period_end=date(2025, 6, 1),
+        is_always_recruiting=False,
+        education=EducationEnum.college_4,
+        recruit_number=1,
+        payment_method=PaymentMethodEnum.monthly,
+        job_category=JobCategoryEnum.it,
+        work_duration=WorkDurationEnum.more_6_months,
+        is_work_duration_negotiable=False,
+        career="무관",
+        employment_type="정규직",
+        salary=3000,
+        work_days="월~금",
+        is_work_days_negotiable=False,
+        is_schedule_based=False,
+        work_address="서울시 강남구",
+        work_place_name="본사",
+        is_work_time_negotiable=False,
+        postings_image="https://example.com/default.png",
+    )
+    db_session.add(posting)
+    await db_session.commit()
+    return posting
+
+
+@pytest.mark.asyncio
+async def test_refresh_age_group_stats_skips_impossible_birthdays(db_session: AsyncSession, posting: JobPosting):
+    """
+    존재하지 않는 날짜나 형식이 잘못된 생년월일은 집계에서 제외하고 나머지는 정상 집계
+    """
+    birthdays = ["1960-05-05", "1962-01-31T00:00:00", "2000-02-30", "1990-13-01", "0000-01-01", "생일"]
+    for index, birthday in enumerate(birthdays):
+        user = User(name=f"지원자{index}", email=f"applicant{index}@example.com", password="pwd", birthday=birthday)
+        db_session.add(user)
+        await db_session.flush()
+        resume = Resume(user_id=user.id)
+        db_session.add(resume)
+        await db_session.flush()
+        db_session.add(JobApplication(
+            user_id=user.id, resume_id=resume.id, job_posting_id=posting.id, resumes_data={}
+        ))
+    await db_session.commit()
+
+    assert await JobPostingRepository(db_session).refresh_age_group_stats() == 1
+    stats = (await db_session.execute(select(JobPostingAgeStat))).scalars().all()
+    assert [(stat.job_posting_id, stat.application_count) for stat in stats] == [(posting.id, 2)]
+    assert stats[0].age_group >= 60
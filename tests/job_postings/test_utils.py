@@ -0,0 +1,60 @@
+import math
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.domains.job_postings.schemas import SortOptions
+from app.domains.job_postings.utils import build_next_cursor, decode_cursor, encode_cursor, geo_cell_ranges
+from app.models.job_postings import GEO_CELLS_PER_DEGREE, GEO_CELL_LAT_FACTOR
+
+
+def make_posting(id: int, salary: int = 3000000, created_at: datetime | None = None):
+    return SimpleNamespace(id=id, salary=salary, created_at=created_at or datetime(2025, 5, 1, 12, 30))
+
+
+def test_cursor_round_trip_latest():
+    posting = make_posting(7)
+    cursor = encode_cursor(posting)
+    assert decode_cursor(cursor) == (posting.created_at, 7)
+
+
+def test_cursor_round_trip_salary():
+    posting = make_posting(3, salary=2500000)
+    cursor = encode_cursor(posting, SortOptions.SALARY_HIGH)
+    assert decode_cursor(cursor, SortOptions.SALARY_HIGH) == (2500000, 3)
+
+
+def test_cursor_sort_mismatch_rejected():
+    cursor = encode_cursor(make_posting(1), SortOptions.LATEST)
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, SortOptions.SALARY_LOW)
+
+
+def test_cursor_garbage_rejected():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_build_next_cursor_only_for_full_page():
+    postings = [make_posting(i) for i in (3, 2, 1)]
+    assert build_next_cursor(postings, limit=5) is None
+    assert build_next_cursor([], limit=5) is None
+    assert decode_cursor(build_next_cursor(postings, limit=3))[1] == 1
+
+
+def geo_cell(latitude: float, longitude: float) -> int:
+    """DB 생성 컬럼(geo_cell)과 같은 방식으로 격자 키 계산"""
+    return (
+        math.floor(latitude * GEO_CELLS_PER_DEGREE) * GEO_CELL_LAT_FACTOR
+        + math.floor(longitude * GEO_CELLS_PER_DEGREE)
+    )
+
+
+def test_geo_cell_ranges_cover_radius():
+    ranges = geo_cell_ranges(37.5665, 126.9780, 3.0)
+    # 반경 경계 근처(약 3km 떨어진 동서남북) 좌표의 격자가 모두 구간 안에 포함되어야 함
+    for lat, lng in [(37.5665, 126.9780), (37.5935, 126.9780), (37.5395, 126.9780), (37.5665, 127.0120), (37.5665, 126.9440)]:
+        cell = geo_cell(lat, lng)
+        assert any(start <= cell <= end for start, end in ranges)
+    # 위도 띠별로 한 구간씩 생성
+    assert len(ranges) == len({start // GEO_CELL_LAT_FACTOR for start, _ in ranges})
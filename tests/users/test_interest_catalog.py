@@ -0,0 +1,86 @@
+import pytest
+
+from app.domains.users.interest_catalog import InterestCatalog
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class FakeSession:
+    """
+    관심분야 (id, code, name) 행을 돌려주고 조회 횟수를 세는 세션
+    (IN 조건이 있으면 값이 하나라도 일치하는 행만, 없으면 전체 행 반환)
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = 0
+        self.full_loads = 0
+
+    async def execute(self, statement):
+        self.executed += 1
+        wanted = {value for values in statement.compile().params.values() for value in values}
+        if not wanted:
+            self.full_loads += 1
+            return FakeResult(list(self.rows))
+        return FakeResult([row for row in self.rows if wanted & set(row)])
+
+
+@pytest.mark.asyncio
+async def test_lookups_use_loaded_catalog_without_query():
+    session = FakeSession([(1, "office", "사무"), (2, "delivery", "운전·배달")])
+    catalog = InterestCatalog()
+
+    assert await catalog.ids_for_names(session, ["사무", "운전·배달"]) == {"사무": 1, "운전·배달": 2}
+    assert await catalog.names_for_ids(session, [2, 1]) == ["운전·배달", "사무"]
+    assert session.executed == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_name_or_id_fetches_only_missing_rows():
+    session = FakeSession([(1, "office", "사무")])
+    catalog = InterestCatalog()
+    await catalog.ensure_fresh(session)
+
+    # 모르는 이름은 해당 이름만 조회하고, 그래도 없으면 제외
+    assert await catalog.ids_for_names(session, ["사무", "정원"]) == {"사무": 1}
+    assert session.executed == 2 and session.full_loads == 1
+
+    # 다른 워커가 추가한 항목은 이름/code/ID 조회로 합쳐지고 전체 재적재는 일어나지 않음
+    session.rows += [(3, "정원", "정원"), (4, "cooking", "요리")]
+    assert await catalog.ids_for_names(session, ["정원"]) == {"정원": 3}
+    assert await catalog.ids_for_names(session, ["Cooking"]) == {}
+    assert catalog.ids_by_code["cooking"] == 4
+    assert await catalog.names_for_ids(session, [1, 4]) == ["사무", "요리"]
+    assert session.executed == 4 and session.full_loads == 1
+    assert catalog.version == 1
+
+
+@pytest.mark.asyncio
+async def test_remember_keeps_earliest_id_for_duplicate_name():
+    session = FakeSession([(1, "office", "사무")])
+    catalog = InterestCatalog()
+    await catalog.ensure_fresh(session)
+
+    catalog.remember([(5, "사무", "사무")])
+    assert await catalog.ids_for_names(session, ["사무"]) == {"사무": 1}
+    assert catalog.ids_by_code["사무"] == 5
+    assert await catalog.names_for_ids(session, [5]) == ["사무"]
+    assert session.executed == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_triggers_full_reload():
+    session = FakeSession([(1, "office", "사무")])
+    catalog = InterestCatalog()
+    await catalog.ensure_fresh(session)
+
+    session.rows.append((3, "정원", "정원"))
+    catalog.invalidate()
+    assert await catalog.names_for_ids(session, [3]) == ["정원"]
+    assert session.executed == 2 and session.full_loads == 2 and catalog.version == 2
@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert
 from datetime import datetime, timedelta, timezone
 
-from app.models import User
+from app.models import Interest, User, UserInterest
 from app.models.users import EmailVerification
 
 
@@ -184,6 +184,29 @@ class TestUserEndpoints:
         assert response.json()["email"]  # 이메일 정보 존재 여부 확인
 
 
+    @pytest.mark.asyncio
+    async def test_get_me_includes_interest_names(
+        self, async_client: AsyncClient, db_session: AsyncSession, user_token_and_id
+    ):
+        token, user_id, _ = user_token_and_id
+        interest = Interest(code="me_office", name="사무보조", is_custom=False)
+        db_session.add(interest)
+        await db_session.flush()
+        db_session.add(UserInterest(user_id=user_id, interest_id=interest.id))
+        await db_session.commit()
+
+        response = await async_client.get(
+            "/user/me", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 200
+        # 관심분야 연결마다 관심분야 정보(id, code, name)가 함께 내려가야 함
+        [user_interest] = response.json()["user_interests"]
+        assert user_interest["interest_id"] == interest.id
+        assert {
+            key: user_interest["interest"][key] for key in ("id", "code", "name")
+        } == {"id": interest.id, "code": "me_office", "name": "사무보조"}
+
+
     @pytest.mark.asyncio
     async def test_update_profile(self, async_client: AsyncClient, user_token_and_id):
         token, user_id, _ = user_token_and_id  # 토큰 및 사용자 ID 추출
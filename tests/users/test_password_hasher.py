@@ -0,0 +1,64 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.password_hasher import PasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_round_trip():
+    hasher = PasswordHasher(max_workers=2, max_queue=8)
+    hashed = await hasher.hash("password1234")
+
+    assert await hasher.verify("password1234", hashed) is True
+    assert await hasher.verify("wrong-password", hashed) is False
+    stats = hasher.stats()
+    assert stats["completed"] == 3 and stats["queued"] == 0 and stats["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_is_full():
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    # 워커 하나를 점유시켜 다음 작업이 대기열에 머물도록 함
+    running = asyncio.ensure_future(hasher._submit(release.wait))
+    while hasher.running == 0:
+        await asyncio.sleep(0.01)
+    queued = asyncio.ensure_future(hasher._submit(lambda: "queued"))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await hasher.hash("password1234")
+    assert exc_info.value.status_code == 503
+
+    release.set()
+    assert await queued == "queued"
+    await running
+    stats = hasher.stats()
+    assert stats["rejected"] == 1 and stats["max_queue_depth"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiting_job_leaves_queue():
+    hasher = PasswordHasher(max_workers=1, max_queue=2)
+    release = threading.Event()
+
+    running = asyncio.ensure_future(hasher._submit(release.wait))
+    try:
+        while hasher.running == 0:
+            await asyncio.sleep(0.01)
+        # 대기 중인 작업을 기다리던 요청이 취소되면 대기열 카운터에서도 빠져야 함
+        waiting = [asyncio.ensure_future(hasher._submit(lambda: "never")) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for task in waiting:
+            task.cancel()
+        await asyncio.gather(*waiting, return_exceptions=True)
+        assert hasher.stats()["queued"] == 0
+    finally:
+        release.set()
+    await running
+    assert await hasher.verify("password1234", await hasher.hash("password1234")) is True
+    assert hasher.stats()["queued"] == 0 and hasher.stats()["running"] == 0
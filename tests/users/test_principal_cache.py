@@ -0,0 +1,57 @@
+import time
+
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.principal_cache import PrincipalCache
+from app.models import User, UserInterest
+
+
+def make_user(id: int = 1, email: str = "user@example.com") -> User:
+    """DB에서 읽은 것처럼 관심분야가 로드된 사용자 객체 생성"""
+    user = User(id=id, name="홍길동", email=email, password="hashed")
+    set_committed_value(user, "user_interests", [UserInterest(id=100, user_id=id, interest_id=10)])
+    return user
+
+
+def test_get_returns_restored_user_attached_to_session():
+    cache = PrincipalCache()
+    cache.put("user", "1", make_user())
+    session = Session()
+
+    user = cache.get("user", "1", session)
+
+    assert user.id == 1 and user.email == "user@example.com"
+    assert [ui.interest_id for ui in user.user_interests] == [10]
+    assert user in session
+    assert cache.stats()["hits"] == 1
+
+
+def test_get_misses_when_same_identity_already_in_session():
+    cache = PrincipalCache()
+    cache.put("user", "1", make_user())
+    session = Session()
+    first = cache.get("user", "1", session)
+    assert first is not None
+
+    # 같은 세션에서 다시 꺼내면 식별자가 겹치므로 DB 조회로 넘김
+    assert cache.get("user", "1", session) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_invalidate_user_removes_id_and_email_keys():
+    cache = PrincipalCache()
+    cache.put("user", "1", make_user())
+    cache.put("user", "user@example.com", make_user())
+
+    cache.invalidate_user(1, "user@example.com")
+
+    assert cache.get("user", "1", Session()) is None
+    assert cache.get("user", "user@example.com", Session()) is None
+    assert cache.stats() == {"hits": 0, "misses": 2, "hit_rate": 0.0, "size": 0}
+
+
+def test_put_skips_expired_token():
+    cache = PrincipalCache()
+    cache.put("user", "1", make_user(), token_exp=time.time() - 1)
+    assert len(cache._cache) == 0
@@ -0,0 +1,32 @@
+import time
+
+from app.core.token_revocation import SUBJECT_COMPANY, SUBJECT_USER, TokenRevocationList
+
+
+def test_revoked_jti_only_blocks_that_token():
+    revocations = TokenRevocationList()
+    revocations._remember("jti:abc", time.time(), time.time() + 60)
+
+    assert revocations.is_revoked(SUBJECT_USER, {"sub": "1", "jti": "abc", "iat": time.time()})
+    assert not revocations.is_revoked(SUBJECT_USER, {"sub": "1", "jti": "def", "iat": time.time()})
+
+
+def test_subject_revocation_blocks_tokens_issued_before():
+    revocations = TokenRevocationList()
+    revoked_at = time.time()
+    revocations._remember(f"{SUBJECT_COMPANY}:c@x.com", revoked_at, revoked_at + 60)
+
+    assert revocations.is_revoked(SUBJECT_COMPANY, {"sub": "c@x.com", "iat": revoked_at - 10})
+    assert revocations.is_revoked(SUBJECT_COMPANY, {"sub": "c@x.com"})  # iat가 없는 이전 토큰
+    assert not revocations.is_revoked(SUBJECT_COMPANY, {"sub": "c@x.com", "iat": revoked_at + 1})
+    assert not revocations.is_revoked(SUBJECT_USER, {"sub": "c@x.com", "iat": revoked_at - 10})
+
+
+def test_prune_drops_expired_entries():
+    revocations = TokenRevocationList()
+    revocations._remember("jti:old", time.time() - 120, time.time() - 60)
+    revocations._remember(f"{SUBJECT_USER}:1", time.time() - 120, time.time() - 60)
+
+    revocations._prune()
+
+    assert revocations.stats()["tokens"] == 0 and revocations.stats()["subjects"] == 0